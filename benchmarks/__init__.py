@@ -0,0 +1 @@
+"""Performance benchmarks (run with ``uv run python -m benchmarks.<name>``)"""
@@ -0,0 +1,81 @@
+"""Micro-benchmark the audio callback's per-block cost and allocations.
+
+Drives ``AudioPlayer._audio_callback`` directly (no audio device) for short
+and long audio at several speeds. Per-callback time and traced allocations
+should not depend on how much audio is loaded.
+
+Usage:
+    uv run python -m benchmarks.bench_audio_callback --blocks 1000
+"""
+
+import argparse
+import statistics
+import time
+import tracemalloc
+from unittest import mock
+
+import numpy as np
+
+from src.audio_player import AudioPlayer
+
+DURATIONS = (60, 600, 3600)  # Seconds of loaded audio
+SPEEDS = (1.0, 1.5)
+
+
+def run(seconds: int, speed: float, blocks: int, blocksize: int, sample_rate: int):
+    """Return (median us, p99 us, peak bytes per callback) for one configuration."""
+    audio = (np.sin(np.arange(seconds * sample_rate) * 0.05) * 8000).astype(np.int16)
+    outdata = np.zeros((blocksize, 1), dtype=np.int16)
+
+    # The stream is never started; the benchmark calls the callback itself
+    with mock.patch("sounddevice.OutputStream"):
+        player = AudioPlayer(sample_rate=sample_rate, persistent_stream=True)
+        player.set_speed(speed)
+        player.play(audio)
+
+        # Warm up so the stretcher is primed
+        for _ in range(50):
+            player._audio_callback(outdata, blocksize, None, None)
+
+        timings = []
+        for _ in range(blocks):
+            started = time.perf_counter()
+            player._audio_callback(outdata, blocksize, None, None)
+            timings.append((time.perf_counter() - started) * 1e6)
+
+        tracemalloc.start()
+        peaks = []
+        for _ in range(200):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            player._audio_callback(outdata, blocksize, None, None)
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - before)
+        tracemalloc.stop()
+        player.close()
+
+    timings.sort()
+    return statistics.median(timings), timings[int(len(timings) * 0.99)], max(peaks)
+
+
+def main():
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--blocks", type=int, default=1000)
+    parser.add_argument("--blocksize", type=int, default=512)
+    parser.add_argument("--sample-rate", type=int, default=22050)
+    args = parser.parse_args()
+
+    budget_us = args.blocksize / args.sample_rate * 1e6
+    print(f"block budget: {budget_us:.0f} us")
+    print(f"{'audio s':>8} {'speed':>6} {'median us':>10} {'p99 us':>8} {'peak bytes':>11}")
+    for speed in SPEEDS:
+        for seconds in DURATIONS:
+            median, p99, peak = run(
+                seconds, speed, args.blocks, args.blocksize, args.sample_rate
+            )
+            print(f"{seconds:>8} {speed:>6.2f} {median:>10.1f} {p99:>8.1f} {peak:>11}")
+
+
+if __name__ == "__main__":
+    main()
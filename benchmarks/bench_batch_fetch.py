@@ -0,0 +1,92 @@
+"""Compare fetching a reading list one URL at a time with BatchFetcher.
+
+Serves ``--articles`` pages from a local HTTP server that answers each
+request after ``--latency`` seconds, spread over ``--hosts`` host names,
+and times sequential ``TextExtractor.extract`` calls against
+``BatchFetcher.fetch``.
+
+Usage:
+    uv run python -m benchmarks.bench_batch_fetch
+    uv run python -m benchmarks.bench_batch_fetch --articles 30 --latency 0.5 --per-host 4
+"""
+
+import argparse
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.batch_fetcher import BatchFetcher
+from src.text_extractor import TextExtractor
+
+ARTICLE = (
+    "<html><body><article><h1>Article {number}</h1>"
+    + "<p>A paragraph of the article, long enough to be read aloud, with commas, "
+    "clauses and detail.</p>" * 20
+    + "</article></body></html>"
+)
+
+
+def serve(address: str, latency: float) -> ThreadingHTTPServer:
+    """Start a server on a loopback address that sends an article after ``latency`` seconds."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency)
+            body = ARTICLE.format(number=self.path.strip("/")).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((address, 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--articles", type=int, default=30)
+    parser.add_argument("--latency", type=float, default=0.3, help="Server delay per request")
+    parser.add_argument("--hosts", type=int, default=5, help="Distinct host names")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--per-host", type=int, default=2)
+    args = parser.parse_args()
+
+    # Every 127.0.0.x address is loopback, and each counts as its own host
+    servers = [serve(f"127.0.0.{i + 1}", args.latency) for i in range(args.hosts)]
+    hosts = [f"{host}:{port}" for host, port in (server.server_address for server in servers)]
+    urls = [f"http://{hosts[i % args.hosts]}/{i}" for i in range(args.articles)]
+
+    extractor = TextExtractor(pool_size=args.workers)
+    started = time.perf_counter()
+    for url in urls:
+        extractor.extract(url)
+    sequential = time.perf_counter() - started
+
+    fetcher = BatchFetcher(extractor, workers=args.workers, per_host=args.per_host)
+    started = time.perf_counter()
+    first = None
+    failed = 0
+    for result in fetcher.fetch(urls):
+        first = first if first is not None else time.perf_counter() - started
+        failed += not result.ok
+    batch = time.perf_counter() - started
+    fetcher.close()
+    for server in servers:
+        server.shutdown()
+
+    print(f"{args.articles} articles, {args.latency * 1000:.0f} ms server latency")
+    print(f"  sequential: {sequential:6.2f} s")
+    print(
+        f"  batch:      {batch:6.2f} s ({sequential / batch:.1f}x), first article after "
+        f"{first * 1000:.0f} ms, {failed} failed"
+    )
+
+
+if __name__ == "__main__":
+    main()
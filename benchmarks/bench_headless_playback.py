@@ -0,0 +1,97 @@
+"""Soak-test streaming playback without an audio device.
+
+Streams synthetic sentence-sized chunks through ``AudioPlayer`` on the null
+(or WAV file) output backend and reports throughput, start latency,
+underruns and the callback time histogram. A producer slower than playback
+(``--producer-rate`` below ``--pace``) with short ``--chunk-seconds`` shows
+how underruns are counted.
+
+Usage:
+    uv run python -m benchmarks.bench_headless_playback --seconds 600
+    uv run python -m benchmarks.bench_headless_playback --pace 1 --producer-rate 0.8
+    uv run python -m benchmarks.bench_headless_playback --wav /tmp/out.wav
+    uv run python -m benchmarks.bench_headless_playback --sample-rate 16000 --output-rate 48000
+"""
+
+import argparse
+import threading
+import time
+
+import numpy as np
+
+from src.audio_output import NullBackend, WavFileBackend
+from src.audio_player import CALLBACK_TIME_BINS_US, AudioPlayer
+
+
+def chunks(seconds: float, sample_rate: int, chunk_seconds: float, producer_rate: float):
+    """Yield a sine tone in chunks, optionally throttled to a multiple of real time."""
+    size = int(sample_rate * chunk_seconds)
+    total = int(seconds * sample_rate)
+    started = time.perf_counter()
+    for offset in range(0, total, size):
+        count = min(size, total - offset)
+        if producer_rate:
+            delay = started + (offset + count) / (sample_rate * producer_rate)
+            time.sleep(max(0.0, delay - time.perf_counter()))
+        yield (np.sin(np.arange(offset, offset + count) * 0.05) * 8000).astype(np.int16)
+
+
+def main():
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=600.0, help="Audio to play")
+    parser.add_argument("--pace", type=float, default=0.0, help="x real time (0 = unthrottled)")
+    parser.add_argument("--producer-rate", type=float, default=0.0, help="x real time (0 = max)")
+    parser.add_argument("--speed", type=float, default=1.0)
+    parser.add_argument("--blocksize", type=int, default=512)
+    parser.add_argument("--sample-rate", type=int, default=22050)
+    parser.add_argument("--output-rate", type=int, help="Resample to this rate (default: none)")
+    parser.add_argument("--chunk-seconds", type=float, default=1.0, help="Sentence length")
+    parser.add_argument("--wav", help="Write the output to this WAV file instead of discarding it")
+    args = parser.parse_args()
+
+    if args.wav:
+        backend = WavFileBackend(args.wav, pace=args.pace)
+    else:
+        backend = NullBackend(pace=args.pace)
+    player = AudioPlayer(
+        sample_rate=args.sample_rate,
+        blocksize=args.blocksize,
+        backend=backend,
+        output_rate=args.output_rate,
+    )
+    player.set_speed(args.speed)
+    done = threading.Event()
+    player.set_completion_callback(done.set)
+
+    started = time.perf_counter()
+    player.play_stream(
+        chunks(args.seconds, args.sample_rate, args.chunk_seconds, args.producer_rate)
+    )
+    done.wait()
+    elapsed = time.perf_counter() - started
+    stats = player.stats()
+    start_latency = player.start_latency
+    player.close()
+
+    played = args.seconds / args.speed
+    print(f"played {played:.1f}s of audio in {elapsed:.2f}s ({played / elapsed:.1f}x real time)")
+    if start_latency is not None:
+        print(f"start latency: {start_latency * 1000:.2f} ms")
+    print(
+        f"callbacks: {stats.callbacks}  underruns: {stats.underruns}  "
+        f"device underflows: {stats.output_underflows}  min buffered: {stats.min_buffered}"
+    )
+    budget_us = args.blocksize / player.output_rate * 1e6
+    print(
+        f"callback time: avg {stats.avg_callback_time * 1e6:.1f} us, "
+        f"max {stats.max_callback_time * 1e6:.1f} us (budget {budget_us:.0f} us)"
+    )
+    edges = [f"<{edge}" for edge in CALLBACK_TIME_BINS_US] + [f">={CALLBACK_TIME_BINS_US[-1]}"]
+    for edge, count in zip(edges, stats.callback_time_histogram, strict=True):
+        if count:
+            print(f"  {edge:>7} us: {count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Measure play/resume-to-sound latency with per-play and persistent streams.
+
+Opens the default output device, so run it on a machine with audio output,
+or pass ``--headless`` to use the null backend. Resume latency should not
+depend on ``--seconds`` (document length) or ``--speed``.
+
+Usage:
+    uv run python -m benchmarks.bench_playback_latency --runs 20
+    uv run python -m benchmarks.bench_playback_latency --seconds 3600 --speed 1.5
+"""
+
+import argparse
+import statistics
+import time
+
+import numpy as np
+
+from src.audio_output import NullBackend
+from src.audio_player import AudioPlayer
+
+
+def wait_for_latency(player: AudioPlayer, timeout: float = 2.0) -> float:
+    """Block until the player has measured its start latency."""
+    deadline = time.perf_counter() + timeout
+    while player.start_latency is None:
+        if time.perf_counter() > deadline:
+            raise TimeoutError("No audio reached the device")
+        time.sleep(0.001)
+    return player.start_latency
+
+
+def measure(persistent: bool, args: argparse.Namespace) -> tuple[list[float], list[float]]:
+    """Return (play latencies, resume latencies) in milliseconds."""
+    audio = np.zeros(int(args.sample_rate * args.seconds), dtype=np.int16)
+    player = AudioPlayer(
+        sample_rate=args.sample_rate,
+        persistent_stream=persistent,
+        backend=NullBackend() if args.headless else None,
+    )
+    player.set_speed(args.speed)
+    plays, resumes = [], []
+    try:
+        for _ in range(args.runs):
+            player.play(audio)
+            plays.append(wait_for_latency(player) * 1000)
+            time.sleep(0.05)
+
+            player.pause()
+            player.resume()
+            resumes.append(wait_for_latency(player) * 1000)
+            player.stop()
+    finally:
+        player.close()
+    return plays, resumes
+
+
+def main():
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--sample-rate", type=int, default=22050)
+    parser.add_argument("--seconds", type=float, default=1.0, help="Length of the audio played")
+    parser.add_argument("--speed", type=float, default=1.0)
+    parser.add_argument("--headless", action="store_true", help="Use the null output backend")
+    args = parser.parse_args()
+
+    print(f"{'mode':>11} {'action':>7} {'median ms':>10} {'max ms':>8}")
+    for persistent in (False, True):
+        mode = "persistent" if persistent else "per-play"
+        plays, resumes = measure(persistent, args)
+        for action, values in (("play", plays), ("resume", resumes)):
+            print(f"{mode:>11} {action:>7} {statistics.median(values):>10.1f} {max(values):>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
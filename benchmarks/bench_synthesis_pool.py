@@ -0,0 +1,58 @@
+"""Benchmark real-time factor of parallel synthesis across worker counts.
+
+Usage:
+    uv run python -m benchmarks.bench_synthesis_pool voices/en_US-lessac-medium.onnx
+"""
+
+import argparse
+import os
+import time
+
+from src.segmenter import split_sentences
+from src.synthesis_pool import SynthesisPool
+
+SAMPLE_TEXT = (
+    "The quick brown fox jumps over the lazy dog. "
+    "Piper is a fast, local neural text to speech system. "
+    "Long documents are split into sentences before synthesis. "
+    "Each worker process holds its own copy of the voice model. "
+) * 10
+
+
+def run(model_path: str, workers: int, sample_rate: int) -> tuple[float, float]:
+    """Synthesize the sample text and return (seconds, real-time factor)."""
+    sentences = [s.text for s in split_sentences(SAMPLE_TEXT)]
+    pool = SynthesisPool(model_path, workers)
+    try:
+        # Warm up every worker so model loading is not counted
+        list(pool.synthesize(sentences[:workers]))
+
+        started = time.perf_counter()
+        samples = sum(len(audio) for audio in pool.synthesize(sentences))
+        elapsed = time.perf_counter() - started
+    finally:
+        pool.close()
+
+    return elapsed, elapsed / (samples / sample_rate)
+
+
+def main():
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("model", help="Path to a Piper .onnx voice")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--sample-rate", type=int, default=22050)
+    args = parser.parse_args()
+
+    baseline = None
+    workers = 1
+    print(f"{'workers':>8} {'seconds':>9} {'RTF':>7} {'speedup':>8}")
+    while workers <= args.max_workers:
+        elapsed, rtf = run(args.model, workers, args.sample_rate)
+        baseline = baseline or elapsed
+        print(f"{workers:>8} {elapsed:>9.2f} {rtf:>7.3f} {baseline / elapsed:>7.2f}x")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Compare HTML parser backends for text extraction on saved pages.
+
+Times ``TextExtractor.extract_html`` with every installed parser backend on
+each page and checks that the extracted text matches ``html.parser``, the
+reference, and how much of each page's text main-content scoring kept
+(``--full-text`` turns scoring off). Pass saved ``.html`` files or
+directories of them; without a corpus a synthetic news page of
+``--synthetic-mb`` megabytes is used.
+
+Usage:
+    uv run python -m benchmarks.bench_text_extraction ~/saved-pages/
+    uv run python -m benchmarks.bench_text_extraction --synthetic-mb 5
+"""
+
+import argparse
+import statistics
+import time
+from pathlib import Path
+
+from src.text_extractor import ExtractedText, TextExtractor, available_parsers
+
+
+def synthetic_page(megabytes: float) -> str:
+    """Build a news-like page with navigation, scripts and boilerplate around the article."""
+    nav = "".join(f'<li><a href="/section/{i}">Section {i}</a></li>' for i in range(200))
+    head = (
+        "<!DOCTYPE html><html><head><title>Synthetic article</title>"
+        "<style>body { font-family: serif; } .ad { display: none; }</style>"
+        "<script>window.dataLayer = window.dataLayer || [];</script></head><body>"
+        f"<header><div class=\"logo\">The Daily Synthetic</div><nav><ul>{nav}</ul></nav></header>"
+        "<main><article><h1>A very long article</h1>"
+    )
+    paragraph = (
+        "<p>Lorem ipsum dolor sit amet, <a href=\"/x\">consectetur</a> adipiscing elit, sed do "
+        "eiusmod tempor incididunt ut <em>labore et dolore</em> magna aliqua. Ut enim ad minim "
+        "veniam, quis nostrud exercitation ullamco laboris nisi ut aliquip ex ea commodo.</p>\n"
+        "<div class=\"ad\"><script>render_ad({slot: 3});</script></div>\n"
+    )
+    tail = (
+        "</article><aside><h2>Related</h2><ul><li>More</li></ul></aside></main>"
+        "<footer>Copyright. All rights reserved.</footer></body></html>"
+    )
+    target = int(megabytes * 1024 * 1024)
+    count = max(1, (target - len(head) - len(tail)) // len(paragraph))
+    return head + paragraph * count + tail
+
+
+def load_corpus(paths: list[str]) -> list[tuple[str, str]]:
+    """Read (name, html) for every .html/.htm file in the given files and directories."""
+    pages = []
+    for path in map(Path, paths):
+        files = sorted(path.rglob("*.htm*")) if path.is_dir() else [path]
+        for file in files:
+            pages.append((file.name, file.read_bytes().decode("utf-8", errors="replace")))
+    return pages
+
+
+def best_time(extractor: TextExtractor, html: str, repeat: int) -> tuple[float, ExtractedText]:
+    """Return (fastest of ``repeat`` runs in seconds, extracted text)."""
+    best = float("inf")
+    extracted = ExtractedText("", 0)
+    for _ in range(repeat):
+        started = time.perf_counter()
+        extracted = extractor.extract_document(html)
+        best = min(best, time.perf_counter() - started)
+    return best, extracted
+
+
+def main():
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("corpus", nargs="*", help="Saved HTML files or directories")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per page (best is kept)")
+    parser.add_argument("--synthetic-mb", type=float, default=3.0)
+    parser.add_argument(
+        "--full-text", action="store_true", help="Read whole pages, without main-content scoring"
+    )
+    args = parser.parse_args()
+
+    pages = load_corpus(args.corpus) if args.corpus else []
+    if not pages:
+        pages = [(f"synthetic-{args.synthetic_mb:g}MB", synthetic_page(args.synthetic_mb))]
+    size_mb = sum(len(html) for _, html in pages) / 1024 / 1024
+    print(f"{len(pages)} pages, {size_mb:.1f} MB; parsers: {', '.join(available_parsers())}")
+
+    extractors = {
+        name: TextExtractor(parser=name, main_content=not args.full_text)
+        for name in available_parsers()
+    }
+    times: dict[str, list[float]] = {name: [] for name in extractors}
+    identical = dict.fromkeys(extractors, 0)
+    kept_chars = total_chars = 0
+    for page, html in pages:
+        _, extracted = best_time(extractors["html.parser"], html, 1)
+        reference = extracted.text
+        kept_chars += len(reference)
+        total_chars += extracted.total_chars
+        for name, extractor in extractors.items():
+            elapsed, extracted = best_time(extractor, html, args.repeat)
+            text = extracted.text
+            times[name].append(elapsed)
+            if text == reference:
+                identical[name] += 1
+            else:
+                differs_at = next(
+                    (i for i, (a, b) in enumerate(zip(text, reference)) if a != b),
+                    min(len(text), len(reference)),
+                )
+                print(
+                    f"  {name} differs on {page} at char {differs_at} "
+                    f"({len(text)} vs {len(reference)} chars)"
+                )
+
+    baseline = sum(times["html.parser"])
+    print(f"{'parser':>12} {'total ms':>9} {'median ms':>10} {'speedup':>8} {'identical':>10}")
+    for name, values in times.items():
+        total = sum(values)
+        print(
+            f"{name:>12} {total * 1000:>9.1f} {statistics.median(values) * 1000:>10.1f} "
+            f"{baseline / total:>7.1f}x {identical[name]:>5}/{len(pages)}"
+        )
+    if total_chars:
+        print(
+            f"Kept {kept_chars} of {total_chars} characters "
+            f"({1 - kept_chars / total_chars:.0%} discarded as boilerplate)"
+        )
+
+
+if __name__ == "__main__":
+    main()
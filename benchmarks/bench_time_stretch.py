@@ -0,0 +1,72 @@
+"""Benchmark WSOLA time-stretch against linear-interpolation resampling.
+
+Reports throughput (seconds of audio processed per wall-clock second) and
+peak traced memory for each speed.
+
+Usage:
+    uv run python -m benchmarks.bench_time_stretch --seconds 60
+"""
+
+import argparse
+import time
+import tracemalloc
+from collections.abc import Callable
+
+import numpy as np
+
+from src.time_stretch import time_stretch
+
+SPEEDS = (0.75, 1.25, 1.5, 2.0)
+
+
+def linear_interp(audio: np.ndarray, speed: float, sample_rate: int) -> np.ndarray:
+    """Previous approach: resample with linspace/interp (shifts pitch)."""
+    new_length = int(len(audio) / speed)
+    indices = np.linspace(0, len(audio) - 1, new_length)
+    return np.interp(indices, np.arange(len(audio)), audio).astype(np.int16)
+
+
+def speech_like(seconds: float, sample_rate: int) -> np.ndarray:
+    """Harmonic signal with a gliding pitch and syllable-rate envelope."""
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    pitch = 140 + 30 * np.sin(2 * np.pi * 0.5 * t)
+    phase = 2 * np.pi * np.cumsum(pitch) / sample_rate
+    envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 4 * t) ** 2
+    signal = sum(np.sin(k * phase) / k for k in range(1, 6)) * envelope
+    return (6000 * signal).astype(np.int16)
+
+
+def measure(
+    func: Callable[[np.ndarray, float, int], np.ndarray],
+    audio: np.ndarray,
+    speed: float,
+    sample_rate: int,
+) -> tuple[float, int]:
+    """Return (x real-time, peak bytes) for one run."""
+    tracemalloc.start()
+    started = time.perf_counter()
+    func(audio, speed, sample_rate)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(audio) / sample_rate / elapsed, peak
+
+
+def main():
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=60.0)
+    parser.add_argument("--sample-rate", type=int, default=22050)
+    args = parser.parse_args()
+
+    audio = speech_like(args.seconds, args.sample_rate)
+    print(f"input: {args.seconds:.0f}s, {audio.nbytes / 1e6:.1f} MB int16")
+    print(f"{'speed':>6} {'method':>8} {'x realtime':>11} {'peak MB':>8}")
+    for speed in SPEEDS:
+        for name, func in (("interp", linear_interp), ("wsola", time_stretch)):
+            rate, peak = measure(func, audio, speed, args.sample_rate)
+            print(f"{speed:>6.2f} {name:>8} {rate:>11.0f} {peak / 1e6:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+"""Content-addressed sentence audio cache with memory and disk tiers"""
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize a sentence for cache lookups
+
+    Args:
+        text: Sentence text
+
+    Returns:
+        Text with whitespace collapsed and trimmed
+    """
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters and tier sizes"""
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    memory_bytes: int = 0
+    disk_bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from either tier"""
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0
+
+
+class AudioCache:
+    """Two-tier LRU cache of int16 PCM keyed by voice, sentence and parameters
+
+    The memory tier holds recently used sentences up to ``memory_bytes``.
+    The optional disk tier stores raw PCM files under ``cache_dir`` up to
+    ``disk_bytes``, evicting least recently used files first. Disk hits are
+    promoted to memory.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | str | None = None,
+        memory_bytes: int = 64 * 1024 * 1024,
+        disk_bytes: int = 512 * 1024 * 1024,
+    ):
+        """
+        Initialize audio cache
+
+        Args:
+            cache_dir: Directory for the disk tier (None for memory only)
+            memory_bytes: Memory tier size cap
+            disk_bytes: Disk tier size cap
+        """
+        self.memory_bytes = memory_bytes
+        self.disk_bytes = disk_bytes
+        self._memory: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._memory_size = 0
+        self._disk: OrderedDict[str, int] = OrderedDict()  # key -> file size
+        self._disk_size = 0
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._scan_disk()
+
+    @staticmethod
+    def key(voice_id: str, text: str, params: dict | None = None) -> str:
+        """
+        Compute the content address of a sentence
+
+        Args:
+            voice_id: Identifies the exact voice model
+            text: Sentence text (normalized before hashing)
+            params: Synthesis parameters that affect the audio
+
+        Returns:
+            Hex digest
+        """
+        payload = json.dumps(
+            [voice_id, normalize_text(text), params or {}], sort_keys=True, ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> np.ndarray | None:
+        """
+        Look up cached audio
+
+        Args:
+            key: Key from ``AudioCache.key``
+
+        Returns:
+            Read-only int16 audio, or None on a miss
+        """
+        with self._lock:
+            audio = self._memory.get(key)
+            if audio is not None:
+                self._memory.move_to_end(key)
+                self._stats.memory_hits += 1
+                return audio
+
+            audio = self._read_disk(key)
+            if audio is not None:
+                self._stats.disk_hits += 1
+                self._store_memory(key, audio)
+                return audio
+
+            self._stats.misses += 1
+            return None
+
+    def put(self, key: str, audio: np.ndarray) -> None:
+        """
+        Store audio in both tiers
+
+        Args:
+            key: Key from ``AudioCache.key``
+            audio: int16 audio samples
+        """
+        audio = np.ascontiguousarray(audio, dtype=np.int16).copy()
+        audio.setflags(write=False)
+
+        with self._lock:
+            self._store_memory(key, audio)
+            if self.cache_dir is not None and key not in self._disk:
+                self._write_disk(key, audio)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._memory or key in self._disk
+
+    def stats(self) -> CacheStats:
+        """
+        Get a snapshot of cache counters
+
+        Returns:
+            Hit/miss counts and current tier sizes
+        """
+        with self._lock:
+            return CacheStats(
+                memory_hits=self._stats.memory_hits,
+                disk_hits=self._stats.disk_hits,
+                misses=self._stats.misses,
+                memory_bytes=self._memory_size,
+                disk_bytes=self._disk_size,
+            )
+
+    def clear(self) -> None:
+        """Remove every entry from both tiers"""
+        with self._lock:
+            self._memory.clear()
+            self._memory_size = 0
+            for key in list(self._disk):
+                self._remove_disk(key)
+
+    def _store_memory(self, key: str, audio: np.ndarray) -> None:
+        """Insert into the memory tier and evict down to its cap"""
+        if audio.nbytes > self.memory_bytes:
+            return
+
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_size -= previous.nbytes
+
+        self._memory[key] = audio
+        self._memory_size += audio.nbytes
+
+        while self._memory_size > self.memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_size -= evicted.nbytes
+
+    def _path(self, key: str) -> Path:
+        """Disk location of an entry"""
+        return self.cache_dir / f"{key}.pcm"
+
+    def _scan_disk(self) -> None:
+        """Index existing cache files, least recently used first"""
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(".pcm") and entry.is_file():
+                stat = entry.stat()
+                entries.append((stat.st_mtime, entry.name[: -len(".pcm")], stat.st_size))
+
+        for _, key, size in sorted(entries):
+            self._disk[key] = size
+            self._disk_size += size
+
+        self._evict_disk()
+        logger.info(f"Audio cache has {len(self._disk)} entries ({self._disk_size} bytes) on disk")
+
+    def _read_disk(self, key: str) -> np.ndarray | None:
+        """Read an entry from disk and mark it recently used"""
+        if key not in self._disk:
+            return None
+
+        path = self._path(key)
+        try:
+            audio = np.fromfile(path, dtype=np.int16)
+            os.utime(path)
+        except OSError as e:
+            logger.warning(f"Dropping unreadable cache entry {key}: {e}")
+            self._remove_disk(key)
+            return None
+
+        audio.setflags(write=False)
+        self._disk.move_to_end(key)
+        return audio
+
+    def _write_disk(self, key: str, audio: np.ndarray) -> None:
+        """Write an entry atomically and evict down to the disk cap"""
+        if audio.nbytes > self.disk_bytes:
+            return
+
+        path = self._path(key)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            audio.tofile(tmp_path)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write cache entry {key}: {e}")
+            return
+
+        self._disk[key] = audio.nbytes
+        self._disk_size += audio.nbytes
+        self._evict_disk()
+
+    def _remove_disk(self, key: str) -> None:
+        """Delete an entry from disk"""
+        size = self._disk.pop(key, 0)
+        self._disk_size -= size
+        try:
+            self._path(key).unlink()
+        except OSError:
+            pass
+
+    def _evict_disk(self) -> None:
+        """Delete least recently used files until under the disk cap"""
+        while self._disk_size > self.disk_bytes and self._disk:
+            oldest = next(iter(self._disk))
+            self._remove_disk(oldest)
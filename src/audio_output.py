@@ -0,0 +1,309 @@
+"""Output backends that drive the audio player's callback"""
+import logging
+import threading
+import time
+import wave
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from pathlib import Path
+from typing import NamedTuple, Protocol
+
+import numpy as np
+import sounddevice as sd
+
+logger = logging.getLogger(__name__)
+
+# Frames per callback for simulated streams when the player leaves it to the host
+DEFAULT_BLOCKSIZE = 512
+
+AudioCallback = Callable[[np.ndarray, int, object, object], None]
+
+
+class OutputStream(Protocol):
+    """The part of ``sounddevice.OutputStream`` the player uses"""
+
+    def start(self) -> None: ...
+
+    def stop(self) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class OutputBackend(ABC):
+    """Opens output streams that pull audio through a callback
+
+    The callback has sounddevice's signature, ``callback(outdata, frames,
+    time_info, status)``, and may raise ``sounddevice.CallbackStop`` to end
+    the stream after the current block.
+    """
+
+    @abstractmethod
+    def open_stream(
+        self,
+        samplerate: int,
+        blocksize: int,
+        latency: str | float,
+        callback: AudioCallback,
+    ) -> OutputStream:
+        """
+        Create a mono int16 output stream (not yet started)
+
+        Args:
+            samplerate: Sample rate in Hz
+            blocksize: Frames per callback (0 lets the backend choose)
+            latency: Output latency, "low", "high" or seconds
+            callback: Called from the stream's thread for every block
+
+        Returns:
+            Stream with start/stop/close
+        """
+
+    def default_samplerate(self) -> int | None:
+        """
+        Get the output's native sample rate
+
+        Returns:
+            Rate in Hz, or None if the backend has no preference
+        """
+        return None
+
+
+class SoundDeviceBackend(OutputBackend):
+    """Plays through the default PortAudio output device"""
+
+    def default_samplerate(self) -> int | None:
+        try:
+            return int(sd.query_devices(kind="output")["default_samplerate"])
+        except Exception as e:
+            logger.warning(f"Could not query the output device sample rate: {e}")
+            return None
+
+    def open_stream(
+        self,
+        samplerate: int,
+        blocksize: int,
+        latency: str | float,
+        callback: AudioCallback,
+    ) -> OutputStream:
+        return sd.OutputStream(
+            samplerate=samplerate,
+            channels=1,
+            dtype="int16",
+            latency=latency,
+            blocksize=blocksize,
+            callback=callback,
+        )
+
+
+class _TimeInfo(NamedTuple):
+    """Stand-in for the time_info struct PortAudio passes to callbacks"""
+
+    inputBufferAdcTime: float  # noqa: N815 - mirrors PortAudio's field names
+    currentTime: float  # noqa: N815
+    outputBufferDacTime: float  # noqa: N815
+
+
+class _Underflow:
+    """Status flags reported when a simulated device ran out of audio"""
+
+    output_underflow = True
+    output_overflow = False
+
+    def __bool__(self) -> bool:
+        return True
+
+    def __str__(self) -> str:
+        return "output underflow"
+
+
+class SimulatedStream:
+    """Output stream whose "device" is a thread calling the callback
+
+    With ``pace`` 1.0 blocks are requested at the rate a real device would
+    consume them, and a callback that returns after its block should have
+    started playing is reported to the next callback as an output
+    underflow, like PortAudio does. A higher pace runs that many times
+    faster than real time; 0 runs as fast as the callback allows.
+    """
+
+    def __init__(
+        self,
+        samplerate: int,
+        blocksize: int,
+        callback: AudioCallback,
+        pace: float = 1.0,
+        sink: Callable[[np.ndarray], None] | None = None,
+        on_close: Callable[[], None] | None = None,
+    ):
+        """
+        Initialize simulated stream
+
+        Args:
+            samplerate: Sample rate in Hz
+            blocksize: Frames per callback (0 uses DEFAULT_BLOCKSIZE)
+            callback: Audio callback to drive
+            pace: Speed relative to real time (0 = unthrottled)
+            sink: Receives each rendered block (a view, only valid during the call)
+            on_close: Called once when the stream is closed
+        """
+        if pace < 0:
+            raise ValueError("Pace must not be negative")
+
+        self.samplerate = samplerate
+        self.blocksize = blocksize or DEFAULT_BLOCKSIZE
+        self.pace = pace
+        self._callback = callback
+        self._sink = sink
+        self._on_close = on_close
+        self._thread: threading.Thread | None = None
+        self._stopping = threading.Event()
+        self.frames_played = 0
+
+    @property
+    def active(self) -> bool:
+        """Whether the stream thread is running"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start calling the callback from a new thread"""
+        if self.active:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="audio-output", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the stream thread after its current block"""
+        self._stopping.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def close(self) -> None:
+        """Stop the stream and release what it writes to"""
+        self.stop()
+        on_close, self._on_close = self._on_close, None
+        if on_close is not None:
+            on_close()
+
+    def _run(self) -> None:
+        """Stream thread body: request blocks until stopped"""
+        blocksize = self.blocksize
+        outdata = np.zeros((blocksize, 1), dtype=np.int16)
+        period = blocksize / (self.samplerate * self.pace) if self.pace else 0.0
+        started = time.perf_counter()
+        blocks = 0
+        status = None
+
+        while not self._stopping.is_set():
+            now = time.perf_counter()
+            try:
+                self._callback(outdata, blocksize, _TimeInfo(now, now, now + period), status)
+            except sd.CallbackStop:
+                self._deliver(outdata)
+                break
+            except sd.CallbackAbort:
+                break
+            self._deliver(outdata)
+            blocks += 1
+
+            status = None
+            if period:
+                # The next block is due when this one has finished playing
+                delay = started + blocks * period - time.perf_counter()
+                if delay > 0:
+                    self._stopping.wait(delay)
+                elif -delay > period:
+                    # A real device would have played silence meanwhile;
+                    # carry on from now rather than bursting to catch up
+                    status = _Underflow()
+                    started = time.perf_counter() - blocks * period
+
+    def _deliver(self, outdata: np.ndarray) -> None:
+        """Hand a rendered block to the sink"""
+        self.frames_played += len(outdata)
+        if self._sink is not None:
+            self._sink(outdata[:, 0])
+
+
+class NullBackend(OutputBackend):
+    """Discards audio, for benchmarking and soak-testing without a device"""
+
+    def __init__(self, pace: float = 1.0, samplerate: int | None = None):
+        """
+        Initialize null backend
+
+        Args:
+            pace: Speed relative to real time (0 = unthrottled)
+            samplerate: Native rate to report, as a device would (None for no preference)
+        """
+        self.pace = pace
+        self.samplerate = samplerate
+
+    def default_samplerate(self) -> int | None:
+        return self.samplerate
+
+    def open_stream(
+        self,
+        samplerate: int,
+        blocksize: int,
+        latency: str | float,
+        callback: AudioCallback,
+    ) -> OutputStream:
+        return SimulatedStream(samplerate, blocksize, callback, self.pace)
+
+
+class WavFileBackend(OutputBackend):
+    """Writes everything the player outputs, silence included, to a WAV file
+
+    Streams opened one after another (e.g. one per play call) append
+    to the same file; it is finalized when the last open stream is closed.
+    """
+
+    def __init__(self, path: Path | str, pace: float = 0.0):
+        """
+        Initialize WAV file backend
+
+        Args:
+            path: Output file
+            pace: Speed relative to real time (0 = unthrottled)
+        """
+        self.path = Path(path)
+        self.pace = pace
+        self._wav: wave.Wave_write | None = None
+        self._open_streams = 0
+        self._lock = threading.Lock()
+
+    def open_stream(
+        self,
+        samplerate: int,
+        blocksize: int,
+        latency: str | float,
+        callback: AudioCallback,
+    ) -> OutputStream:
+        with self._lock:
+            if self._wav is None:
+                self._wav = wave.open(str(self.path), "wb")
+                self._wav.setnchannels(1)
+                self._wav.setsampwidth(2)
+                self._wav.setframerate(samplerate)
+            self._open_streams += 1
+
+        return SimulatedStream(
+            samplerate, blocksize, callback, self.pace, sink=self._write, on_close=self._release
+        )
+
+    def _write(self, block: np.ndarray) -> None:
+        """Append one block of samples"""
+        with self._lock:
+            if self._wav is not None:
+                self._wav.writeframes(block.astype("<i2", copy=False).tobytes())
+
+    def _release(self) -> None:
+        """Finalize the file once no stream is using it"""
+        with self._lock:
+            self._open_streams -= 1
+            if self._open_streams == 0 and self._wav is not None:
+                self._wav.close()
+                self._wav = None
+                logger.info(f"Wrote audio output to {self.path}")
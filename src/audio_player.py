@@ -2,14 +2,37 @@
 
 import logging
 import threading
-from collections.abc import Callable
+import time
+from bisect import bisect_right
+from collections import deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
 from enum import Enum
 
 import numpy as np
 import sounddevice as sd
 
+from src.audio_output import OutputBackend, OutputStream, SoundDeviceBackend
+from src.resampler import Resampler
+from src.ring_buffer import AudioRingBuffer
+from src.sentence_index import SentenceIndex
+from src.time_stretch import TimeStretcher
+
 logger = logging.getLogger(__name__)
 
+# PortAudio's latency presets; a number is a latency in seconds
+LATENCY_PRESETS = ("low", "high")
+
+# Upper edges (microseconds) of the callback execution time histogram
+CALLBACK_TIME_BINS_US = (50, 100, 250, 500, 1000, 2500, 5000, 10000, 25000)
+
+# Longest a stop or replace waits for a torn-down producer to exit; one
+# that is still blocked in its source is left to finish on its own
+PRODUCER_JOIN_TIMEOUT = 0.1
+
+# How often the notifier thread checks for sources the callback has finished
+NOTIFY_INTERVAL = 0.01
+
 
 class PlaybackState(Enum):
     """Playback state enumeration"""
@@ -19,26 +42,192 @@ class PlaybackState(Enum):
     PAUSED = "paused"
 
 
+@dataclass
+class PlaybackStats:
+    """Audio callback timing and buffer health counters
+
+    ``callback_time_histogram[i]`` counts callbacks that took less than
+    ``CALLBACK_TIME_BINS_US[i]`` microseconds (and at least the previous
+    edge); the last entry counts the ones that took longer than every edge.
+    """
+
+    callbacks: int = 0
+    underruns: int = 0
+    output_underflows: int = 0
+    output_overflows: int = 0
+    callback_time_histogram: tuple[int, ...] = ()
+    max_callback_time: float = 0.0
+    total_callback_time: float = 0.0
+    buffered: int = 0
+    min_buffered: int | None = None
+    buffer_capacity: int = 0
+
+    @property
+    def avg_callback_time(self) -> float:
+        """Average seconds spent per callback"""
+        return self.total_callback_time / self.callbacks if self.callbacks else 0.0
+
+
+@dataclass
+class _QueuedSource:
+    """Audio waiting in the playback queue"""
+
+    audio: np.ndarray | None
+    ring: AudioRingBuffer | None
+    producer: threading.Thread | None
+    index: SentenceIndex
+    on_complete: Callable[[], None] | None
+    sample_rate: int
+    stretcher: TimeStretcher
+    resampler: Resampler | None
+    on_cancel: Callable[[], None] | None = None
+
+
 class AudioPlayer:
-    """Audio player with playback controls and speed adjustment"""
+    """Audio player with playback controls and speed adjustment
+
+    By default each ``play`` and ``resume`` opens a new output stream. With
+    ``persistent_stream`` the device stream is opened once and kept running,
+    outputting silence while idle, and play/pause/resume/stop only change
+    state read by the audio callback. That avoids the device open latency
+    and the clicks of starting and stopping the stream.
 
-    def __init__(self, sample_rate: int = 22050):
+    Every source has a ``SentenceIndex`` of sentence start offsets, so
+    ``seek`` and ``skip_sentence`` only move the read position: nothing is
+    re-synthesized or re-processed.
+
+    ``enqueue`` appends audio to play after the current source. The audio
+    callback moves on to the next source within the same block, so queued
+    utterances play back to back without a gap or a new stream.
+
+    Sources may have any sample rate. The stream runs at ``output_rate``
+    and the callback converts each source once, after speed adjustment,
+    so a voice's audio is never resampled twice on its way to the device.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 22050,
+        buffer_seconds: float = 30.0,
+        persistent_stream: bool = False,
+        history_seconds: float = 30.0,
+        latency: str | float = "high",
+        blocksize: int = 0,
+        backend: OutputBackend | None = None,
+        output_rate: int | str | None = None,
+    ):
         """
         Initialize audio player
 
         Args:
-            sample_rate: Audio sample rate in Hz
+            sample_rate: Default sample rate of sources in Hz
+            buffer_seconds: Size of the streaming ring buffer in seconds of audio
+            persistent_stream: Keep one output stream open for the player's lifetime
+            history_seconds: Already-played streaming audio kept for seeking back
+            latency: Output latency, "low", "high" or seconds; lower reacts
+                faster but is more prone to dropouts on a loaded machine
+            blocksize: Frames per callback (0 lets the host choose)
+            backend: Where audio is output (defaults to the sound device)
+            output_rate: Stream sample rate in Hz, "device" for the output
+                device's native rate, or None to use ``sample_rate``
+
+        Raises:
+            ValueError: If latency, blocksize or output rate is invalid
         """
+        if latency not in LATENCY_PRESETS and not (
+            isinstance(latency, int | float) and latency > 0
+        ):
+            raise ValueError(f"Latency must be one of {LATENCY_PRESETS} or positive seconds")
+        if blocksize < 0:
+            raise ValueError("Blocksize must not be negative")
+        if output_rate is not None and output_rate != "device" and not (
+            isinstance(output_rate, int) and output_rate > 0
+        ):
+            raise ValueError('Output rate must be "device" or a positive number of Hz')
+
         self.sample_rate = sample_rate
+        self.persistent_stream = persistent_stream
+        self.latency = latency
+        self.blocksize = blocksize
+        self.backend = backend if backend is not None else SoundDeviceBackend()
+        self.output_rate = self._resolve_output_rate(output_rate)
         self._state = PlaybackState.STOPPED
         self._audio_data: np.ndarray | None = None
-        self._position = 0  # Current position in samples
         self._speed = 1.0
-        self._stream: sd.OutputStream | None = None
+        self._stream: OutputStream | None = None
         self._completion_callback: Callable[[], None] | None = None
         self._lock = threading.Lock()
 
-        logger.info(f"Initialized audio player with sample rate: {sample_rate}")
+        # Streaming mode: a producer thread fills the ring buffer and the
+        # audio callback drains it, so memory stays bounded by its capacity
+        self._buffer_samples = int(sample_rate * buffer_seconds)
+        self._history_samples = int(sample_rate * history_seconds)
+        self._ring = self._new_ring()
+        self._streaming = False
+        self._producer: threading.Thread | None = None
+
+        # Sentence start offsets of the current source; filled by the
+        # producer from chunk boundaries unless the caller supplied one
+        self._index = SentenceIndex()
+
+        # Sources to play after the current one. The callback switches to
+        # the next at the exact sample the current one ends
+        self._queue: deque[_QueuedSource] = deque()
+        self._on_complete: Callable[[], None] | None = None
+        self._on_cancel: Callable[[], None] | None = None
+
+        # Speed is applied block by block in the audio callback: source
+        # samples are pulled through the time-stretcher only as fast as the
+        # device consumes them, so speed changes apply from the next frame
+        self._stretchers: dict[int, TimeStretcher] = {}
+        self._resamplers: dict[int, Resampler] = {}
+        self._source_rate = sample_rate
+        self._stretcher, self._resampler = self._converters(sample_rate)
+        self._stretching = False  # Whether the current audio goes through it
+        self._stretch_base = 0  # Source position where stretching started
+        self._source_read = 0  # Source samples consumed by the callback
+        self._scratch = np.zeros(4096, dtype=np.int16)
+        self._resample_scratch = np.zeros(4096, dtype=np.int16)
+
+        # The callback only tries this lock, so it never waits on the
+        # control thread; holding it guarantees no block is mid-render
+        self._render_lock = threading.Lock()
+        self._generation = 0  # Bumped whenever the source is replaced
+        self._source_done = True  # Callback has finished the current source
+
+        # The callback hands finished sources to a notifier thread as
+        # (generation, on_complete, last) so callbacks never run on it. The
+        # notifier polls the deque while playing, since waking it with an
+        # Event would take a lock on the audio thread; _active is set by the
+        # control thread only, to wake it from idle
+        self._completions: deque[tuple[int, Callable[[], None] | None, bool]] = deque()
+        self._active = threading.Event()
+        self._notifier: threading.Thread | None = None
+        self._closing = False
+
+        # Time from a play/resume request until its first sample is output
+        self._requested_at: float | None = None
+        self._start_latency: float | None = None
+
+        # The audio thread never logs; it counts stream status flags and
+        # the control thread reports them
+        self._status_count = 0
+        self._last_status = None
+        self._reported_status_count = 0
+
+        # Callback instrumentation, updated in place by the audio thread
+        self._callback_histogram = [0] * (len(CALLBACK_TIME_BINS_US) + 1)
+        self._callback_max = 0.0
+        self._callback_total = 0.0
+        self._underruns = 0
+        self._output_underflows = 0
+        self._output_overflows = 0
+        self._min_buffered: int | None = None
+
+        logger.info(
+            f"Initialized audio player with sample rate: {sample_rate} "
+            f"(output rate: {self.output_rate})"
+        )
 
     @property
     def state(self) -> PlaybackState:
@@ -47,58 +236,225 @@ class AudioPlayer:
 
     @property
     def position(self) -> int:
-        """Get current playback position in samples"""
-        return self._position
+        """Get current playback position in source samples"""
+        if self._stretching:
+            position = self._stretch_base + int(self._stretcher.source_position)
+        else:
+            position = self._source_read
+
+        resampler = self._resampler
+        if resampler is not None:
+            # Samples written to the resampler but not yet played out
+            lag = resampler.written - resampler.input_position
+            if self._stretching:
+                lag *= self._stretcher.speed
+            position -= int(lag)
+        return max(0, position)
 
     @property
     def duration(self) -> float:
-        """Get total audio duration in seconds"""
+        """Get total audio duration in seconds
+
+        In streaming mode this is the duration produced so far.
+        """
+        if self._streaming:
+            return self._ring.written / self._source_rate
         if self._audio_data is None:
             return 0.0
-        return len(self._audio_data) / self.sample_rate
+        return len(self._audio_data) / self._source_rate
+
+    @property
+    def streaming(self) -> bool:
+        """Whether the current audio comes from a streaming producer"""
+        return self._streaming
+
+    @property
+    def buffered(self) -> int:
+        """Get number of samples waiting in the streaming ring buffer"""
+        return self._ring.available
 
     @property
     def speed(self) -> float:
         """Get current playback speed"""
         return self._speed
 
-    def play(self, audio_data: np.ndarray) -> None:
+    @property
+    def sentence_index(self) -> SentenceIndex:
+        """Get the sentence boundaries of the current audio"""
+        return self._index
+
+    @property
+    def sentence(self) -> int:
+        """Get the number of the sentence being played (-1 if none)"""
+        return self._index.locate(self.position)
+
+    @property
+    def start_latency(self) -> float | None:
+        """Seconds from the last play/resume call until its audio reached the device
+
+        Includes the stream's reported output latency; None until measured.
         """
-        Start playing audio
+        return self._start_latency
+
+    def stats(self) -> PlaybackStats:
+        """
+        Get a snapshot of callback timing and buffer health
+
+        An underrun is a block that was padded with silence because the
+        producer had fallen behind after playback started; output
+        underflows and overflows are the ones reported by the device.
+
+        Returns:
+            Counters since the player was created or ``reset_stats``
+        """
+        histogram = tuple(self._callback_histogram)
+        return PlaybackStats(
+            callbacks=sum(histogram),
+            underruns=self._underruns,
+            output_underflows=self._output_underflows,
+            output_overflows=self._output_overflows,
+            callback_time_histogram=histogram,
+            max_callback_time=self._callback_max,
+            total_callback_time=self._callback_total,
+            buffered=self._ring.available,
+            min_buffered=self._min_buffered,
+            buffer_capacity=self._buffer_samples,
+        )
+
+    def reset_stats(self) -> None:
+        """Zero the counters reported by ``stats``"""
+        self._callback_histogram[:] = [0] * len(self._callback_histogram)
+        self._callback_max = 0.0
+        self._callback_total = 0.0
+        self._underruns = 0
+        self._output_underflows = 0
+        self._output_overflows = 0
+        self._min_buffered = None
+
+    def play(
+        self,
+        audio_data: np.ndarray,
+        index: SentenceIndex | None = None,
+        on_complete: Callable[[], None] | None = None,
+        sample_rate: int | None = None,
+    ) -> None:
+        """
+        Start playing audio, replacing anything playing or queued
 
         Args:
             audio_data: Audio samples as numpy array
+            index: Sentence boundaries within ``audio_data`` (None treats it
+                as a single sentence)
+            on_complete: Called once this audio has played to the end
+            sample_rate: Sample rate of ``audio_data`` (None uses the player's)
         """
-        logger.debug("play_called", audio_samples=len(audio_data))
-
-        # Stop any existing playback OUTSIDE the lock to avoid deadlock
-        # The stream callbacks may try to acquire the lock
-        old_stream = None
-        with self._lock:
-            if self._stream is not None:
-                logger.debug("storing_stream_reference_for_cleanup")
-                old_stream = self._stream
-                self._stream = None
+        logger.debug(f"play_called with {len(audio_data)} samples")
 
-        # Close the old stream outside the lock
-        if old_stream is not None:
-            logger.debug("stopping_existing_stream")
-            try:
-                old_stream.stop()
-                old_stream.close()
-            except Exception as e:
-                logger.warning("error_closing_stream", error=str(e))
+        self._teardown()
+        sample_rate = sample_rate or self.sample_rate
+        converters = self._converters(sample_rate)
 
         # Now start new playback with the lock
         with self._lock:
-            self._audio_data = audio_data
-            self._position = 0
-            logger.debug("starting_playback_stream")
+            with self._render_lock:
+                self._streaming = False
+                self._audio_data = audio_data
+                self._index = self._array_index(audio_data, index)
+                self._on_complete = on_complete
+                self._on_cancel = None
+                self._load_source(sample_rate, *converters)
             self._start_playback()
-            logger.debug("playback_stream_started")
 
         logger.info(f"Started playback of {len(audio_data)} samples")
 
+    def play_stream(
+        self,
+        chunks: Iterable[np.ndarray],
+        index: SentenceIndex | None = None,
+        on_complete: Callable[[], None] | None = None,
+        sample_rate: int | None = None,
+        on_cancel: Callable[[], None] | None = None,
+    ) -> None:
+        """
+        Start playing audio while it is still being produced, replacing
+        anything playing or queued
+
+        A background thread pulls chunks from ``chunks`` (for example
+        ``PiperTTSEngine.synthesize_stream``) and pushes them into the ring
+        buffer, blocking while it is full. Playback starts immediately and
+        completes once the producer is exhausted and the buffer has drained.
+
+        Args:
+            chunks: Iterable of int16 audio chunks
+            index: Sentence boundaries filled in as chunks are produced (None
+                treats each chunk as one sentence)
+            on_complete: Called once the stream has played to the end
+            sample_rate: Sample rate of the chunks (None uses the player's)
+            on_cancel: Called if the stream is stopped or replaced before it
+                has played to the end, so whatever produces ``chunks`` can
+                stop waiting for more work; must not block
+        """
+        logger.debug("play_stream_called")
+
+        self._teardown()
+        sample_rate = sample_rate or self.sample_rate
+        converters = self._converters(sample_rate)
+
+        with self._lock:
+            with self._render_lock:
+                self._ring.reset()
+                self._streaming = True
+                self._audio_data = None
+                self._index = index if index is not None else SentenceIndex()
+                self._on_complete = on_complete
+                self._on_cancel = on_cancel
+                self._load_source(sample_rate, *converters)
+
+            self._producer = self._start_producer(chunks, self._ring, self._index, index is None)
+            self._start_playback()
+
+        logger.info("Started streaming playback")
+
+    def enqueue(
+        self,
+        source: np.ndarray | Iterable[np.ndarray],
+        index: SentenceIndex | None = None,
+        on_complete: Callable[[], None] | None = None,
+        sample_rate: int | None = None,
+        on_cancel: Callable[[], None] | None = None,
+    ) -> None:
+        """
+        Play audio after everything already playing or queued
+
+        Starts playback right away if nothing is playing. Otherwise the
+        audio callback switches to it at the sample the previous source
+        ends. A queued stream starts producing immediately into its own
+        ring buffer so it is ready by the time it is reached.
+
+        Args:
+            source: Audio samples, or an iterable of chunks to stream
+            index: Sentence boundaries (as for ``play`` / ``play_stream``)
+            on_complete: Called once this source has played to the end
+            sample_rate: Sample rate of the source (None uses the player's)
+            on_cancel: Called if a streamed source is stopped or replaced
+                before it has played to the end (as for ``play_stream``)
+        """
+        with self._lock:
+            with self._render_lock:
+                # A finished source may still be waiting for its completion
+                # to be reported; there is nothing left to queue behind
+                if self._state != PlaybackState.STOPPED and not self._source_done:
+                    self._queue.append(
+                        self._queued_source(source, index, on_complete, sample_rate, on_cancel)
+                    )
+                    logger.info(f"Queued audio ({len(self._queue)} waiting)")
+                    return
+
+        if isinstance(source, np.ndarray):
+            self.play(source, index, on_complete, sample_rate)
+        else:
+            self.play_stream(source, index, on_complete, sample_rate, on_cancel)
+
     def pause(self) -> None:
         """Pause playback without losing position"""
         # Get stream reference and update state while holding lock
@@ -108,18 +464,18 @@ class AudioPlayer:
             if self._state != PlaybackState.PLAYING:
                 return
 
-            if self._stream is not None:
+            if self._stream is not None and not self.persistent_stream:
                 stream_to_stop = self._stream
 
             self._state = PlaybackState.PAUSED
-            position = self._position
+            position = self.position
 
         # Stop stream outside the lock to avoid deadlock
         if stream_to_stop is not None:
             try:
                 stream_to_stop.stop()
             except Exception as e:
-                logger.warning("error_stopping_stream_on_pause", error=str(e))
+                logger.warning(f"Error stopping stream on pause: {e}")
 
         logger.info(f"Paused playback at position {position}")
 
@@ -129,37 +485,106 @@ class AudioPlayer:
             if self._state != PlaybackState.PAUSED:
                 return
 
-            if self._audio_data is None:
+            if self._audio_data is None and not self._streaming:
                 return
 
+            # Stretcher state and source position are kept across the pause,
+            # so resuming does no audio processing up front
             self._start_playback()
-            logger.info(f"Resumed playback from position {self._position}")
+            logger.info(f"Resumed playback from position {self.position}")
 
     def stop(self) -> None:
         """Stop playback and reset position"""
-        # Get stream reference while holding lock
-        old_stream = None
+        self._teardown()
+
         with self._lock:
-            if self._stream is not None:
-                old_stream = self._stream
-                self._stream = None
             self._state = PlaybackState.STOPPED
-            self._position = 0
+            self._rewind()
 
-        # Close stream outside the lock to avoid deadlock
-        if old_stream is not None:
+        self._report_status()
+        logger.info("Stopped playback")
+
+    def close(self) -> None:
+        """Stop playback and release the output device"""
+        self.stop()
+
+        with self._lock:
+            stream = self._stream
+            self._stream = None
+            notifier = self._notifier
+            self._notifier = None
+
+        if stream is not None:
             try:
-                old_stream.stop()
-                old_stream.close()
+                stream.stop()
+                stream.close()
             except Exception as e:
-                logger.warning("error_closing_stream_on_stop", error=str(e))
+                logger.warning(f"Error closing stream: {e}")
 
-        logger.info("Stopped playback")
+        if notifier is not None:
+            self._closing = True
+            self._active.set()
+            notifier.join()
+
+    def seek(self, position: int) -> int:
+        """
+        Move playback to a source sample position
+
+        Only the read position moves, so this is O(1) regardless of how much
+        audio there is. While streaming, the target is clamped to the audio
+        still held: up to ``history_seconds`` back and up to what has been
+        produced ahead.
+
+        Args:
+            position: Sample offset from the start of the audio
+
+        Returns:
+            The position actually moved to
+        """
+        with self._lock:
+            if self._state == PlaybackState.STOPPED:
+                return self.position
+
+            with self._render_lock:
+                if self._streaming:
+                    position = self._ring.seek(position)
+                else:
+                    position = min(max(position, 0), len(self._audio_data))
+                self._source_read = position
+                # The stretcher restarts from the new position on the next block
+                self._stretching = False
+                if self._resampler is not None:
+                    self._resampler.reset()
+
+        logger.info(f"Seeked to position {position}")
+        return position
+
+    def skip_sentence(self, count: int = 1) -> int:
+        """
+        Jump to the start of a sentence relative to the current one
+
+        Args:
+            count: Sentences to move by (negative goes back; 0 restarts the
+                current sentence)
+
+        Returns:
+            Number of the sentence now playing, or -1 if there is none
+        """
+        index = self._index
+        current = index.locate(self.position)
+        if current < 0:
+            return current
+
+        target = min(max(current + count, 0), len(index) - 1)
+        return index.locate(self.seek(index.offset(target)))
 
     def set_speed(self, speed: float) -> None:
         """
         Set playback speed
 
+        Takes effect within one callback block while playing; the audio
+        callback picks up the new value for its next time-stretch frame.
+
         Args:
             speed: Speed multiplier (0.5 = half speed, 2.0 = double speed)
         """
@@ -170,10 +595,6 @@ class AudioPlayer:
             old_speed = self._speed
             self._speed = speed
 
-            # If playing, we need to adjust the stream
-            # For simplicity, we'll keep playing at the same position
-            # A more sophisticated implementation would recreate the stream
-
             logger.info(f"Speed changed from {old_speed}x to {speed}x")
 
     def set_completion_callback(self, callback: Callable[[], None]) -> None:
@@ -187,49 +608,193 @@ class AudioPlayer:
 
     def _start_playback(self) -> None:
         """Internal method to start/resume playback"""
-        if self._audio_data is None:
+        if not self._streaming and self._audio_data is None:
             return
 
-        # Apply speed adjustment to audio
-        adjusted_audio = self._apply_speed(self._audio_data[self._position :])
+        self._start_latency = None
+        self._requested_at = time.perf_counter()
+        self._start_notifier()
+
+        if self.persistent_stream:
+            # The device is already running; the callback starts rendering
+            # as soon as it sees the new state
+            self._open_stream()
+            self._state = PlaybackState.PLAYING
+        else:
+            # Restart the stream a pause stopped, or create one; PLAYING first
+            # so its first block is not silence
+            if self._stream is None:
+                self._stream = self._create_stream()
+            self._state = PlaybackState.PLAYING
+            self._stream.start()
+
+        # Only after PLAYING is set, so the notifier cannot go idle on the old state
+        self._active.set()
 
-        # Create output stream
-        self._stream = sd.OutputStream(
-            samplerate=self.sample_rate,
-            channels=1,
-            dtype="int16",
+    def _create_stream(self) -> OutputStream:
+        """Create an output stream driven by the audio callback"""
+        return self.backend.open_stream(
+            samplerate=self.output_rate,
+            blocksize=self.blocksize,
+            latency=self.latency,
             callback=self._audio_callback,
-            finished_callback=self._on_stream_finished,
         )
 
-        self._adjusted_audio = adjusted_audio
-        self._adjusted_position = 0
+    def _open_stream(self) -> None:
+        """Open and start the persistent stream on first use"""
+        if self._stream is not None:
+            return
 
+        started = time.perf_counter()
+        self._stream = self._create_stream()
         self._stream.start()
-        self._state = PlaybackState.PLAYING
+        logger.info(
+            f"Opened persistent output stream in {(time.perf_counter() - started) * 1000:.1f}ms"
+        )
 
-    def _apply_speed(self, audio_data: np.ndarray) -> np.ndarray:
+    def _start_notifier(self) -> None:
+        """Start the completion notifier thread on first use"""
+        if self._notifier is not None:
+            return
+
+        self._closing = False
+        self._notifier = threading.Thread(
+            target=self._notify_completions, name="audio-completion", daemon=True
+        )
+        self._notifier.start()
+
+    def _resolve_output_rate(self, output_rate: int | str | None) -> int:
+        """Turn the ``output_rate`` argument into a rate in Hz"""
+        if output_rate is None:
+            return self.sample_rate
+        if output_rate == "device":
+            rate = self.backend.default_samplerate()
+            if rate is None:
+                logger.warning(f"Output device rate unknown, using {self.sample_rate} Hz")
+                return self.sample_rate
+            return rate
+        return output_rate
+
+    def _converters(self, sample_rate: int) -> tuple[TimeStretcher, Resampler | None]:
         """
-        Apply speed adjustment to audio
+        Get the time-stretcher and resampler for sources at a sample rate
 
-        Args:
-            audio_data: Original audio samples
+        They are created on first use, on the calling (control) thread, and
+        reused for every later source at that rate.
+
+        Returns:
+            (stretcher, resampler); resampler is None at the output rate
+        """
+        stretcher = self._stretchers.get(sample_rate)
+        if stretcher is None:
+            stretcher = self._stretchers[sample_rate] = TimeStretcher(self._speed, sample_rate)
+
+        if sample_rate == self.output_rate:
+            return stretcher, None
+        resampler = self._resamplers.get(sample_rate)
+        if resampler is None:
+            resampler = self._resamplers[sample_rate] = Resampler(sample_rate, self.output_rate)
+            logger.info(f"Resampling {sample_rate} Hz audio to {self.output_rate} Hz")
+        return stretcher, resampler
+
+    def _new_ring(self) -> AudioRingBuffer:
+        """Create a ring buffer for one streaming source"""
+        return AudioRingBuffer(
+            self._buffer_samples + self._history_samples, history=self._history_samples
+        )
+
+    def _start_producer(
+        self,
+        chunks: Iterable[np.ndarray],
+        ring: AudioRingBuffer,
+        index: SentenceIndex,
+        index_chunks: bool,
+    ) -> threading.Thread:
+        """Start a thread pushing ``chunks`` into ``ring``"""
+        producer = threading.Thread(
+            target=self._produce,
+            args=(chunks, ring, index if index_chunks else None),
+            name="audio-producer",
+            daemon=True,
+        )
+        producer.start()
+        return producer
+
+    @staticmethod
+    def _array_index(audio_data: np.ndarray, index: SentenceIndex | None) -> SentenceIndex:
+        """Use the given index, or treat the whole array as one sentence"""
+        if index is None:
+            index = SentenceIndex()
+            index.add(len(audio_data))
+        return index
+
+    def _queued_source(
+        self,
+        source: np.ndarray | Iterable[np.ndarray],
+        index: SentenceIndex | None,
+        on_complete: Callable[[], None] | None,
+        sample_rate: int | None,
+        on_cancel: Callable[[], None] | None = None,
+    ) -> _QueuedSource:
+        """Prepare a source for the queue, starting its producer if it streams"""
+        sample_rate = sample_rate or self.sample_rate
+        converters = self._converters(sample_rate)
+        if isinstance(source, np.ndarray):
+            index = self._array_index(source, index)
+            return _QueuedSource(source, None, None, index, on_complete, sample_rate, *converters)
+
+        ring = self._new_ring()
+        chunk_index = index if index is not None else SentenceIndex()
+        producer = self._start_producer(source, ring, chunk_index, index is None)
+        return _QueuedSource(
+            None, ring, producer, chunk_index, on_complete, sample_rate, *converters, on_cancel
+        )
+
+    def _advance_queue(self) -> bool:
+        """
+        Make the next queued source current; call from the audio callback
 
         Returns:
-            Speed-adjusted audio samples
+            False if the queue is empty
         """
-        if self._speed == 1.0:
-            return audio_data
+        if not self._queue:
+            return False
+
+        item = self._queue.popleft()
+        self._completions.append((self._generation, self._on_complete, False))
 
-        # Simple resampling for speed adjustment
-        original_length = len(audio_data)
-        new_length = int(original_length / self._speed)
+        self._audio_data = item.audio
+        self._streaming = item.ring is not None
+        if item.ring is not None:
+            self._ring = item.ring
+            self._producer = item.producer
+        self._index = item.index
+        self._on_complete = item.on_complete
+        self._on_cancel = item.on_cancel
+        self._source_rate = item.sample_rate
+        self._stretcher = item.stretcher
+        self._resampler = item.resampler
+        self._rewind()
+        return True
 
-        # Linear interpolation
-        indices = np.linspace(0, original_length - 1, new_length)
-        adjusted_audio = np.interp(indices, np.arange(original_length), audio_data)
+    def _load_source(
+        self, sample_rate: int, stretcher: TimeStretcher, resampler: Resampler | None
+    ) -> None:
+        """Make newly assigned audio current; call while holding the render lock"""
+        self._generation += 1
+        self._source_done = False
+        self._source_rate = sample_rate
+        self._stretcher = stretcher
+        self._resampler = resampler
+        self._rewind()
 
-        return adjusted_audio.astype(np.int16)
+    def _rewind(self) -> None:
+        """Reset the source position, time-stretch and resampling state"""
+        self._source_read = 0
+        self._stretch_base = 0
+        self._stretching = False
+        if self._resampler is not None:
+            self._resampler.reset()
 
     def _audio_callback(
         self, outdata: np.ndarray, frames: int, time_info, status
@@ -243,39 +808,347 @@ class AudioPlayer:
             time_info: Time information
             status: Stream status
         """
+        started = time.perf_counter()
         if status:
-            logger.warning(f"Audio stream status: {status}")
+            self._count_status(status)
+
+        try:
+            self._fill(outdata[:, 0], frames, time_info)
+        finally:
+            self._record_callback_time(time.perf_counter() - started)
+
+    def _fill(self, out: np.ndarray, frames: int, time_info) -> None:
+        """
+        Render the next block, or silence, into the device buffer
+
+        Args:
+            out: Output samples to fill
+            frames: Number of frames requested
+            time_info: Time information
+        """
+        if self._state is not PlaybackState.PLAYING or not self._render_lock.acquire(
+            blocking=False
+        ):
+            # Idle, paused, or the control thread is swapping the source
+            out[:] = 0
+            return
+
+        try:
+            count = 0 if self._source_done else self._render(out)
+            # Carry straight on into queued sources within this block
+            while count < frames and not self._source_done and self._render_finished():
+                if not self._advance_queue():
+                    break
+                count += self._render(out[count:])
+
+            if count and self._requested_at is not None:
+                self._record_start_latency(time_info)
+
+            if self._streaming and not self._ring.closed:
+                buffered = self._ring.available
+                if self._min_buffered is None or buffered < self._min_buffered:
+                    self._min_buffered = buffered
+
+            if count < frames:
+                # Underrun or end of audio: pad with silence
+                out[count:] = 0
+                if self._source_done:
+                    return
+                if self._render_finished():
+                    self._source_done = True
+                    self._completions.append((self._generation, self._on_complete, True))
+                    if not self.persistent_stream:
+                        raise sd.CallbackStop
+                elif self._requested_at is None:
+                    # Audio had started but the producer fell behind
+                    self._underruns += 1
+        finally:
+            self._render_lock.release()
+
+    def _count_status(self, status) -> None:
+        """Count a stream status report by flag"""
+        self._status_count += 1
+        self._last_status = status
+        if getattr(status, "output_underflow", False):
+            self._output_underflows += 1
+        if getattr(status, "output_overflow", False):
+            self._output_overflows += 1
+
+    def _record_callback_time(self, elapsed: float) -> None:
+        """Add one callback's execution time to the histogram"""
+        self._callback_histogram[bisect_right(CALLBACK_TIME_BINS_US, elapsed * 1e6)] += 1
+        self._callback_total += elapsed
+        if elapsed > self._callback_max:
+            self._callback_max = elapsed
+
+    def _report_status(self) -> None:
+        """Log stream status flags counted by the audio callback since the last report"""
+        count = self._status_count
+        if count > self._reported_status_count:
+            logger.warning(
+                f"Audio stream reported {count - self._reported_status_count} status "
+                f"events (last: {self._last_status})"
+            )
+            self._reported_status_count = count
+
+    def _record_start_latency(self, time_info) -> None:
+        """Store how long the pending play/resume took to reach the device"""
+        latency = time.perf_counter() - self._requested_at
+        if time_info is not None:
+            # Time until this block is actually heard
+            latency += max(0.0, time_info.outputBufferDacTime - time_info.currentTime)
+        self._start_latency = latency
+        self._requested_at = None
+
+    def _render(self, out: np.ndarray) -> int:
+        """
+        Fill ``out`` with audio at the output rate, pulling source samples as needed
+
+        Work is proportional to ``len(out)``: only the source samples needed
+        for this block are read, stretched and resampled, through
+        preallocated buffers, so the cost of a block does not depend on how
+        much audio is queued.
+
+        Args:
+            out: Output samples to fill
 
-        # Get next chunk of audio
-        remaining = len(self._adjusted_audio) - self._adjusted_position
-        chunk_size = min(frames, remaining)
+        Returns:
+            Number of samples written
+        """
+        resampler = self._resampler
+        if resampler is None:
+            return self._render_source(out)
+
+        filled = 0
+        total = len(out)
+        while filled < total:
+            filled += resampler.read_into(out[filled:])
+            if filled == total or resampler.finished:
+                break
+
+            room = min(resampler.free, len(self._resample_scratch))
+            count = self._render_source(self._resample_scratch[:room])
+            if count:
+                resampler.write(self._resample_scratch[:count])
+            elif self._source_finished():
+                resampler.finish()
+            else:
+                break  # Producer is behind; try again next block
+
+        return filled
+
+    def _render_source(self, out: np.ndarray) -> int:
+        """
+        Fill ``out`` with speed-adjusted audio at the source rate
+
+        Args:
+            out: Output samples to fill
+
+        Returns:
+            Number of samples written
+        """
+        speed = self._speed
+        if not self._stretching:
+            if speed == 1.0:
+                return self._read_source(out)
+            # Start stretching from the current source position
+            self._stretcher.reset()
+            self._stretch_base = self._source_read
+            self._stretching = True
+
+        stretcher = self._stretcher
+        if speed != stretcher.speed:
+            stretcher.set_speed(speed)
+
+        filled = 0
+        total = len(out)
+        while filled < total:
+            filled += stretcher.read_into(out[filled:])
+            if filled == total or stretcher.finished:
+                break
+
+            room = min(stretcher.free, len(self._scratch))
+            count = self._read_source(self._scratch[:room])
+            if count:
+                stretcher.write(self._scratch[:count])
+            elif self._source_exhausted():
+                stretcher.finish()
+            else:
+                break  # Producer is behind; try again next block
+
+        return filled
+
+    def _read_source(self, out: np.ndarray) -> int:
+        """
+        Copy unprocessed source samples from the array or ring buffer
+
+        Args:
+            out: Destination buffer
+
+        Returns:
+            Number of samples copied
+        """
+        if self._streaming:
+            count = self._ring.read_into(out)
+        else:
+            start = self._source_read
+            count = min(len(out), len(self._audio_data) - start)
+            out[:count] = self._audio_data[start : start + count]
+
+        self._source_read += count
+        return count
+
+    def _source_exhausted(self) -> bool:
+        """Whether every source sample has been read"""
+        if self._streaming:
+            return self._ring.drained
+        return self._source_read >= len(self._audio_data)
+
+    def _source_finished(self) -> bool:
+        """Whether the source and any stretched tail have been fully rendered"""
+        if self._stretching:
+            return self._stretcher.finished
+        return self._source_exhausted()
+
+    def _render_finished(self) -> bool:
+        """Whether the source has been fully played, resampled tail included"""
+        if self._resampler is not None:
+            return self._resampler.finished
+        return self._source_finished()
+
+    @staticmethod
+    def _produce(
+        chunks: Iterable[np.ndarray], ring: AudioRingBuffer, index: SentenceIndex | None
+    ) -> None:
+        """
+        Producer thread body: push chunks into a ring buffer
 
-        if chunk_size > 0:
-            chunk = self._adjusted_audio[
-                self._adjusted_position : self._adjusted_position + chunk_size
-            ]
-            outdata[:chunk_size, 0] = chunk
-            self._adjusted_position += chunk_size
+        Args:
+            chunks: Iterable of int16 audio chunks
+            ring: Ring buffer of the source being produced
+            index: Index to record each chunk in as a sentence (None if the
+                caller supplied an index)
+        """
+        try:
+            for chunk in chunks:
+                if ring.closed:
+                    break
+                if index is not None:
+                    index.add(len(chunk))
+                ring.write(chunk)
+        except Exception as e:
+            logger.error(f"Audio producer failed: {e}")
+        finally:
+            ring.close()
+            # Let generator-based producers run their cleanup right away so
+            # upstream work stops as soon as playback is torn down
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
 
-            # Update original position (approximate)
-            self._position += int(chunk_size * self._speed)
+    def _teardown(self) -> None:
+        """Stop rendering the current audio, its producer, and any per-play stream"""
+        # Silence the callback first so it neither plays nor reports
+        # completion of audio that is being torn down
+        with self._render_lock:
+            # Only audio that has not played to the end is cancelled
+            cancels = [self._on_cancel] if not self._source_done else []
+            self._on_cancel = None
+            self._generation += 1
+            self._source_done = True
+            queued = list(self._queue)
+            self._queue.clear()
 
-        # Fill remaining with silence if needed
-        if chunk_size < frames:
-            outdata[chunk_size:, 0] = 0
+        # Stop any existing playback OUTSIDE the lock to avoid deadlock
+        # The stream callbacks may try to acquire the lock
+        old_stream = None
+        old_producer = None
+        with self._lock:
+            if self._stream is not None and not self.persistent_stream:
+                logger.debug("storing_stream_reference_for_cleanup")
+                old_stream = self._stream
+                self._stream = None
+            old_producer = self._producer
+            self._producer = None
 
-    def _on_stream_finished(self) -> None:
-        """Callback when stream finishes"""
+        # Tell the sources to stop waiting for work, then unblock the
+        # producers so they can exit
+        for cancel in cancels + [item.on_cancel for item in queued]:
+            if cancel is not None:
+                cancel()
+        if old_producer is not None:
+            self._ring.abort()
+        for item in queued:
+            if item.ring is not None:
+                item.ring.abort()
+                item.producer.join(PRODUCER_JOIN_TIMEOUT)
+
+        # Close the old stream outside the lock
+        if old_stream is not None:
+            logger.debug("stopping_existing_stream")
+            try:
+                old_stream.stop()
+                old_stream.close()
+            except Exception as e:
+                logger.warning(f"Error closing stream: {e}")
+
+        if old_producer is not None:
+            old_producer.join(PRODUCER_JOIN_TIMEOUT)
+            if old_producer.is_alive():
+                # It still writes to the old ring once its source yields, so
+                # the next stream must not reuse that ring
+                logger.warning("Audio producer is blocked in its source; not waiting for it")
+                with self._lock:
+                    self._ring = self._new_ring()
+
+    def _on_stream_finished(self, generation: int | None = None) -> None:
+        """
+        Callback when stream finishes
+
+        Args:
+            generation: Source generation that finished; completion is ignored
+                if the audio was replaced or stopped in the meantime
+        """
         with self._lock:
+            if generation is not None and generation != self._generation:
+                return
             self._state = PlaybackState.STOPPED
-            self._position = 0
+            self._rewind()
 
+        self._report_status()
         logger.info("Playback completed")
 
         # Call completion callback if set
         if self._completion_callback is not None:
             self._completion_callback()
 
+    def _notify_completions(self) -> None:
+        """Notifier thread body: report completions flagged by the callback"""
+        while True:
+            self._active.wait()
+            time.sleep(NOTIFY_INTERVAL)
+            if self._closing:
+                return
+
+            while self._completions:
+                generation, on_complete, last = self._completions.popleft()
+                # The source really did play to the end, even if it has
+                # been replaced since, so its own callback always runs
+                if on_complete is not None:
+                    try:
+                        on_complete()
+                    except Exception as e:
+                        logger.error(f"Completion callback failed: {e}")
+                if last:
+                    self._on_stream_finished(generation)
+
+            # Idle until playback starts again; re-check after clearing so a
+            # start in between is not missed
+            if self._state != PlaybackState.PLAYING and not self._completions:
+                self._active.clear()
+                if self._state == PlaybackState.PLAYING or self._completions:
+                    self._active.set()
+
     def _on_completion(self) -> None:
         """Public method to trigger completion (for testing)"""
         self._on_stream_finished()
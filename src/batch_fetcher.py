@@ -0,0 +1,360 @@
+"""Concurrent fetching and extraction of reading lists and feeds"""
+import logging
+import queue
+import random
+import threading
+import time
+from collections import Counter, deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urljoin, urlparse
+from xml.etree import ElementTree
+
+import requests
+
+from src.text_extractor import TextExtractor
+
+logger = logging.getLogger(__name__)
+
+# Responses worth retrying: rate limiting and transient server errors
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Longest wait between attempts, including a server's Retry-After
+MAX_BACKOFF = 30.0
+
+# Path endings and segments that mark a URL as a feed rather than a page
+_FEED_SUFFIXES = (".rss", ".atom", ".xml", ".rdf")
+_FEED_SEGMENTS = {"feed", "feeds", "rss", "atom"}
+
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_RSS1 = "{http://purl.org/rss/1.0/}"
+
+
+def parse_feed(xml: bytes | str, base_url: str = "") -> list[str]:
+    """
+    Get the article links of an RSS 2.0, RSS 1.0 (RDF) or Atom feed
+
+    Args:
+        xml: Feed document
+        base_url: URL the feed was fetched from, for relative links
+
+    Returns:
+        Absolute article URLs in feed order
+
+    Raises:
+        ValueError: If the document is not a feed
+    """
+    try:
+        root = ElementTree.fromstring(xml)
+    except ElementTree.ParseError as e:
+        raise ValueError(f"Not a feed: {e}") from e
+
+    if root.tag == "rss":
+        links = [item.findtext("link") for item in root.iter("item")]
+    elif root.tag == f"{_ATOM}feed":
+        links = []
+        for entry in root.iter(f"{_ATOM}entry"):
+            for link in entry.iter(f"{_ATOM}link"):
+                if link.get("rel", "alternate") == "alternate":
+                    links.append(link.get("href"))
+                    break
+    elif root.tag.endswith("}RDF"):
+        links = [item.findtext(f"{_RSS1}link") for item in root.iter(f"{_RSS1}item")]
+    else:
+        raise ValueError(f"Not a feed: root element is {root.tag}")
+
+    return [urljoin(base_url, link.strip()) for link in links if link and link.strip()]
+
+
+def is_feed_url(url: str) -> bool:
+    """
+    Guess from its path whether a URL is a feed (e.g. ``/feed``, ``/index.rss``)
+
+    Args:
+        url: URL to check
+
+    Returns:
+        True if the path looks like a feed's
+    """
+    path = urlparse(url).path.lower().rstrip("/")
+    return path.endswith(_FEED_SUFFIXES) or path.rsplit("/", 1)[-1] in _FEED_SEGMENTS
+
+
+@dataclass
+class FetchResult:
+    """Outcome of fetching and extracting one URL of a batch"""
+
+    url: str
+    text: str | None = None
+    error: Exception | None = None
+    attempts: int = 0
+    elapsed: float = 0.0  # Seconds from submission to completion
+
+    @property
+    def ok(self) -> bool:
+        """Whether text was extracted"""
+        return self.error is None
+
+
+@dataclass
+class _Batch:
+    """Where the results of one ``BatchFetcher.fetch`` call go"""
+
+    started: float
+    results: queue.Queue[FetchResult] = field(default_factory=queue.Queue)
+    cancelled: bool = False  # Consumer gone: skip URLs that have not started
+
+
+class BatchFetcher:
+    """Fetch and extract many URLs at once, yielding each as it completes
+
+    URLs are fetched on a pool of worker threads sharing the extractor's
+    session (and so its connection pool and page cache), with at most
+    ``per_host`` URLs of any one host in progress at a time. A URL is only
+    handed to the workers once its host has a free slot, so a long run of
+    URLs on one host never keeps workers from other hosts' URLs.
+    Connection errors, timeouts, 429 and 5xx responses are retried with
+    exponential backoff and jitter, honouring ``Retry-After``.
+    """
+
+    def __init__(
+        self,
+        extractor: TextExtractor,
+        workers: int = 8,
+        per_host: int = 2,
+        retries: int = 2,
+        backoff: float = 0.5,
+    ):
+        """
+        Initialize batch fetcher
+
+        Args:
+            extractor: Extractor whose session, timeout and cache are used;
+                its ``pool_size`` should be at least ``workers``
+            workers: Number of concurrent fetches
+            per_host: Most concurrent fetches to one host
+            retries: Extra attempts after a transient failure
+            backoff: Seconds before the first retry, doubled for each one
+        """
+        if workers < 1 or per_host < 1:
+            raise ValueError("Worker and per-host counts must be at least 1")
+
+        self.extractor = extractor
+        self.per_host = per_host
+        self.retries = retries
+        self.backoff = backoff
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fetch")
+        self._running: dict[str, int] = {}  # URLs in progress per host
+        self._waiting: dict[str, deque[tuple[str, _Batch]]] = {}  # URLs waiting for a host slot
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+
+    def fetch(self, urls: Iterable[str], timeout: float | None = None) -> Iterator[FetchResult]:
+        """
+        Fetch and extract URLs concurrently
+
+        Failures are reported in the results rather than raised, so one
+        broken link does not lose the rest of the batch.
+
+        Args:
+            urls: Page URLs
+            timeout: Seconds to wait for the whole batch (None for no limit);
+                unfinished URLs are reported with a TimeoutError
+
+        Yields:
+            One result per URL, in completion order
+        """
+        batch = _Batch(time.perf_counter())
+        urls = list(urls)
+        for url in urls:
+            self._schedule(url, batch)
+        logger.info(f"Fetching {len(urls)} URLs")
+
+        deadline = None if timeout is None else batch.started + timeout
+        unfinished = Counter(urls)
+        try:
+            for _ in urls:
+                wait = None if deadline is None else max(0.0, deadline - time.perf_counter())
+                try:
+                    result = batch.results.get(timeout=wait)
+                except queue.Empty:
+                    break
+                unfinished[result.url] -= 1
+                yield result
+
+            batch.cancelled = True
+            elapsed = time.perf_counter() - batch.started
+            for url in unfinished.elements():
+                error = TimeoutError(f"Batch timed out after {timeout}s")
+                yield FetchResult(url, error=error, elapsed=elapsed)
+        finally:
+            # Timed out or consumer stopped early: drop URLs that have not started
+            batch.cancelled = True
+
+    def feed_urls(self, feed_url: str) -> list[str]:
+        """
+        Download a feed and list its articles
+
+        Args:
+            feed_url: RSS or Atom feed URL
+
+        Returns:
+            Article URLs in feed order
+
+        Raises:
+            requests.RequestException: If the feed cannot be downloaded
+            ValueError: If the document is not a feed
+        """
+
+        def download() -> requests.Response:
+            response = self.extractor.session.get(feed_url, timeout=self.extractor.timeout)
+            response.raise_for_status()
+            return response
+
+        response = self._with_retries(feed_url, download)
+        return parse_feed(response.content, base_url=response.url or feed_url)
+
+    def fetch_feed(
+        self, feed_url: str, limit: int | None = None, timeout: float | None = None
+    ) -> Iterator[FetchResult]:
+        """
+        Fetch and extract a feed's articles concurrently
+
+        Args:
+            feed_url: RSS or Atom feed URL
+            limit: Most articles to fetch, newest first as the feed lists them
+            timeout: Seconds to wait for the articles (None for no limit)
+
+        Yields:
+            One result per article, in completion order
+
+        Raises:
+            requests.RequestException: If the feed cannot be downloaded
+            ValueError: If the document is not a feed
+        """
+        urls = self.feed_urls(feed_url)
+        yield from self.fetch(urls[:limit] if limit is not None else urls, timeout)
+
+    def close(self) -> None:
+        """Stop retrying, and report fetches that have not started as failed"""
+        self._closed.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            waiting = [item for host_queue in self._waiting.values() for item in host_queue]
+            self._waiting.clear()
+        for url, batch in waiting:
+            self._abandon(url, batch)
+
+    def _schedule(self, url: str, batch: _Batch) -> None:
+        """Start fetching a URL if its host has a free slot, else queue it for one"""
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            running = self._running.get(host, 0)
+            if running >= self.per_host:
+                self._waiting.setdefault(host, deque()).append((url, batch))
+                return
+            self._running[host] = running + 1
+        self._start(host, url, batch)
+
+    def _start(self, host: str, url: str, batch: _Batch) -> None:
+        """Hand a URL whose host slot is already taken to the workers"""
+
+        def done(future: Future) -> None:
+            if future.cancelled():
+                self._abandon(url, batch)
+
+        try:
+            self._executor.submit(self._run, host, url, batch).add_done_callback(done)
+        except RuntimeError:
+            # Closed in the meantime
+            self._abandon(url, batch)
+            self._release(host)
+
+    def _release(self, host: str) -> None:
+        """Free a host slot, passing it to the host's next waiting URL if any"""
+        with self._lock:
+            waiting = self._waiting.get(host)
+            while waiting and waiting[0][1].cancelled:
+                waiting.popleft()
+            if not waiting:
+                self._waiting.pop(host, None)
+                self._running[host] -= 1
+                if not self._running[host]:
+                    del self._running[host]
+                return
+            url, batch = waiting.popleft()
+        self._start(host, url, batch)
+
+    def _run(self, host: str, url: str, batch: _Batch) -> None:
+        """Worker: fetch one URL of a batch, then free its host slot"""
+        try:
+            if not batch.cancelled:
+                batch.results.put(self._fetch_one(url, batch.started))
+        finally:
+            self._release(host)
+
+    @staticmethod
+    def _abandon(url: str, batch: _Batch) -> None:
+        """Report a URL that will not be fetched because the fetcher was closed"""
+        error = RuntimeError("Batch fetcher was closed")
+        elapsed = time.perf_counter() - batch.started
+        batch.results.put(FetchResult(url, error=error, elapsed=elapsed))
+
+    def _fetch_one(self, url: str, started: float) -> FetchResult:
+        """Worker: extract one URL, retrying transient failures"""
+        result = FetchResult(url)
+
+        def extract() -> str:
+            result.attempts += 1
+            return self.extractor.extract(url)
+
+        try:
+            result.text = self._with_retries(url, extract)
+        except Exception as e:
+            logger.warning(f"Could not fetch {url}: {e}")
+            result.error = e
+        result.elapsed = time.perf_counter() - started
+        return result
+
+    def _with_retries(self, url: str, request: Callable[[], Any]) -> Any:
+        """
+        Run a request, retrying transient failures with backoff
+
+        Args:
+            url: URL being requested, for logging
+            request: Makes the request; raises on failure
+
+        Returns:
+            The request's result
+        """
+        attempt = 1
+        while True:
+            try:
+                return request()
+            except requests.RequestException as e:
+                if attempt > self.retries or not self._is_transient(e) or self._closed.is_set():
+                    raise
+                delay = self._retry_delay(e, attempt)
+                logger.info(f"Retrying {url} in {delay:.1f}s after attempt {attempt}: {e}")
+                if self._closed.wait(delay):
+                    raise
+                attempt += 1
+
+    @staticmethod
+    def _is_transient(error: requests.RequestException) -> bool:
+        """Whether a failed request may succeed if tried again"""
+        if isinstance(error, requests.HTTPError):
+            response = error.response
+            return response is not None and response.status_code in RETRY_STATUSES
+        return isinstance(error, (requests.ConnectionError, requests.Timeout))
+
+    def _retry_delay(self, error: requests.RequestException, attempt: int) -> float:
+        """Seconds to wait before the next attempt"""
+        response = error.response if isinstance(error, requests.HTTPError) else None
+        retry_after = response.headers.get("Retry-After", "") if response is not None else ""
+        if retry_after.isdigit():
+            return min(float(retry_after), MAX_BACKOFF)
+        # Jitter so retries from one batch do not hit the host together
+        return random.uniform(0.5, 1.0) * min(self.backoff * 2 ** (attempt - 1), MAX_BACKOFF)
@@ -0,0 +1,118 @@
+"""Incremental HTML to text conversion for pages that are still downloading"""
+import re
+from collections.abc import Collection
+from html.parser import HTMLParser
+
+from src.readability import BLOCK_TAGS, is_boilerplate
+
+# Elements that never have an end tag
+VOID_TAGS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "param",
+    "source", "track", "wbr",
+}  # fmt: skip
+
+# Elements that end a paragraph where they start and end
+BREAK_TAGS = BLOCK_TAGS | {"caption", "dd", "dt", "figcaption", "li", "title", "tr"}
+
+# A blank line, which is where cleaned text splits into paragraphs
+_PARAGRAPH_BREAK = re.compile(r"\n[^\S\n]*\n")
+
+
+class ParagraphStream(HTMLParser):
+    """Turn HTML fed in pieces into text, released a paragraph at a time
+
+    Text is kept in document order without excluded elements (as in
+    ``TextExtractor.extract_html``), plus blocks whose class, id or role
+    mark them as boilerplate. Block elements start a new paragraph, so
+    even a minified page is released block by block. Whole-page main
+    content scoring is not possible before the page is complete and is not
+    applied.
+
+    Unclosed elements are closed by the end tag of an element enclosing
+    them, and a block element closes an open ``<p>``, as browsers do.
+    """
+
+    def __init__(self, excluded: Collection[str]):
+        """
+        Initialize stream
+
+        Args:
+            excluded: Tags dropped along with their content
+        """
+        super().__init__(convert_charrefs=True)
+        self._excluded = excluded
+        self._open: list[str] = []  # Tags of the open elements, outermost first
+        self._skip_depth: int | None = None  # Open elements when skipping started
+        self._parts: list[str] = []
+        self._pending = ""  # Text after the last paragraph break
+        self._scanned = 0  # Offset in _pending searched for a break so far
+
+    def take(self, final: bool = False) -> str:
+        """
+        Remove the text of the paragraphs completed so far
+
+        Args:
+            final: Take all remaining text (after ``close()``)
+
+        Returns:
+            Text up to the last paragraph break, whitespace untouched
+        """
+        self._pending += "".join(self._parts)
+        self._parts.clear()
+        if final:
+            text, self._pending, self._scanned = self._pending, "", 0
+            return text
+
+        end = None
+        for match in _PARAGRAPH_BREAK.finditer(self._pending, self._scanned):
+            end = match.end()
+        if end is None:
+            # A break can only start at the last newline, which may not be
+            # followed by its blank line yet
+            self._scanned = max(0, self._pending.rfind("\n"))
+            return ""
+
+        text, self._pending = self._pending[:end], self._pending[end:]
+        self._scanned = 0
+        return text
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag in VOID_TAGS:
+            return
+        if tag in BREAK_TAGS and self._open and self._open[-1] == "p":
+            self._close(len(self._open) - 1)
+
+        self._open.append(tag)
+        if self._skip_depth is not None:
+            return
+        attributes = dict(attrs)
+        hint = f"{attributes.get('class') or ''} {attributes.get('id') or ''}"
+        if (
+            tag in self._excluded
+            or tag == "template"
+            or is_boilerplate(tag, hint, attributes.get("role") or "")
+        ):
+            self._skip_depth = len(self._open)
+        elif tag in BREAK_TAGS:
+            self._parts.append("\n\n")
+
+    def handle_endtag(self, tag: str) -> None:
+        for index in range(len(self._open) - 1, -1, -1):
+            if self._open[index] == tag:
+                self._close(index)
+                return
+
+    def handle_data(self, data: str) -> None:
+        if self._skip_depth is None:
+            self._parts.append(data)
+
+    def _close(self, index: int) -> None:
+        """Close the open element at ``index`` and every element inside it"""
+        tag = self._open[index]
+        del self._open[index:]
+        if self._skip_depth is not None:
+            if len(self._open) >= self._skip_depth:
+                return
+            self._skip_depth = None
+        if tag in BREAK_TAGS:
+            self._parts.append("\n\n")
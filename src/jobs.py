@@ -0,0 +1,236 @@
+"""Background job execution with cancellation and completion events."""
+
+import itertools
+import queue
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class JobState(Enum):
+    """Job lifecycle state."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class JobQueueFullError(Exception):
+    """Raised when a job is submitted while the queue is full."""
+
+    pass
+
+
+@dataclass
+class JobEvent:
+    """Job state change posted to the event sink."""
+
+    job_id: int
+    state: JobState
+    result: Any = None
+    error: Exception | None = None
+
+
+@dataclass
+class _Job:
+    """Queued unit of work."""
+
+    job_id: int
+    func: Callable[[threading.Event], Any]
+    cancel_event: threading.Event
+    state: JobState = JobState.QUEUED
+
+
+class JobExecutor:
+    """Run jobs on worker threads, away from the tkinter main thread.
+
+    Jobs are callables that receive a ``threading.Event`` which is set when
+    the job is cancelled; long-running jobs should check it between steps.
+    Every state change after queueing is reported through ``event_sink``,
+    which is called on the worker thread and must be thread-safe (the app
+    passes a function that puts the event on its UI queue).
+    """
+
+    def __init__(
+        self,
+        event_sink: Callable[[JobEvent], None],
+        workers: int = 2,
+        max_pending: int = 4,
+    ):
+        """Initialize JobExecutor.
+
+        Args:
+            event_sink: Thread-safe callable receiving JobEvent updates
+            workers: Number of worker threads
+            max_pending: Maximum number of queued (not yet running) jobs
+        """
+        if workers < 1:
+            raise ValueError("Worker count must be at least 1")
+
+        self._event_sink = event_sink
+        self._queue: queue.Queue[_Job | None] = queue.Queue(maxsize=max_pending)
+        self._jobs: dict[int, _Job] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._shutdown = False
+
+        self._workers = [
+            threading.Thread(target=self._worker, name=f"job-worker-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+        logger.debug("job_executor_started", workers=workers, max_pending=max_pending)
+
+    def submit(self, func: Callable[[threading.Event], Any], preempt: bool = False) -> int:
+        """Queue a job for execution.
+
+        Args:
+            func: Callable receiving the job's cancel event
+            preempt: Cancel all queued and running jobs first
+
+        Returns:
+            Job ID
+
+        Raises:
+            JobQueueFullError: If the pending queue is full
+            RuntimeError: If the executor has been shut down
+        """
+        if self._shutdown:
+            raise RuntimeError("Executor has been shut down")
+
+        if preempt:
+            self.cancel_all()
+
+        job = _Job(job_id=next(self._ids), func=func, cancel_event=threading.Event())
+        with self._lock:
+            self._jobs[job.job_id] = job
+
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full as e:
+            with self._lock:
+                del self._jobs[job.job_id]
+            raise JobQueueFullError("Job queue is full") from e
+
+        logger.debug("job_submitted", job_id=job.job_id, preempt=preempt)
+        return job.job_id
+
+    def cancel(self, job_id: int) -> bool:
+        """Request cancellation of a job.
+
+        Queued jobs never start; running jobs see their cancel event set.
+
+        Args:
+            job_id: ID returned by submit()
+
+        Returns:
+            True if the job was still active, False otherwise
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            return False
+
+        job.cancel_event.set()
+        logger.debug("job_cancel_requested", job_id=job_id)
+        return True
+
+    def cancel_all(self) -> None:
+        """Request cancellation of every queued and running job."""
+        with self._lock:
+            jobs = list(self._jobs.values())
+        for job in jobs:
+            job.cancel_event.set()
+
+    def state(self, job_id: int) -> JobState | None:
+        """Get the state of an active job.
+
+        Args:
+            job_id: ID returned by submit()
+
+        Returns:
+            Current state, or None if the job has finished
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+        return job.state if job is not None else None
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Cancel outstanding jobs and stop the workers.
+
+        Args:
+            wait: Block until worker threads have exited
+        """
+        self._shutdown = True
+        self.cancel_all()
+        for _ in self._workers:
+            self._queue.put(None)
+        if wait:
+            for worker in self._workers:
+                worker.join()
+
+    def _worker(self) -> None:
+        """Worker thread body."""
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            self._run(job)
+
+    def _run(self, job: _Job) -> None:
+        """Run a single job and report its outcome.
+
+        Args:
+            job: Job to run
+        """
+        if job.cancel_event.is_set():
+            self._finish(job, JobEvent(job.job_id, JobState.CANCELLED))
+            return
+
+        job.state = JobState.RUNNING
+        self._emit(JobEvent(job.job_id, JobState.RUNNING))
+
+        try:
+            result = job.func(job.cancel_event)
+        except Exception as e:
+            logger.error("job_failed", job_id=job.job_id, error=str(e), exc_info=True)
+            self._finish(job, JobEvent(job.job_id, JobState.FAILED, error=e))
+            return
+
+        if job.cancel_event.is_set():
+            self._finish(job, JobEvent(job.job_id, JobState.CANCELLED))
+        else:
+            self._finish(job, JobEvent(job.job_id, JobState.COMPLETED, result=result))
+
+    def _finish(self, job: _Job, event: JobEvent) -> None:
+        """Record a terminal state and report it.
+
+        Args:
+            job: Finished job
+            event: Terminal event
+        """
+        job.state = event.state
+        with self._lock:
+            self._jobs.pop(job.job_id, None)
+        self._emit(event)
+
+    def _emit(self, event: JobEvent) -> None:
+        """Send an event to the sink, never letting it kill the worker.
+
+        Args:
+            event: Event to send
+        """
+        try:
+            self._event_sink(event)
+        except Exception as e:
+            logger.error("job_event_sink_failed", job_id=event.job_id, error=str(e))
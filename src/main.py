@@ -17,20 +17,30 @@ This keeps all tkinter operations on the main thread while allowing
 pystray to function in a separate context.
 """
 
+import multiprocessing
 import queue
 import sys
+import threading
+import time
 import tkinter as tk
 from pathlib import Path
 
-from src.audio_player import AudioPlayer
+from src.audio_cache import AudioCache
+from src.audio_player import AudioPlayer, PlaybackState
+from src.batch_fetcher import BatchFetcher, is_feed_url
 from src.hotkeys import HotkeyManager
+from src.jobs import JobEvent, JobExecutor, JobState
 from src.logger import configure_logging, get_logger
+from src.page_cache import PageCache
+from src.pipeline import ReadingPipeline
 from src.settings import Settings
 from src.text_extractor import TextExtractor
 from src.tray import TrayApplication
 from src.tts_engine import PiperTTSEngine
 from src.ui.input_window import InputWindow
 from src.ui.settings_window import SettingsWindow
+from src.voice_catalog import VoiceCatalog
+from src.voice_pool import VoicePool
 
 logger = get_logger(__name__)
 
@@ -38,6 +48,7 @@ logger = get_logger(__name__)
 MSG_SHOW_INPUT_WINDOW = "show_input_window"
 MSG_SHOW_SETTINGS_WINDOW = "show_settings_window"
 MSG_QUIT = "quit"
+MSG_JOB_EVENT = "job_event"
 
 
 class PiperTTSApp:
@@ -45,6 +56,7 @@ class PiperTTSApp:
 
     def __init__(self):
         """Initialize application."""
+        self._started_at = time.perf_counter()
         logger.info("initializing_piper_tts_app")
 
         # Thread-safe queue for cross-thread communication
@@ -70,26 +82,72 @@ class PiperTTSApp:
         else:
             # Running in development
             voices_dir = Path(__file__).parent.parent / "voices"
-        self._tts_engine = PiperTTSEngine(str(voices_dir))
-
-        # Load voice from settings (or first available voice)
-        voice_name = self._settings.get("voice")
-        available_voices = self._tts_engine.discover_voices()
-        if voice_name and voice_name in available_voices:
-            self._tts_engine.load_voice(voice_name)
-            logger.debug("voice_loaded_from_settings", voice=voice_name)
-        elif available_voices:
-            # Load first available voice if configured voice not found
-            self._tts_engine.load_voice(available_voices[0])
-            logger.info("voice_loaded_fallback", voice=available_voices[0])
-        else:
-            logger.warning("no_voices_available")
+        cache_settings = self._settings.get("cache")
+        audio_cache = AudioCache(
+            Path(cache_settings["directory"]).expanduser(),
+            memory_bytes=cache_settings["memory_mb"] * 1024 * 1024,
+            disk_bytes=cache_settings["disk_mb"] * 1024 * 1024,
+        )
+        pool_settings = self._settings.get("voice_pool")
+        voice_pool = VoicePool(
+            voices_dir,
+            max_voices=pool_settings["max_voices"],
+            memory_budget=pool_settings["memory_mb"] * 1024 * 1024,
+        )
+        voice_catalog = VoiceCatalog(
+            voices_dir, index_path=Path(self._settings.get("voice_index")).expanduser()
+        )
+        self._tts_engine = PiperTTSEngine(
+            str(voices_dir),
+            workers=self._settings.get("synthesis_workers"),
+            cache=audio_cache,
+            voice_pool=voice_pool,
+            catalog=voice_catalog,
+        )
 
-        # Initialize audio player
-        self._audio_player = AudioPlayer()
+        # Load and warm up the voice in the background so the tray appears
+        # immediately; read jobs wait on this event before synthesizing
+        self._voice_ready = threading.Event()
+        self._first_request = True
+        threading.Thread(
+            target=self._load_voice_in_background, name="voice-loader", daemon=True
+        ).start()
+
+        # Initialize audio player; a persistent stream keeps the device open
+        # so play/pause/resume only flip state instead of reopening it
+        audio_settings = self._settings.get("audio")
+        self._audio_player = AudioPlayer(
+            persistent_stream=audio_settings["persistent_stream"],
+            latency=audio_settings["latency"],
+            blocksize=audio_settings["blocksize"],
+            output_rate=audio_settings["output_rate"],
+        )
 
         # Initialize text extractor
-        self._text_extractor = TextExtractor()
+        extraction_settings = self._settings.get("extraction")
+        self._text_extractor = TextExtractor(
+            parser=extraction_settings["parser"],
+            main_content=extraction_settings["main_content"],
+            max_bytes=extraction_settings["max_page_mb"] * 1024 * 1024,
+            pool_size=extraction_settings["batch_workers"],
+            cache=PageCache(
+                Path(extraction_settings["cache_directory"]).expanduser(),
+                max_bytes=extraction_settings["cache_mb"] * 1024 * 1024,
+            ),
+        )
+        # Reading lists and feeds are fetched concurrently
+        self._batch_fetcher = BatchFetcher(
+            self._text_extractor,
+            workers=extraction_settings["batch_workers"],
+            per_host=extraction_settings["per_host"],
+            retries=extraction_settings["retries"],
+        )
+
+        # Extraction and synthesis run on worker threads so the tkinter
+        # mainloop keeps processing the UI queue while a job is in flight
+        self._job_executor = JobExecutor(
+            event_sink=lambda event: self._ui_queue.put((MSG_JOB_EVENT, event))
+        )
 
         # Initialize hotkey manager (disabled on macOS due to threading conflicts)
         self._hotkey_manager = HotkeyManager()
@@ -102,6 +160,37 @@ class PiperTTSApp:
 
         logger.info("piper_tts_app_initialized")
 
+    def _load_voice_in_background(self):
+        """Load the configured voice and warm up its ONNX session."""
+        try:
+            # Load voice from settings (or first available voice)
+            voice_name = self._settings.get("voice")
+            available_voices = self._tts_engine.discover_voices()
+            if voice_name and voice_name in available_voices:
+                self._tts_engine.load_voice(voice_name)
+                logger.debug("voice_loaded_from_settings", voice=voice_name)
+            elif available_voices:
+                # Load first available voice if configured voice not found
+                self._tts_engine.load_voice(available_voices[0])
+                logger.info("voice_loaded_fallback", voice=available_voices[0])
+            else:
+                logger.warning("no_voices_available")
+                return
+
+            loaded_ms = (time.perf_counter() - self._started_at) * 1000
+            warm_up_ms = self._tts_engine.warm_up() * 1000
+            logger.info(
+                "voice_ready",
+                voice=self._tts_engine.current_voice,
+                loaded_ms=round(loaded_ms),
+                warm_up_ms=round(warm_up_ms),
+                since_start_ms=round((time.perf_counter() - self._started_at) * 1000),
+            )
+        except Exception as e:
+            logger.error("voice_preload_failed", error=str(e), exc_info=True)
+        finally:
+            self._voice_ready.set()
+
     def _setup_event_handlers(self):
         """Wire up all event handlers."""
         # Register hotkeys (disabled on macOS - see run() method)
@@ -113,6 +202,22 @@ class PiperTTSApp:
                 )
             if "stop" in shortcuts:
                 self._hotkey_manager.register(shortcuts["stop"], self._on_stop)
+            if "speed_up" in shortcuts:
+                self._hotkey_manager.register(
+                    shortcuts["speed_up"], lambda: self._on_change_speed(1)
+                )
+            if "speed_down" in shortcuts:
+                self._hotkey_manager.register(
+                    shortcuts["speed_down"], lambda: self._on_change_speed(-1)
+                )
+            if "next_sentence" in shortcuts:
+                self._hotkey_manager.register(
+                    shortcuts["next_sentence"], lambda: self._on_skip_sentence(1)
+                )
+            if "previous_sentence" in shortcuts:
+                self._hotkey_manager.register(
+                    shortcuts["previous_sentence"], lambda: self._on_skip_sentence(-1)
+                )
 
         # Connect tray menu actions
         # IMPORTANT: These callbacks run in pystray's thread, NOT the main thread.
@@ -151,10 +256,17 @@ class PiperTTSApp:
                     msg = self._ui_queue.get_nowait()
                     logger.debug("processing_queue_message", message=msg)
 
+                    # Messages are either a bare type or a (type, payload) tuple
+                    payload = None
+                    if isinstance(msg, tuple):
+                        msg, payload = msg
+
                     if msg == MSG_SHOW_INPUT_WINDOW:
                         self._show_input_window()
                     elif msg == MSG_SHOW_SETTINGS_WINDOW:
                         self._on_open_settings()
+                    elif msg == MSG_JOB_EVENT:
+                        self._on_job_event(payload)
                     elif msg == MSG_QUIT:
                         self._shutdown()
                         return  # Don't schedule another check
@@ -169,24 +281,55 @@ class PiperTTSApp:
 
     def _on_play_pause(self):
         """Handle play/pause action."""
-        state = self._audio_player.get_state()
-        logger.info("play_pause_clicked", state=state)
+        state = self._audio_player.state
+        logger.info("play_pause_clicked", state=state.value)
 
-        if state == "STOPPED":
+        if state == PlaybackState.STOPPED:
             # Queue showing input window (don't call directly from pystray thread)
             self._queue_show_input_window()
-        elif state == "PLAYING":
+        elif state == PlaybackState.PLAYING:
             # Pause
             self._audio_player.pause()
-        elif state == "PAUSED":
+        elif state == PlaybackState.PAUSED:
             # Resume
             self._audio_player.resume()
 
     def _on_stop(self):
-        """Handle stop action."""
+        """Handle stop action.
+
+        Cancels the running read as well as playback, so extraction and
+        synthesis stop at the same time as the audio.
+        """
         logger.info("stop_clicked")
+        self._job_executor.cancel_all()
         self._audio_player.stop()
 
+    def _on_skip_sentence(self, count: int):
+        """Handle next/previous sentence actions.
+
+        Args:
+            count: Sentences to move by (negative goes back)
+        """
+        sentence = self._audio_player.skip_sentence(count)
+        logger.info("sentence_skipped", count=count, sentence=sentence)
+
+    def _on_change_speed(self, steps: int):
+        """Handle speed up/down actions.
+
+        The settings speed is built into synthesis; the player's speed is a
+        live multiplier on top of it. Steps and limits apply to the speed
+        heard (the two combined), which stays within the settings window's
+        range, and the change applies from the next frame.
+
+        Args:
+            steps: Speed steps to move by (negative slows down)
+        """
+        base = self._settings.get("speed")
+        speed = base * self._audio_player.speed + steps * Settings.SPEED_STEP
+        speed = min(max(speed, Settings.MIN_SPEED), Settings.MAX_SPEED)
+        self._audio_player.set_speed(speed / base)
+        logger.info("speed_changed", speed=speed, player_speed=self._audio_player.speed)
+
     def _on_open_settings(self):
         """Open settings window.
 
@@ -194,17 +337,66 @@ class PiperTTSApp:
         """
         logger.info("showing_settings_window")
         available_voices = self._tts_engine.discover_voices()
-        settings_window = SettingsWindow(self._settings, available_voices)
+        settings_window = SettingsWindow(
+            self._settings, available_voices, save_callback=self._on_settings_saved
+        )
         settings_window.show()
 
-        # Reload voice if changed
+    def _on_settings_saved(self):
+        """Apply saved settings (runs on the main thread).
+
+        A newly chosen voice is loaded on a job worker so the UI stays
+        responsive. The switch preempts the current read, so a read never
+        changes voice or sample rate partway through.
+
+        The saved speed replaces any adjustment made with the speed
+        shortcuts, so the player's multiplier goes back to 1.
+        """
+        self._audio_player.set_speed(1.0)
+
         new_voice = self._settings.get("voice")
         if new_voice and new_voice != self._tts_engine.current_voice:
-            self._tts_engine.load_voice(new_voice)
+            job_id = self._job_executor.submit(
+                lambda cancel_event: self._switch_voice(new_voice, cancel_event), preempt=True
+            )
+            logger.debug("voice_switch_queued", job_id=job_id, voice=new_voice)
+
+    def _switch_voice(self, voice: str, cancel_event: threading.Event):
+        """Load a voice chosen in the settings (runs on a job worker thread).
+
+        Waits for the startup load first, so it can't win the race; a
+        failure is reported through the job's FAILED event.
+
+        Args:
+            voice: Voice name
+            cancel_event: Set when the job is cancelled
+        """
+        while not self._voice_ready.wait(0.1):
+            if cancel_event.is_set():
+                return
+
+        if voice != self._tts_engine.current_voice:
+            self._tts_engine.load_voice(voice)
+            logger.info(
+                "voice_switched",
+                voice=voice,
+                pool_resident_bytes=self._tts_engine.voice_pool.resident_sizes(),
+            )
 
     def _on_playback_complete(self):
         """Handle playback completion."""
-        logger.debug("playback_complete")
+        stats = self._audio_player.stats()
+        logger.info(
+            "playback_complete",
+            callbacks=stats.callbacks,
+            underruns=stats.underruns,
+            output_underflows=stats.output_underflows,
+            output_overflows=stats.output_overflows,
+            avg_callback_us=round(stats.avg_callback_time * 1e6, 1),
+            max_callback_us=round(stats.max_callback_time * 1e6, 1),
+            min_buffered=stats.min_buffered,
+        )
+        self._audio_player.reset_stats()
 
     def _show_input_window(self):
         """Show input window for text/URL entry.
@@ -219,31 +411,143 @@ class PiperTTSApp:
         input_window.show()
 
     def _on_text_submitted(self, text: str):
-        """Handle text submission from input window."""
-        logger.info("text_submitted", length=len(text))
+        """Handle text submission from input window.
 
-        # Extract text (handles URLs)
-        logger.debug("extracting_text", is_url=text.startswith("http"))
-        extracted_text = self._text_extractor.extract(text)
-        logger.info("text_extracted", extracted_length=len(extracted_text))
+        The work is queued on the job executor; a new submission preempts
+        whatever is currently being read, unless ``queue_reads`` is set, in
+        which case it plays straight after the current reading.
+        """
+        queue_reads = bool(self._settings.get("queue_reads"))
+        logger.info("text_submitted", length=len(text), queued=queue_reads)
+        job_id = self._job_executor.submit(
+            lambda cancel_event: self._read_aloud(text, cancel_event, enqueue=queue_reads),
+            preempt=not queue_reads,
+        )
+        logger.debug("read_job_queued", job_id=job_id)
+
+    def _read_aloud(self, text: str, cancel_event: threading.Event, enqueue: bool = False):
+        """Extract, synthesize and play text (runs on a job worker thread).
+
+        Extraction, segmentation, synthesis and playback run as concurrent
+        pipeline stages, so the first paragraph plays while later ones are
+        still being synthesized. A reading list (several URLs, one per
+        line) or a feed URL is fetched concurrently, and each article is
+        read as soon as it has been fetched, queued behind the previous one.
 
-        # Synthesize with current speed
+        Args:
+            text: URL, reading list or plain text to read
+            cancel_event: Set when the job is cancelled or preempted
+            enqueue: Queue the audio behind the current playback
+        """
+        urls = self._reading_list(text)
+
+        # The first request may arrive while the voice is still loading
+        while not self._voice_ready.wait(0.1):
+            if cancel_event.is_set():
+                return
+
+        if urls is None:
+            self._run_pipeline(text, cancel_event, enqueue)
+            return
+
+        for result in self._batch_fetcher.fetch(urls):
+            if cancel_event.is_set():
+                return
+            if not result.ok:
+                logger.warning("article_fetch_failed", url=result.url, error=str(result.error))
+                continue
+            logger.info("article_fetched", url=result.url, elapsed_ms=round(result.elapsed * 1000))
+            self._run_pipeline(result.text, cancel_event, enqueue)
+            # Later articles play after this one
+            enqueue = True
+
+    def _reading_list(self, text: str) -> list[str] | None:
+        """Get the articles to fetch as a batch.
+
+        Args:
+            text: Submitted text
+
+        Returns:
+            Article URLs if the text is several URLs (one per line) or
+            feed URLs, otherwise None
+        """
+        lines = [line.strip() for line in text.splitlines() if line.strip()]
+        if not lines or not all(self._text_extractor.is_url(line) for line in lines):
+            return None
+        if len(lines) == 1 and not is_feed_url(lines[0]):
+            return None
+
+        feed_limit = self._settings.get("extraction")["feed_limit"]
+        urls = []
+        for line in lines:
+            if is_feed_url(line):
+                try:
+                    urls.extend(self._batch_fetcher.feed_urls(line)[:feed_limit])
+                    continue
+                except ValueError:
+                    # Not a feed after all; read it as a page
+                    pass
+            urls.append(line)
+        logger.info("reading_list", articles=len(urls))
+        return urls
+
+    def _run_pipeline(self, text: str, cancel_event: threading.Event, enqueue: bool):
+        """Read one text through the pipeline and log its latencies.
+
+        Args:
+            text: URL or plain text to read
+            cancel_event: Set when the job is cancelled or preempted
+            enqueue: Queue the audio behind the current playback
+        """
         speed = self._settings.get("speed")
-        logger.info("starting_synthesis", text_length=len(extracted_text), speed=speed)
-        audio_data, sample_rate = self._tts_engine.synthesize(extracted_text, speed)
-        logger.info("synthesis_complete", audio_samples=len(audio_data), sample_rate=sample_rate)
+        logger.info("starting_pipeline", length=len(text), speed=speed)
+        pipeline = ReadingPipeline(
+            self._text_extractor,
+            self._tts_engine,
+            self._audio_player,
+            streaming=self._settings.get("extraction")["streaming"],
+        )
+        pipeline.run(text, speed, cancel_event, enqueue=enqueue)
+
+        if pipeline.first_audio_latency is not None:
+            logger.info(
+                "time_to_first_audio",
+                latency_ms=round(pipeline.first_audio_latency * 1000),
+                first_request=self._first_request,
+            )
+        if self._audio_player.start_latency is not None:
+            logger.info(
+                "playback_start_latency",
+                latency_ms=round(self._audio_player.start_latency * 1000, 1),
+                persistent_stream=self._audio_player.persistent_stream,
+            )
+            self._first_request = False
+
+        cache_stats = self._tts_engine.cache.stats()
+        logger.info(
+            "pipeline_finished",
+            cache_hit_rate=round(cache_stats.hit_rate, 3),
+            cache_misses=cache_stats.misses,
+        )
 
-        # Play
-        logger.info("starting_playback")
-        self._audio_player.play(audio_data)
-        logger.info("playback_started")
+    def _on_job_event(self, event: JobEvent):
+        """Handle a job state change (runs on the main thread)."""
+        if event.state == JobState.FAILED:
+            logger.error("read_job_failed", job_id=event.job_id, error=str(event.error))
+        else:
+            logger.debug("read_job_event", job_id=event.job_id, state=event.state.value)
 
     def _shutdown(self):
         """Shutdown the application gracefully."""
         logger.info("shutting_down")
 
-        # Stop audio playback
-        self._audio_player.stop()
+        # Cancel in-flight jobs and fetches, and stop audio playback
+        self._job_executor.shutdown(wait=False)
+        self._batch_fetcher.close()
+        self._audio_player.close()
+
+        # Release synthesis worker processes
+        self._tts_engine.close()
 
         # Stop hotkey listener if running
         self._hotkey_manager.stop()
@@ -283,6 +587,11 @@ class PiperTTSApp:
         # On macOS, run_detached() is required when integrating with other mainloops
         logger.info("starting_tray_detached")
         self._tray_app.run_detached()
+        logger.info(
+            "tray_ready",
+            cold_start_ms=round((time.perf_counter() - self._started_at) * 1000),
+            voice_ready=self._voice_ready.is_set(),
+        )
 
         # Run tkinter mainloop on the main thread (REQUIRED on macOS)
         # This is the primary event loop - all GUI operations happen here
@@ -294,6 +603,8 @@ class PiperTTSApp:
 
 def main():
     """Entry point."""
+    # Synthesis workers are spawned processes; needed for frozen app bundles
+    multiprocessing.freeze_support()
     configure_logging("INFO")
     logger.info("piper_tts_starting")
 
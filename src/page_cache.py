@@ -0,0 +1,408 @@
+"""On-disk HTTP cache of fetched pages and their extracted text"""
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_DIRECTIVE = re.compile(r'([\w-]+)\s*(?:=\s*("[^"]*"|[^,\s]*))?')
+
+# Cap on the freshness guessed from Last-Modified when a response has no
+# explicit lifetime
+MAX_HEURISTIC_LIFETIME = 24 * 60 * 60
+
+
+def parse_cache_control(value: str | None) -> dict[str, str | None]:
+    """
+    Parse a Cache-Control header
+
+    Args:
+        value: Header value
+
+    Returns:
+        Lowercase directive names mapped to their argument (None if bare)
+    """
+    if not value:
+        return {}
+    return {
+        name.lower(): argument.strip('"') if argument else None
+        for name, argument in _DIRECTIVE.findall(value)
+    }
+
+
+def _http_date(value: str | None) -> float | None:
+    """Parse an HTTP date header into epoch seconds"""
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def freshness(headers: Mapping[str, str], now: float) -> float | None:
+    """
+    Work out how long a response may be served without revalidation
+
+    Follows RFC 9111 for a private cache: ``no-store`` forbids storing,
+    ``no-cache`` stores but always revalidates, then ``max-age``,
+    ``Expires`` and finally 10% of the time since ``Last-Modified``.
+
+    Args:
+        headers: Response headers (case-insensitive mapping)
+        now: Current time in epoch seconds
+
+    Returns:
+        Epoch seconds the response is fresh until, or None if it must not
+        be stored
+    """
+    directives = parse_cache_control(headers.get("Cache-Control"))
+    if "no-store" in directives:
+        return None
+
+    date = _http_date(headers.get("Date")) or now
+    if "no-cache" in directives:
+        lifetime = 0.0
+    elif (directives.get("max-age") or "").isdigit():
+        lifetime = float(directives["max-age"])
+    elif "Expires" in headers:
+        # An invalid Expires means already expired
+        expires = _http_date(headers.get("Expires"))
+        lifetime = expires - date if expires is not None else 0.0
+    elif (last_modified := _http_date(headers.get("Last-Modified"))) is not None:
+        lifetime = min(0.1 * max(0.0, date - last_modified), MAX_HEURISTIC_LIFETIME)
+    else:
+        lifetime = 0.0
+
+    age = headers.get("Age", "")
+    lifetime -= float(age) if age.isdigit() else 0.0
+    return now + max(0.0, lifetime)
+
+
+@dataclass
+class CachedPage:
+    """Metadata and extracted text of a cached response"""
+
+    url: str
+    etag: str | None = None
+    last_modified: str | None = None
+    expires: float = 0.0  # Epoch seconds the response is fresh until
+    encoding: str | None = None
+    text: str | None = None
+    parser: str | None = None  # Extraction settings (parser backend) behind the text
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        """Whether the response can be used without revalidating it"""
+        return (now if now is not None else time.time()) < self.expires
+
+    def validators(self) -> dict[str, str]:
+        """
+        Get headers for a conditional request
+
+        Returns:
+            If-None-Match / If-Modified-Since headers (empty if the response
+            had no validators)
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class PageCache:
+    """Size-capped LRU disk cache of HTTP responses and their extracted text
+
+    Each entry is a JSON metadata file (validators, expiry, extracted text)
+    next to the raw response body. A fresh entry with text for the current
+    parser is served with neither a request nor a parse; a stale one is
+    revalidated with a conditional request, so an unchanged page costs a
+    304. Least recently used entries are evicted once the files exceed
+    ``max_bytes``.
+    """
+
+    def __init__(self, cache_dir: Path | str, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialize page cache
+
+        Args:
+            cache_dir: Directory for the cache files
+            max_bytes: Size cap for all entries together
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, int] = OrderedDict()  # key -> bytes on disk
+        self._size = 0
+        self._lock = threading.Lock()
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._scan()
+
+    @property
+    def size(self) -> int:
+        """Get the bytes used on disk"""
+        return self._size
+
+    @staticmethod
+    def key(url: str) -> str:
+        """
+        Compute the file name stem of a URL's entry
+
+        Args:
+            url: Page URL
+
+        Returns:
+            Hex digest
+        """
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def get(self, url: str) -> CachedPage | None:
+        """
+        Look up a page, fresh or stale
+
+        Args:
+            url: Page URL
+
+        Returns:
+            Cached metadata and text, or None if the URL is not cached
+        """
+        key = self.key(url)
+        with self._lock:
+            page = self._read_meta(key)
+            if page is not None:
+                self._entries.move_to_end(key)
+            return page
+
+    def body(self, url: str) -> bytes | None:
+        """
+        Read a cached response body
+
+        Args:
+            url: Page URL
+
+        Returns:
+            Raw body, or None if the URL is not cached
+        """
+        key = self.key(url)
+        with self._lock:
+            if key not in self._entries:
+                return None
+            try:
+                return self._path(key, ".body").read_bytes()
+            except OSError as e:
+                logger.warning(f"Dropping unreadable page cache entry {key}: {e}")
+                self._remove(key)
+                return None
+
+    def put(
+        self,
+        url: str,
+        headers: Mapping[str, str],
+        body: bytes,
+        encoding: str | None = None,
+        text: str | None = None,
+        parser: str | None = None,
+        now: float | None = None,
+    ) -> CachedPage | None:
+        """
+        Store a 200 response if its headers allow it
+
+        Responses marked ``no-store``, and ones that can neither be served
+        fresh nor revalidated, are not stored.
+
+        Args:
+            url: Page URL
+            headers: Response headers
+            body: Raw response body
+            encoding: Character encoding the body was decoded with
+            text: Text extracted from the body
+            parser: Extraction settings (parser backend) that produced ``text``
+            now: Current time in epoch seconds (defaults to the clock)
+
+        Returns:
+            The stored entry, or None if it was not stored
+        """
+        expires = freshness(headers, now if now is not None else time.time())
+        if expires is None:
+            return None
+
+        page = CachedPage(
+            url=url,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+            expires=expires,
+            encoding=encoding,
+            text=text,
+            parser=parser,
+        )
+        if not page.is_fresh(now) and not page.validators():
+            return None
+
+        key = self.key(url)
+        with self._lock:
+            self._remove(key)
+            if self._write(key, page, body):
+                self._evict()
+        return page
+
+    def revalidated(
+        self, url: str, headers: Mapping[str, str], now: float | None = None
+    ) -> CachedPage | None:
+        """
+        Refresh an entry after the server answered 304 Not Modified
+
+        Args:
+            url: Page URL
+            headers: Headers of the 304 response, which update the stored ones
+            now: Current time in epoch seconds (defaults to the clock)
+
+        Returns:
+            The updated entry, or None if it is no longer cached
+        """
+        key = self.key(url)
+        with self._lock:
+            page = self._read_meta(key)
+            if page is None:
+                return None
+
+            expires = freshness(headers, now if now is not None else time.time())
+            if expires is None:
+                self._remove(key)
+                return None
+            page.expires = expires
+            page.etag = headers.get("ETag", page.etag)
+            page.last_modified = headers.get("Last-Modified", page.last_modified)
+            self._write_meta(key, page)
+            self._entries.move_to_end(key)
+            return page
+
+    def set_text(self, url: str, text: str, parser: str) -> None:
+        """
+        Store text extracted from a cached body, replacing any previous text
+
+        Args:
+            url: Page URL
+            text: Extracted text
+            parser: Extraction settings (parser backend) that produced it
+        """
+        key = self.key(url)
+        with self._lock:
+            page = self._read_meta(key)
+            if page is None:
+                return
+            page.text = text
+            page.parser = parser
+            self._write_meta(key, page)
+            self._evict()
+
+    def __contains__(self, url: str) -> bool:
+        with self._lock:
+            return self.key(url) in self._entries
+
+    def clear(self) -> None:
+        """Remove every entry"""
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+    def _path(self, key: str, suffix: str) -> Path:
+        """Disk location of one of an entry's files"""
+        return self.cache_dir / f"{key}{suffix}"
+
+    def _scan(self) -> None:
+        """Index existing entries, least recently used first"""
+        sizes: dict[str, int] = {}
+        used: dict[str, float] = {}
+        for entry in os.scandir(self.cache_dir):
+            stem, suffix = os.path.splitext(entry.name)
+            if suffix in (".json", ".body") and entry.is_file():
+                stat = entry.stat()
+                sizes[stem] = sizes.get(stem, 0) + stat.st_size
+                if suffix == ".json":
+                    used[stem] = stat.st_mtime
+
+        for stem in sizes.keys() - used.keys():
+            # Body whose metadata was never written
+            self._path(stem, ".body").unlink(missing_ok=True)
+
+        for _, key in sorted((mtime, key) for key, mtime in used.items()):
+            self._entries[key] = sizes[key]
+            self._size += sizes[key]
+
+        self._evict()
+        logger.info(f"Page cache has {len(self._entries)} entries ({self._size} bytes) on disk")
+
+    def _read_meta(self, key: str) -> CachedPage | None:
+        """Read an entry's metadata and mark it recently used"""
+        if key not in self._entries:
+            return None
+
+        path = self._path(key, ".json")
+        try:
+            page = CachedPage(**json.loads(path.read_text(encoding="utf-8")))
+            os.utime(path)
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Dropping unreadable page cache entry {key}: {e}")
+            self._remove(key)
+            return None
+        return page
+
+    def _write(self, key: str, page: CachedPage, body: bytes) -> bool:
+        """Write a new entry's body, then its metadata, atomically"""
+        body_path = self._path(key, ".body")
+        tmp_path = self._path(key, ".body.tmp")
+        try:
+            tmp_path.write_bytes(body)
+            os.replace(tmp_path, body_path)
+        except OSError as e:
+            logger.warning(f"Could not write page cache entry {key}: {e}")
+            return False
+
+        self._entries[key] = len(body)
+        self._size += len(body)
+        if not self._write_meta(key, page):
+            self._remove(key)
+            return False
+        return True
+
+    def _write_meta(self, key: str, page: CachedPage) -> bool:
+        """Write an entry's metadata atomically and update its size"""
+        path = self._path(key, ".json")
+        tmp_path = self._path(key, ".meta.tmp")
+        data = json.dumps(asdict(page), ensure_ascii=False).encode("utf-8")
+        try:
+            previous = path.stat().st_size if path.exists() else 0
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write page cache entry {key}: {e}")
+            return False
+
+        self._entries[key] += len(data) - previous
+        self._size += len(data) - previous
+        return True
+
+    def _remove(self, key: str) -> None:
+        """Delete an entry's files"""
+        self._size -= self._entries.pop(key, 0)
+        for suffix in (".json", ".body"):
+            try:
+                self._path(key, suffix).unlink()
+            except OSError:
+                pass
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until under the size cap"""
+        while self._size > self.max_bytes and self._entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
@@ -0,0 +1,349 @@
+"""Concurrent extract → segment → synthesize → play pipeline."""
+
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from src.audio_player import AudioPlayer
+from src.logger import get_logger
+from src.segmenter import split_paragraphs, split_sentences
+from src.text_extractor import TextExtractor
+from src.tts_engine import PiperTTSEngine
+
+logger = get_logger(__name__)
+
+# Marks the end of a stage's output
+_END = object()
+
+# How often blocked stages re-check for cancellation (seconds)
+_POLL_INTERVAL = 0.05
+
+# Longest run() waits for a stopped stage to exit; one blocked in a
+# request or synthesis call finishes on its own and its output is dropped
+_JOIN_TIMEOUT = 0.2
+
+
+@dataclass
+class StageStats:
+    """Throughput and latency counters for one pipeline stage."""
+
+    name: str
+    items: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+    queue_depth: int = 0
+
+    @property
+    def avg_latency(self) -> float:
+        """Average seconds spent per item."""
+        return self.total_latency / self.items if self.items else 0.0
+
+    def record(self, latency: float) -> None:
+        """Record one processed item.
+
+        Args:
+            latency: Seconds spent on the item
+        """
+        self.items += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+
+
+class ReadingPipeline:
+    """Read text aloud with every stage running concurrently.
+
+    Stages run on their own threads and are connected by bounded queues, so
+    a slow downstream stage applies backpressure instead of letting work pile
+    up in memory. Paragraph one can be playing while later paragraphs are
+    still being synthesized. The play stage feeds ``AudioPlayer.play_stream``.
+
+    ``first_audio_latency`` records the seconds from ``run()`` until the
+    first audio chunk reached the player.
+    """
+
+    STAGES = ("extract", "segment", "synthesize", "play")
+
+    def __init__(
+        self,
+        extractor: TextExtractor,
+        engine: PiperTTSEngine,
+        player: AudioPlayer,
+        queue_size: int = 8,
+        streaming: bool = False,
+    ):
+        """Initialize ReadingPipeline.
+
+        Args:
+            extractor: Text extractor for URLs and plain text
+            engine: TTS engine with a loaded voice
+            player: Audio player
+            queue_size: Capacity of each inter-stage queue
+            streaming: Pass paragraphs on while a page is still downloading
+                (see TextExtractor.iter_paragraphs) instead of extracting
+                the whole page first
+        """
+        self._extractor = extractor
+        self._streaming = streaming
+        self._engine = engine
+        self._player = player
+        # The extract stage only ever receives the input text, so its inbox
+        # is unbounded; every other hand-off is bounded for backpressure
+        self._queues = [queue.Queue()] + [
+            queue.Queue(maxsize=queue_size) for _ in self.STAGES[1:]
+        ]
+        self._stats = {name: StageStats(name) for name in self.STAGES}
+        self._stop = threading.Event()
+        self._play_done = threading.Event()
+        self._error: Exception | None = None
+        self._started_at = 0.0
+        self.first_audio_latency: float | None = None
+
+    def stats(self) -> list[StageStats]:
+        """Get a snapshot of per-stage statistics.
+
+        ``queue_depth`` is the number of items waiting to enter the stage.
+
+        Returns:
+            One StageStats per stage, in pipeline order
+        """
+        snapshot = []
+        for name, inbox in zip(self.STAGES, self._queues, strict=True):
+            stats = self._stats[name]
+            snapshot.append(
+                StageStats(
+                    name=name,
+                    items=stats.items,
+                    total_latency=stats.total_latency,
+                    max_latency=stats.max_latency,
+                    queue_depth=inbox.qsize(),
+                )
+            )
+        return snapshot
+
+    def run(
+        self,
+        text: str,
+        speed: float = 1.0,
+        cancel_event: threading.Event | None = None,
+        enqueue: bool = False,
+    ):
+        """Run the pipeline until everything has been handed to the player.
+
+        Args:
+            text: URL or plain text to read
+            speed: Synthesis speed multiplier
+            cancel_event: Stops all stages when set
+            enqueue: Play after whatever the player is already playing,
+                without a gap, instead of replacing it
+
+        Raises:
+            Exception: The first error raised by any stage
+        """
+        self._started_at = time.perf_counter()
+        # One voice for the whole read, even if another is loaded meanwhile
+        voice = self._engine.snapshot()
+        extract_in, segment_in, synth_in, play_in = self._queues
+        extract_in.put(text)
+        extract_in.put(_END)
+
+        threads = [
+            self._spawn("extract", _each(self._extract), extract_in, segment_in),
+            self._spawn("segment", _each(split_sentences), segment_in, synth_in),
+            self._spawn(
+                "synthesize",
+                # Whole stream at once so a multi-worker engine can run ahead
+                lambda sentences: self._engine.synthesize_sentences(
+                    (sentence.text for sentence in sentences), speed, voice
+                ),
+                synth_in,
+                play_in,
+            ),
+        ]
+        # The player converts from the voice's rate to the device's. If it
+        # is stopped or replaced, every stage stops with it
+        play = self._player.enqueue if enqueue else self._player.play_stream
+        play(self._play_source(play_in), sample_rate=voice.sample_rate, on_cancel=self._stop.set)
+
+        while not self._play_done.wait(_POLL_INTERVAL):
+            if cancel_event is not None and cancel_event.is_set():
+                self._stop.set()
+            if self._stop.is_set():
+                break
+
+        # Stop upstream stages if playback ended early (e.g. player stopped)
+        self._stop.set()
+        for thread in threads:
+            thread.join(_JOIN_TIMEOUT)
+            if thread.is_alive():
+                logger.info("pipeline_stage_still_running", stage=thread.name)
+
+        self._log_stats()
+
+        if self._error is not None:
+            raise self._error
+
+    def _extract(self, text: str) -> Iterable[str]:
+        """Extract text and split it into paragraphs.
+
+        Args:
+            text: URL or plain text
+
+        Returns:
+            Paragraphs
+        """
+        if self._streaming:
+            return self._extractor.iter_paragraphs(text)
+        return split_paragraphs(self._extractor.extract(text))
+
+    def _spawn(
+        self,
+        name: str,
+        func: Callable[[Iterator[Any]], Iterable[Any]],
+        inbox: queue.Queue,
+        outbox: queue.Queue,
+    ) -> threading.Thread:
+        """Start a stage thread.
+
+        Args:
+            name: Stage name
+            func: Maps the stream of input items to a stream of output items
+            inbox: Input queue
+            outbox: Output queue
+
+        Returns:
+            Started thread
+        """
+        thread = threading.Thread(
+            target=self._stage_loop,
+            args=(name, func, inbox, outbox),
+            name=f"pipeline-{name}",
+            daemon=True,
+        )
+        thread.start()
+        return thread
+
+    def _stage_loop(
+        self,
+        name: str,
+        func: Callable[[Iterator[Any]], Iterable[Any]],
+        inbox: queue.Queue,
+        outbox: queue.Queue,
+    ) -> None:
+        """Stage thread body.
+
+        Latency is recorded per output item and covers the work done to
+        produce it, excluding time spent waiting for input or blocked on a
+        full output queue.
+        """
+        stats = self._stats[name]
+        waited = 0.0
+
+        def inputs() -> Iterator[Any]:
+            nonlocal waited
+            while True:
+                started = time.perf_counter()
+                item = self._get(inbox)
+                waited += time.perf_counter() - started
+                if item is _END or item is None:
+                    return
+                yield item
+
+        try:
+            started = time.perf_counter()
+            for output in func(inputs()):
+                stats.record(time.perf_counter() - started - waited)
+                if not self._put(outbox, output):
+                    return
+                waited = 0.0
+                started = time.perf_counter()
+        except Exception as e:
+            logger.error("pipeline_stage_failed", stage=name, error=str(e))
+            if self._error is None:
+                self._error = e
+            self._stop.set()
+        finally:
+            self._put(outbox, _END)
+
+    def _play_source(self, inbox: queue.Queue) -> Iterator[np.ndarray]:
+        """Yield synthesized audio to the player's producer thread.
+
+        Latency is the time the player took to accept a chunk, which is
+        dominated by ring-buffer backpressure once playback is underway.
+        Waiting for the next chunk polls the pipeline's stop flag, which
+        the player sets through ``on_cancel`` when it is stopped, so the
+        producer thread is released within one poll interval.
+        """
+        stats = self._stats["play"]
+        try:
+            while True:
+                audio = self._get(inbox)
+                if audio is _END or audio is None:
+                    return
+                started = time.perf_counter()
+                if self.first_audio_latency is None:
+                    self.first_audio_latency = started - self._started_at
+                yield audio
+                stats.record(time.perf_counter() - started)
+        finally:
+            self._play_done.set()
+
+    def _get(self, inbox: queue.Queue) -> Any:
+        """Get from a queue, giving up once the pipeline is stopped.
+
+        Returns:
+            The next item, or None if stopped
+        """
+        while not self._stop.is_set():
+            try:
+                return inbox.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+        return None
+
+    def _put(self, outbox: queue.Queue, item: Any) -> bool:
+        """Put to a queue, blocking for backpressure until stopped.
+
+        Returns:
+            True if the item was queued
+        """
+        while not self._stop.is_set():
+            try:
+                outbox.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _log_stats(self) -> None:
+        """Log per-stage statistics to help locate the bottleneck."""
+        for stats in self.stats():
+            logger.info(
+                "pipeline_stage_stats",
+                stage=stats.name,
+                items=stats.items,
+                avg_latency_ms=round(stats.avg_latency * 1000, 1),
+                max_latency_ms=round(stats.max_latency * 1000, 1),
+                queue_depth=stats.queue_depth,
+            )
+
+
+def _each(func: Callable[[Any], Iterable[Any]]) -> Callable[[Iterator[Any]], Iterator[Any]]:
+    """Lift a per-item function into a stream function for a stage.
+
+    Args:
+        func: Maps one input item to zero or more output items
+
+    Returns:
+        Function mapping a stream of inputs to the concatenated outputs
+    """
+
+    def stage(items: Iterator[Any]) -> Iterator[Any]:
+        for item in items:
+            yield from func(item)
+
+    return stage
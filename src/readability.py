@@ -0,0 +1,349 @@
+"""Readability-style detection of a page's main content"""
+import re
+from collections.abc import Collection, Iterator
+
+# Class/id hints of boilerplate blocks, unless they also look like content
+_UNLIKELY = re.compile(
+    r"banner|breadcrumb|combx|comment|community|consent|cookie|cover-wrap|disqus|"
+    r"gdpr|menu|modal|newsletter|outbrain|pager|popup|promo|related|remark|replies|"
+    r"rss|share|shoutbox|sidebar|skyscraper|social|sponsor|subscribe|taboola|widget",
+    re.IGNORECASE,
+)
+_MAYBE_CONTENT = re.compile(r"and|article|body|column|content|main|shadow|story", re.IGNORECASE)
+_UNLIKELY_ROLES = {
+    "alert", "alertdialog", "complementary", "dialog", "menu", "menubar", "navigation",
+}  # fmt: skip
+
+# Class/id hints that move a container's score up or down
+_POSITIVE = re.compile(
+    r"article|body|content|entry|hentry|h-entry|main|page|post|story|text|blog", re.IGNORECASE
+)
+_NEGATIVE = re.compile(
+    r"-ad-|byline|combx|comment|com-|contact|cookie|foot|footnote|gdpr|masthead|media|"
+    r"meta|newsletter|outbrain|promo|related|scroll|share|shoutbox|sidebar|skyscraper|"
+    r"sponsor|shopping|social|subscribe|tags|tool|widget",
+    re.IGNORECASE,
+)
+
+# Elements scored as paragraphs, and elements that stop a div counting as one
+PARAGRAPH_TAGS = {"p", "pre", "td", "blockquote"}
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "dl", "div", "figure", "footer", "form",
+    "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "main", "nav", "ol", "p", "pre",
+    "section", "table", "ul",
+}  # fmt: skip
+
+# Starting score of a candidate container by tag
+_TAG_WEIGHTS = {
+    "div": 5, "article": 5, "main": 5, "section": 3, "pre": 3, "td": 3, "blockquote": 3,
+    "address": -3, "ol": -3, "ul": -3, "dl": -3, "dd": -3, "dt": -3, "li": -3, "form": -3,
+    "h1": -5, "h2": -5, "h3": -5, "h4": -5, "h5": -5, "h6": -5, "th": -5,
+}  # fmt: skip
+
+# Shortest paragraph that counts towards its container's score
+MIN_PARAGRAPH_CHARS = 25
+
+# Elements whose content is not page text (as in BeautifulSoup's get_text)
+_NON_TEXT_TAGS = {"template"}
+
+
+class ContentNode:
+    """Element of a parsed page, reduced to what content scoring needs
+
+    Built from any parser backend's tree, so the scorer works the same way
+    whichever backend parsed the page. Children are nodes and text strings
+    in document order.
+    """
+
+    __slots__ = (
+        "tag", "hint", "role", "parent", "children",
+        "text_length", "link_length", "commas", "has_block", "score",
+    )  # fmt: skip
+
+    def __init__(self, tag: str, hint: str = "", role: str = "", parent=None):
+        """
+        Initialize node
+
+        Args:
+            tag: Lowercase tag name
+            hint: Class and id attributes, space separated
+            role: ARIA role attribute
+            parent: Enclosing node (None for the document)
+        """
+        self.tag = tag
+        self.hint = hint
+        self.role = role
+        self.parent = parent
+        self.children: list[ContentNode | str] = []
+        self.text_length = 0
+        self.link_length = 0
+        self.commas = 0
+        self.has_block = False
+        self.score: float | None = None
+        if parent is not None:
+            parent.children.append(self)
+
+    def iter(self) -> Iterator["ContentNode"]:
+        """Iterate over this node and its descendant nodes in document order"""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(child for child in reversed(node.children) if not isinstance(child, str))
+
+    def text(self) -> str:
+        """Get the text of this node, text nodes joined in document order"""
+        parts = []
+        stack: list[ContentNode | str] = [self]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                parts.append(item)
+            else:
+                stack.extend(reversed(item.children))
+        return "".join(parts)
+
+    @property
+    def link_density(self) -> float:
+        """Fraction of the node's text that is inside links"""
+        return self.link_length / self.text_length if self.text_length else 0.0
+
+
+def from_lxml(root, excluded: Collection[str]) -> ContentNode:
+    """
+    Convert an lxml.html document
+
+    Args:
+        root: Root element
+        excluded: Tags dropped along with their content
+
+    Returns:
+        Document node
+    """
+    document = ContentNode("#document")
+    stack = [(root, document)]
+    while stack:
+        element, parent = stack.pop()
+        tag = element.tag
+        if isinstance(tag, str) and tag not in excluded and tag not in _NON_TEXT_TAGS:
+            node = ContentNode(
+                tag,
+                f"{element.get('class', '')} {element.get('id', '')}",
+                element.get("role", ""),
+                parent,
+            )
+            if element.text:
+                node.children.append(element.text)
+            stack.extend((child, node) for child in reversed(element))
+        # Text after an element belongs to its parent, even if it is dropped
+        if element.tail and element is not root:
+            parent.children.append(element.tail)
+    return document
+
+
+def from_lexbor(root, excluded: Collection[str]) -> ContentNode:
+    """
+    Convert a selectolax (lexbor) document
+
+    Args:
+        root: Root node (``LexborHTMLParser.root``)
+        excluded: Tags dropped along with their content
+
+    Returns:
+        Document node
+    """
+    document = ContentNode("#document")
+    stack = [(root, document)]
+    while stack:
+        element, parent = stack.pop()
+        tag = element.tag
+        if tag == "-text":
+            parent.children.append(element.text_content)
+        elif not tag.startswith("-") and tag not in excluded and tag not in _NON_TEXT_TAGS:
+            attributes = element.attributes
+            node = ContentNode(
+                tag,
+                f"{attributes.get('class') or ''} {attributes.get('id') or ''}",
+                attributes.get("role") or "",
+                parent,
+            )
+            children = []
+            child = element.child
+            while child is not None:
+                children.append((child, node))
+                child = child.next
+            stack.extend(reversed(children))
+    return document
+
+
+def from_soup(soup, excluded: Collection[str]) -> ContentNode:
+    """
+    Convert a BeautifulSoup document
+
+    Args:
+        soup: Parsed document
+        excluded: Tags dropped along with their content
+
+    Returns:
+        Document node
+    """
+    from bs4.element import NavigableString, PreformattedString, Tag
+
+    document = ContentNode("#document")
+    stack = [(child, document) for child in reversed(soup.contents)]
+    while stack:
+        element, parent = stack.pop()
+        if isinstance(element, NavigableString):
+            # Comments, doctypes and the like are not page text
+            if not isinstance(element, PreformattedString):
+                parent.children.append(str(element))
+        elif isinstance(element, Tag) and element.name not in excluded:
+            if element.name in _NON_TEXT_TAGS:
+                continue
+            classes = element.get("class", "")
+            if isinstance(classes, list):
+                classes = " ".join(classes)
+            node = ContentNode(
+                element.name, f"{classes} {element.get('id', '')}", element.get("role", ""), parent
+            )
+            stack.extend((child, node) for child in reversed(element.contents))
+    return document
+
+
+def is_boilerplate(tag: str, hint: str, role: str = "") -> bool:
+    """
+    Check whether an element's class, id or role mark it as boilerplate
+
+    Args:
+        tag: Lowercase tag name
+        hint: Class and id attributes, space separated
+        role: ARIA role attribute
+
+    Returns:
+        True for cookie banners, comment sections, share bars and the like
+    """
+    if tag in ("html", "body", "article", "main"):
+        return False
+    if role in _UNLIKELY_ROLES:
+        return True
+    return _UNLIKELY.search(hint) is not None and _MAYBE_CONTENT.search(hint) is None
+
+
+def main_content(document: ContentNode) -> list[ContentNode] | None:
+    """
+    Find the blocks that make up a page's main content
+
+    Blocks whose class, id or role mark them as boilerplate are pruned
+    from the tree first. Each remaining paragraph of at least
+    MIN_PARAGRAPH_CHARS then scores its parent and, at half weight, its
+    grandparent, by length and comma count. Container scores are scaled
+    down by link density, and the best container is chosen along with any
+    siblings that score close to it or read like prose.
+
+    Args:
+        document: Page tree, pruned in place
+
+    Returns:
+        Main content blocks in document order, or None if nothing scored
+    """
+    nodes = _prune(document)
+    _measure(nodes)
+
+    candidates = []
+    for node in nodes:
+        is_paragraph = node.tag in PARAGRAPH_TAGS or (
+            node.tag in ("div", "section") and not node.has_block
+        )
+        if not is_paragraph or node.text_length < MIN_PARAGRAPH_CHARS:
+            continue
+
+        points = 1 + node.commas + min(node.text_length // 100, 3)
+        for ancestor, share in ((node.parent, 1.0), (node.parent and node.parent.parent, 0.5)):
+            if ancestor is None or ancestor is document:
+                continue
+            if ancestor.score is None:
+                ancestor.score = _initial_score(ancestor)
+                candidates.append(ancestor)
+            ancestor.score += points * share
+
+    if not candidates:
+        return None
+    for candidate in candidates:
+        candidate.score *= 1 - candidate.link_density
+    top = max(candidates, key=lambda candidate: candidate.score)
+    if top.parent is None:
+        return [top]
+
+    threshold = max(10.0, top.score * 0.2)
+    selected = []
+    for sibling in top.parent.children:
+        if isinstance(sibling, str):
+            continue
+        if sibling is top or _is_related(sibling, top, threshold):
+            selected.append(sibling)
+    return selected
+
+
+def _prune(document: ContentNode) -> list[ContentNode]:
+    """
+    Remove subtrees whose class, id or role mark them as boilerplate
+
+    Args:
+        document: Page tree
+
+    Returns:
+        Remaining nodes in document order
+    """
+    nodes = []
+    stack = [document]
+    while stack:
+        node = stack.pop()
+        if node.parent is not None and is_boilerplate(node.tag, node.hint, node.role):
+            node.parent.children.remove(node)
+            continue
+        nodes.append(node)
+        stack.extend(child for child in reversed(node.children) if not isinstance(child, str))
+    return nodes
+
+
+def _measure(nodes: list[ContentNode]) -> None:
+    """Total text length, link text and commas bottom-up (``nodes`` in document order)"""
+    for node in reversed(nodes):
+        for child in node.children:
+            if isinstance(child, str):
+                node.text_length += len(child.strip())
+                node.commas += child.count(",")
+            elif child.tag in BLOCK_TAGS:
+                node.has_block = True
+        if node.tag == "a":
+            node.link_length = node.text_length
+
+        parent = node.parent
+        if parent is not None:
+            parent.text_length += node.text_length
+            parent.link_length += node.link_length
+            parent.commas += node.commas
+
+
+def _initial_score(node: ContentNode) -> float:
+    """Starting score of a container from its tag and class/id hints"""
+    score = float(_TAG_WEIGHTS.get(node.tag, 0))
+    if _NEGATIVE.search(node.hint):
+        score -= 25
+    if _POSITIVE.search(node.hint):
+        score += 25
+    return score
+
+
+def _is_related(sibling: ContentNode, top: ContentNode, threshold: float) -> bool:
+    """Whether a sibling of the top candidate belongs to the main content"""
+    bonus = top.score * 0.2 if sibling.hint.strip() and sibling.hint == top.hint else 0.0
+    if sibling.score is not None and sibling.score + bonus >= threshold:
+        return True
+    if sibling.tag != "p":
+        return False
+
+    density = sibling.link_density
+    if sibling.text_length > 80:
+        return density < 0.25
+    return density == 0 and sibling.text().rstrip().endswith(".")
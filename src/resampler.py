@@ -0,0 +1,256 @@
+"""Streaming polyphase sample-rate conversion"""
+from fractions import Fraction
+from math import gcd
+
+import numpy as np
+
+from src.time_stretch import INT16_MAX, INT16_MIN
+
+# Largest interpolation factor; ratios needing more are approximated
+MAX_PHASES = 1024
+
+
+class Resampler:
+    """Streaming rational-ratio resampler for mono int16 audio
+
+    Converts by ``up / down`` with a Kaiser-windowed sinc low-pass split into
+    ``up`` polyphase branches, so each output sample is one short dot
+    product over the input. Output sample ``n`` is centred on input time
+    ``n * down / up``; the filter delay is compensated, so output lines up
+    with input.
+
+    Like ``TimeStretcher``, input is pushed with ``write`` and output pulled
+    with ``read_into``. All working buffers are allocated up front, so
+    ``write``, ``read_into`` and ``reset`` can run inside an audio callback.
+    """
+
+    def __init__(
+        self,
+        input_rate: int,
+        output_rate: int,
+        taps_per_phase: int = 16,
+        batch: int = 256,
+    ):
+        """
+        Initialize resampler
+
+        Args:
+            input_rate: Input sample rate in Hz
+            output_rate: Output sample rate in Hz
+            taps_per_phase: Filter length per branch when upsampling (more is
+                sharper and slower; scaled up when downsampling)
+            batch: Output samples computed per vectorized step
+        """
+        if input_rate <= 0 or output_rate <= 0:
+            raise ValueError("Sample rates must be positive")
+
+        ratio = Fraction(output_rate, input_rate).limit_denominator(MAX_PHASES)
+        divisor = gcd(ratio.numerator, ratio.denominator)
+        self.input_rate = input_rate
+        self.output_rate = output_rate
+        self.up = ratio.numerator // divisor
+        self.down = ratio.denominator // divisor
+
+        taps = int(np.ceil(taps_per_phase * max(1.0, self.down / self.up)))
+        self._taps = taps
+        self._delay = taps // 2
+        self._filter = self._design(self.up, self.down, taps)
+        self._batch = batch
+
+        # Input history as float32, including the filter's look-back
+        self._block = 4096
+        self._input = np.zeros(self._block + 2 * taps + self.down, dtype=np.float32)
+
+        # Per-batch scratch: input indices and phases of each output, the
+        # gathered input windows and their filter coefficients
+        self._steps = np.arange(batch, dtype=np.int64) * self.down
+        self._tap_offsets = np.tile(-np.arange(taps, dtype=np.int64), (batch, 1))
+        self._times = np.zeros(batch, dtype=np.int64)
+        self._indices = np.zeros(batch, dtype=np.int64)
+        self._phases = np.zeros(batch, dtype=np.int64)
+        self._window_indices = np.zeros((batch, taps), dtype=np.int64)
+        self._windows = np.zeros((batch, taps), dtype=np.float32)
+        self._coefficients = np.zeros((batch, taps), dtype=np.float32)
+        self._output = np.zeros(batch, dtype=np.float32)
+
+        self.reset()
+
+    @property
+    def free(self) -> int:
+        """Number of input samples ``write`` can accept right now"""
+        self._compact()
+        # Room for the silence finish() appends is kept back
+        return max(0, len(self._input) - self._input_len - self._delay)
+
+    @property
+    def written(self) -> int:
+        """Number of input samples written since the last reset"""
+        return self._written
+
+    @property
+    def input_position(self) -> float:
+        """Input position of the next output sample"""
+        return self._produced * self.down / self.up
+
+    @property
+    def finished(self) -> bool:
+        """Whether ``finish`` was called and all output has been read"""
+        return self._total is not None and self._produced >= self._total
+
+    def reset(self) -> None:
+        """Discard all buffered audio and start a new stream"""
+        # History before the first sample is silence
+        self._input[: self._taps] = 0
+        self._input_len = self._taps
+        self._input_base = -self._taps  # Stream index of self._input[0]
+        self._written = 0
+        self._produced = 0  # Output samples read so far
+        self._total: int | None = None  # Output length once finish() is called
+
+    def write(self, samples: np.ndarray) -> int:
+        """
+        Append input samples
+
+        Args:
+            samples: int16 input samples
+
+        Returns:
+            Number of samples accepted (at most ``free``)
+        """
+        if self._total is not None:
+            raise ValueError("Cannot write after finish()")
+        count = min(len(samples), self.free)
+        self._input[self._input_len : self._input_len + count] = samples[:count]
+        self._input_len += count
+        self._written += count
+        return count
+
+    def finish(self) -> None:
+        """Mark the end of input so the tail can be read out"""
+        if self._total is not None:
+            return
+        # Pad with silence so the filter can run past the last sample
+        self._compact()
+        self._input[self._input_len : self._input_len + self._delay] = 0
+        self._input_len += self._delay
+        self._total = -(-self._written * self.up // self.down)
+
+    def read_into(self, out: np.ndarray) -> int:
+        """
+        Convert as much buffered input as possible into ``out``
+
+        Args:
+            out: int16 destination buffer
+
+        Returns:
+            Number of samples written; fewer than requested when more input
+            is needed or the stream has finished
+        """
+        count = min(len(out), self._available())
+        filled = 0
+        while filled < count:
+            size = min(self._batch, count - filled)
+            self._convert(size)
+            output = self._output[:size]
+            np.rint(output, out=output)
+            np.minimum(output, INT16_MAX, out=output)
+            np.maximum(output, INT16_MIN, out=output)
+            out[filled : filled + size] = output
+            self._produced += size
+            filled += size
+        return filled
+
+    def _available(self) -> int:
+        """Number of output samples computable from the buffered input"""
+        if self._total is not None:
+            return self._total - self._produced
+        # Output n needs input up to (n * down) // up + delay
+        end = self._input_base + self._input_len - self._delay
+        return max(0, -(-end * self.up // self.down) - self._produced)
+
+    def _convert(self, size: int) -> None:
+        """Compute the next ``size`` output samples into ``self._output``"""
+        times = self._times[:size]
+        indices = self._indices[:size]
+        phases = self._phases[:size]
+        window_indices = self._window_indices[:size]
+        windows = self._windows[:size]
+        coefficients = self._coefficients[:size]
+
+        np.add(self._steps[:size], self._produced * self.down, out=times)
+        np.floor_divide(times, self.up, out=indices)
+        np.remainder(times, self.up, out=phases)
+        # Newest input sample each output uses, relative to the buffer
+        np.add(indices, self._delay - self._input_base, out=indices)
+        # Broadcast by copying, then add like-shaped offsets: a broadcasting
+        # ufunc would allocate an iteration buffer on every call
+        np.copyto(window_indices, indices[:, None])
+        np.add(window_indices, self._tap_offsets[:size], out=window_indices)
+
+        # Indices are always in range; "clip" keeps take from buffering out
+        np.take(self._input, window_indices, out=windows, mode="clip")
+        np.take(self._filter, phases, axis=0, out=coefficients, mode="clip")
+        np.multiply(windows, coefficients, out=windows)
+        windows.sum(axis=1, out=self._output[:size])
+
+    def _compact(self) -> None:
+        """Drop input that no future output can reach"""
+        oldest = (self._produced * self.down) // self.up + self._delay - self._taps + 1
+        drop = oldest - self._input_base
+        if drop <= 0:
+            return
+        drop = min(drop, self._input_len)
+        remaining = self._input_len - drop
+        self._input[:remaining] = self._input[drop : self._input_len]
+        self._input_len = remaining
+        self._input_base += drop
+
+    @staticmethod
+    def _design(up: int, down: int, taps: int) -> np.ndarray:
+        """
+        Design the polyphase filter bank
+
+        Returns:
+            (up, taps) float32 coefficients; row ``p`` is applied, newest
+            sample first, to outputs whose input time has phase ``p``
+        """
+        length = up * taps
+        # Cut off just below the lower of the two Nyquist frequencies
+        cutoff = 0.95 * 0.5 / max(up, down)  # Cycles per upsampled sample
+        # Centre exactly on the compensated delay; the extra point that makes
+        # the window symmetric sits on its zero edge and is dropped
+        n = np.arange(length + 1) - (taps // 2) * up
+        prototype = 2 * cutoff * np.sinc(2 * cutoff * n) * np.kaiser(length + 1, 8.0)
+        prototype = prototype[:length] * (up / prototype[:length].sum())
+
+        # Branch p holds every up-th tap starting at p
+        return np.ascontiguousarray(prototype.reshape(taps, up).T, dtype=np.float32)
+
+
+def resample(audio: np.ndarray, input_rate: int, output_rate: int) -> np.ndarray:
+    """
+    Convert int16 audio to another sample rate
+
+    Args:
+        audio: int16 samples
+        input_rate: Sample rate of ``audio`` in Hz
+        output_rate: Desired sample rate in Hz
+
+    Returns:
+        int16 samples at ``output_rate``
+    """
+    if input_rate == output_rate or len(audio) == 0:
+        return audio
+
+    resampler = Resampler(input_rate, output_rate)
+    outputs = []
+    offset = 0
+    while not resampler.finished:
+        if offset < len(audio):
+            offset += resampler.write(audio[offset:])
+        else:
+            resampler.finish()
+        out = np.empty(4096, dtype=np.int16)
+        count = resampler.read_into(out)
+        outputs.append(out[:count])
+    return np.concatenate(outputs)
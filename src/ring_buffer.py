@@ -0,0 +1,186 @@
+"""Fixed-size ring buffer for streaming audio between threads"""
+
+import threading
+import time
+
+import numpy as np
+
+
+class AudioRingBuffer:
+    """Preallocated single-producer/single-consumer ring buffer of int16 samples
+
+    The producer thread calls ``write`` and blocks while the buffer is full,
+    which gives natural backpressure to whatever is generating audio. The
+    consumer (the audio callback) calls ``read_into`` which never blocks, never
+    takes a lock and never allocates sample memory.
+
+    Each side only ever advances its own counter, so under the GIL no lock is
+    needed between them.
+
+    With ``history`` the last samples read are kept rather than overwritten,
+    so the consumer can ``seek`` back into them as well as forward through
+    unread samples.
+    """
+
+    def __init__(self, capacity: int, poll_interval: float = 0.005, history: int = 0):
+        """
+        Initialize ring buffer
+
+        Args:
+            capacity: Maximum number of samples held at once
+            poll_interval: Seconds the producer sleeps while waiting for space
+            history: Number of already-read samples kept available for seeking
+                (part of ``capacity``)
+        """
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        if not 0 <= history < capacity:
+            raise ValueError("History must be non-negative and less than capacity")
+
+        self._buffer = np.zeros(capacity, dtype=np.int16)
+        self._capacity = capacity
+        self._poll_interval = poll_interval
+        self._history = history
+        self._write_count = 0  # Total samples written (producer owned)
+        self._read_count = 0  # Total samples read (consumer owned)
+        # Oldest sample the producer must not overwrite (consumer owned, only
+        # ever increases, so a stale value seen by the producer is safe)
+        self._keep_from = 0
+        self._closed = False
+        self._aborted = threading.Event()
+
+    @property
+    def capacity(self) -> int:
+        """Get buffer capacity in samples"""
+        return self._capacity
+
+    @property
+    def available(self) -> int:
+        """Get number of samples ready to be read"""
+        return self._write_count - self._read_count
+
+    @property
+    def free(self) -> int:
+        """Get number of samples that can be written without blocking"""
+        return max(0, self._capacity - self._history - self.available)
+
+    @property
+    def written(self) -> int:
+        """Get total number of samples written since the last reset"""
+        return self._write_count
+
+    @property
+    def position(self) -> int:
+        """Get total number of samples read, adjusted by seeks"""
+        return self._read_count
+
+    @property
+    def earliest(self) -> int:
+        """Get the oldest position ``seek`` can go back to"""
+        return self._keep_from
+
+    @property
+    def closed(self) -> bool:
+        """Whether the producer has finished writing"""
+        return self._closed
+
+    @property
+    def drained(self) -> bool:
+        """Whether the producer has finished and every sample has been read"""
+        return self._closed and self.available == 0
+
+    def write(self, samples: np.ndarray) -> int:
+        """
+        Write samples, blocking while the buffer is full
+
+        Args:
+            samples: int16 samples to append
+
+        Returns:
+            Number of samples written (less than ``len(samples)`` only if aborted)
+        """
+        total = len(samples)
+        written = 0
+
+        while written < total:
+            if self._aborted.is_set():
+                break
+
+            free = self.free
+            if free == 0:
+                time.sleep(self._poll_interval)
+                continue
+
+            count = min(free, total - written)
+            start = self._write_count % self._capacity
+            first = min(count, self._capacity - start)
+            self._buffer[start : start + first] = samples[written : written + first]
+            if count > first:
+                self._buffer[: count - first] = samples[written + first : written + count]
+
+            # Publish only after the samples are in place
+            self._write_count += count
+            written += count
+
+        return written
+
+    def read_into(self, out: np.ndarray) -> int:
+        """
+        Copy up to ``len(out)`` samples into ``out`` without blocking
+
+        Args:
+            out: Destination buffer
+
+        Returns:
+            Number of samples copied
+        """
+        count = min(len(out), self.available)
+        if count == 0:
+            return 0
+
+        start = self._read_count % self._capacity
+        first = min(count, self._capacity - start)
+        out[:first] = self._buffer[start : start + first]
+        if count > first:
+            out[first:count] = self._buffer[: count - first]
+
+        self._read_count += count
+        self._keep_from = max(self._keep_from, self._read_count - self._history)
+        return count
+
+    def seek(self, position: int) -> int:
+        """
+        Move the read position within the kept history and unread samples
+
+        Consumer side only; never blocks and copies nothing.
+
+        Args:
+            position: Stream position (total samples written before it)
+
+        Returns:
+            The position actually moved to, clamped to what is still held
+        """
+        position = min(max(position, self._keep_from), self._write_count)
+        self._read_count = position
+        self._keep_from = max(self._keep_from, position - self._history)
+        return position
+
+    def close(self) -> None:
+        """Mark the producer as finished"""
+        self._closed = True
+
+    def abort(self) -> None:
+        """Wake a blocked producer and make further writes return immediately"""
+        self._aborted.set()
+        self._closed = True
+
+    def reset(self) -> None:
+        """Discard all samples and make the buffer reusable
+
+        Must only be called while no producer or consumer is active.
+        """
+        self._write_count = 0
+        self._read_count = 0
+        self._keep_from = 0
+        self._closed = False
+        self._aborted.clear()
@@ -0,0 +1,122 @@
+"""Sentence segmentation for incremental synthesis."""
+
+import re
+from typing import NamedTuple
+
+# Terminal punctuation, optionally followed by closing quotes or brackets
+_BOUNDARY = re.compile(r"[.!?…]+[\"'”’)\]]*\s+")
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+_WHITESPACE = re.compile(r"\s+")
+
+# Words that end with a period without ending the sentence
+_ABBREVIATIONS = {
+    "mr", "mrs", "ms", "dr", "prof", "sr", "jr", "st", "vs", "etc",
+    "e.g", "i.e", "no", "fig", "inc", "ltd", "co", "mt", "approx",
+}
+
+
+class Sentence(NamedTuple):
+    """A sentence and its character range in the source text."""
+
+    text: str
+    start: int
+    end: int
+
+
+def split_paragraphs(text: str) -> list[str]:
+    """Split text into paragraphs on blank lines.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        Non-empty paragraphs, stripped
+    """
+    return [p.strip() for p in _PARAGRAPH_BREAK.split(text) if p.strip()]
+
+
+def split_sentences(text: str, max_chars: int = 400) -> list[Sentence]:
+    """Split text into sentences.
+
+    Internal whitespace (including single newlines) is collapsed in each
+    sentence's text; ``start`` and ``end`` index into the original ``text``.
+    Sentences longer than ``max_chars`` are broken at whitespace so that a
+    run-on block never delays the first audio by more than one chunk.
+
+    Args:
+        text: Text to split
+        max_chars: Maximum length of a single sentence
+
+    Returns:
+        Sentences in order
+    """
+    sentences = []
+    start = 0
+
+    for match in _BOUNDARY.finditer(text):
+        if not _is_boundary(text, match):
+            continue
+        _append(sentences, text, start, match.end(), max_chars)
+        start = match.end()
+
+    _append(sentences, text, start, len(text), max_chars)
+    return sentences
+
+
+def _is_boundary(text: str, match: re.Match) -> bool:
+    """Decide whether a punctuation match really ends a sentence.
+
+    Args:
+        text: Full text
+        match: Candidate boundary match
+
+    Returns:
+        True if the sentence ends here
+    """
+    # A lowercase continuation means the period was not terminal
+    following = text[match.end() : match.end() + 1]
+    if following and following.islower():
+        return False
+
+    if text[match.start()] == ".":
+        words = text[: match.start()].rsplit(None, 1)
+        word = words[-1].lower() if words else ""
+        word = word.lstrip("(\"'“‘")
+        # Initials ("J. Smith") and common abbreviations
+        if len(word) == 1 and word.isalpha():
+            return False
+        if word in _ABBREVIATIONS:
+            return False
+
+    return True
+
+
+def _append(sentences: list[Sentence], text: str, start: int, end: int, max_chars: int) -> None:
+    """Append the sentence text[start:end], splitting it if it is too long.
+
+    Args:
+        sentences: Output list
+        text: Full text
+        start: Start offset
+        end: End offset
+        max_chars: Maximum length of a single sentence
+    """
+    # Trim surrounding whitespace from the range
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    if start == end:
+        return
+
+    while end - start > max_chars:
+        cut = text.rfind(" ", start, start + max_chars)
+        if cut <= start:
+            cut = start + max_chars
+        sentences.append(Sentence(_WHITESPACE.sub(" ", text[start:cut]), start, cut))
+        start = cut
+        while start < end and text[start].isspace():
+            start += 1
+
+    if start < end:
+        sentences.append(Sentence(_WHITESPACE.sub(" ", text[start:end]), start, end))
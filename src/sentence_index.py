@@ -0,0 +1,78 @@
+"""Sentence boundaries within synthesized audio"""
+from bisect import bisect_right
+
+
+class SentenceIndex:
+    """Sample offset and text range of each sentence in an audio stream
+
+    Entries are appended in playback order as sentences are synthesized, so
+    the index can be filled by a producer while the player reads it. Offsets
+    are cumulative and sorted, which makes finding the sentence at a sample
+    position a binary search.
+    """
+
+    def __init__(self):
+        """Initialize an empty index"""
+        self._offsets: list[int] = []
+        self._ranges: list[tuple[int, int] | None] = []
+        self._total = 0
+
+    def add(self, samples: int, start: int | None = None, end: int | None = None) -> None:
+        """
+        Append the next sentence
+
+        Args:
+            samples: Length of the sentence's audio in samples
+            start: Character offset where the sentence starts in the source text
+            end: Character offset where the sentence ends in the source text
+        """
+        # Publish the range before the offset; readers go by len(_offsets)
+        self._ranges.append((start, end) if start is not None and end is not None else None)
+        self._offsets.append(self._total)
+        self._total += samples
+
+    @property
+    def total(self) -> int:
+        """Get the number of samples covered by the index"""
+        return self._total
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def offset(self, sentence: int) -> int:
+        """
+        Get the sample offset where a sentence starts
+
+        Args:
+            sentence: Sentence number
+
+        Returns:
+            Sample offset from the start of the audio
+        """
+        return self._offsets[sentence]
+
+    def text_range(self, sentence: int) -> tuple[int, int] | None:
+        """
+        Get a sentence's character range in the source text
+
+        Args:
+            sentence: Sentence number
+
+        Returns:
+            (start, end) character offsets, or None if not recorded
+        """
+        return self._ranges[sentence]
+
+    def locate(self, position: int) -> int:
+        """
+        Find the sentence playing at a sample position
+
+        Args:
+            position: Sample offset from the start of the audio
+
+        Returns:
+            Sentence number, or -1 if the index is empty
+        """
+        if not self._offsets:
+            return -1
+        return max(0, bisect_right(self._offsets, position) - 1)
@@ -1,5 +1,6 @@
 """Settings management with JSON persistence."""
 
+import copy
 import json
 from pathlib import Path
 from typing import Any
@@ -8,6 +9,11 @@ from typing import Any
 class Settings:
     """Manage application settings with JSON persistence."""
 
+    # Playback speed range and the step of the slider and speed shortcuts
+    MIN_SPEED = 0.5
+    MAX_SPEED = 2.0
+    SPEED_STEP = 0.25
+
     DEFAULT_SETTINGS = {
         "voice": "en_US-lessac-medium",
         "speed": 1.0,
@@ -18,6 +24,38 @@ class Settings:
             "speed_up": "ctrl+shift+]",
             "speed_down": "ctrl+shift+[",
             "open_input": "ctrl+shift+r",
+            "next_sentence": "ctrl+shift+.",
+            "previous_sentence": "ctrl+shift+,",
+        },
+        "synthesis_workers": 1,
+        "queue_reads": False,
+        "cache": {
+            "directory": "~/.cache/speakeasy/audio",
+            "memory_mb": 64,
+            "disk_mb": 512,
+        },
+        "voice_pool": {
+            "max_voices": 3,
+            "memory_mb": 1024,
+        },
+        "voice_index": "~/.cache/speakeasy/voices.json",
+        "audio": {
+            "persistent_stream": True,
+            "latency": "high",
+            "blocksize": 0,
+            "output_rate": "device",
+        },
+        "extraction": {
+            "parser": "auto",
+            "main_content": True,
+            "streaming": False,
+            "max_page_mb": 10,
+            "batch_workers": 8,
+            "per_host": 2,
+            "retries": 2,
+            "feed_limit": 30,
+            "cache_directory": "~/.cache/speakeasy/pages",
+            "cache_mb": 64,
         },
     }
 
@@ -40,14 +78,31 @@ class Settings:
         """
         if self.config_path.exists():
             with open(self.config_path) as f:
-                return json.load(f)
+                return self._with_defaults(json.load(f))
         else:
             # Create defaults
-            settings = self.DEFAULT_SETTINGS.copy()
+            settings = copy.deepcopy(self.DEFAULT_SETTINGS)
             self._settings = settings
             self.save()
             return settings
 
+    def _with_defaults(self, loaded: dict) -> dict:
+        """Fill in defaults for keys missing from an older config file.
+
+        Args:
+            loaded: Settings read from disk
+
+        Returns:
+            Settings dictionary containing every default key
+        """
+        settings = copy.deepcopy(self.DEFAULT_SETTINGS)
+        for key, value in loaded.items():
+            if isinstance(value, dict) and isinstance(settings.get(key), dict):
+                settings[key].update(value)
+            else:
+                settings[key] = value
+        return settings
+
     def save(self) -> None:
         """Persist settings to JSON file."""
         with open(self.config_path, "w") as f:
@@ -0,0 +1,168 @@
+"""Multi-process sentence synthesis across a pool of Piper voices"""
+import logging
+import multiprocessing
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from piper import PiperVoice
+from piper.config import SynthesisConfig
+
+logger = logging.getLogger(__name__)
+
+# Voice loaded once per worker process by _init_worker
+_worker_voice: PiperVoice | None = None
+
+
+def _init_worker(model_path: str) -> None:
+    """Load the voice model in a freshly started worker process"""
+    global _worker_voice
+    _worker_voice = PiperVoice.load(model_path)
+
+
+def _synthesize_sentence(text: str, length_scale: float | None) -> np.ndarray:
+    """Synthesize one sentence in a worker process"""
+    syn_config = SynthesisConfig(length_scale=length_scale) if length_scale is not None else None
+    chunks = _worker_voice.synthesize(text, syn_config=syn_config)
+    arrays = [chunk.audio_int16_array for chunk in chunks]
+    if not arrays:
+        return np.array([], dtype=np.int16)
+    return np.concatenate(arrays)
+
+
+class SynthesisPool:
+    """Fan sentences out to worker processes that each hold a loaded voice
+
+    A single ONNX session synthesizes one sentence at a time; running N
+    sessions in separate processes lets long documents use N cores. Results
+    are yielded in input order, with a bounded number of sentences in flight
+    so memory does not grow with document length.
+
+    Closing the pool waits for reads already in progress, and for holds
+    taken with ``hold()``: the workers are shut down when the last one is
+    released.
+    """
+
+    def __init__(
+        self,
+        model_path: Path | str,
+        workers: int,
+        mp_context: str = "spawn",
+    ):
+        """
+        Initialize synthesis pool
+
+        Args:
+            model_path: Path to the voice model (.onnx)
+            workers: Number of worker processes
+            mp_context: Multiprocessing start method
+        """
+        if workers < 1:
+            raise ValueError("Worker count must be at least 1")
+
+        self.model_path = Path(model_path)
+        self.workers = workers
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context(mp_context),
+            initializer=_init_worker,
+            initargs=(str(self.model_path),),
+        )
+        self._lock = threading.Lock()
+        self._active = 0  # Holds, including synthesize() calls in progress
+        self._closing = False
+        self._stopped = False
+
+        logger.info(f"Started synthesis pool with {workers} workers for {self.model_path.name}")
+
+    def synthesize(
+        self,
+        sentences: Iterable[str],
+        lookup: Callable[[str], np.ndarray | None] | None = None,
+        length_scale: float | None = None,
+    ) -> Iterator[np.ndarray]:
+        """
+        Synthesize sentences in parallel, yielding audio in input order
+
+        Args:
+            sentences: Sentence texts
+            lookup: Returns already-known audio for a sentence (e.g. a cache),
+                which is passed through in order without using a worker
+            length_scale: Piper phoneme duration scale (None for the voice default)
+
+        Yields:
+            int16 audio samples for each sentence
+
+        Raises:
+            RuntimeError: If the pool's workers have been shut down
+        """
+        self.hold()
+
+        # Keep every worker busy with one queued sentence behind it
+        lookahead = self.workers * 2
+        pending: deque[Future] = deque()
+
+        try:
+            for text in sentences:
+                audio = lookup(text) if lookup is not None else None
+                if audio is not None:
+                    future = Future()
+                    future.set_result(audio)
+                    pending.append(future)
+                else:
+                    pending.append(self._executor.submit(_synthesize_sentence, text, length_scale))
+                # Hand back finished results without waiting for more input
+                while pending and (len(pending) >= lookahead or pending[0].done()):
+                    yield pending.popleft().result()
+
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # Consumer stopped early or a sentence failed: drop queued work
+            for future in pending:
+                future.cancel()
+            self.release()
+
+    def hold(self) -> None:
+        """
+        Keep the workers running until ``release()``, even if the pool is closed
+
+        Lets a read that will start later still use the pool it was given.
+
+        Raises:
+            RuntimeError: If the pool's workers have been shut down
+        """
+        with self._lock:
+            if self._stopped:
+                raise RuntimeError(f"Synthesis pool for {self.model_path.name} is closed")
+            self._active += 1
+
+    def release(self) -> None:
+        """Release a hold, shutting the workers down if the pool is closed and idle"""
+        with self._lock:
+            self._active -= 1
+            idle = self._closing and not self._active
+            self._stopped = self._stopped or idle
+        if idle:
+            self._shutdown()
+
+    def close(self) -> None:
+        """Shut down the worker processes once reads in progress have finished"""
+        with self._lock:
+            if self._closing:
+                return
+            self._closing = True
+            active = self._active
+            self._stopped = not active
+        if active:
+            logger.info(f"Stopping synthesis pool after {active} reads in progress")
+        else:
+            self._shutdown()
+
+    def _shutdown(self) -> None:
+        """Stop the worker processes"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        logger.info(f"Stopped synthesis pool for {self.model_path.name}")
@@ -1,28 +1,150 @@
 """Text extraction from URLs and plain text."""
 
+import codecs
+import logging
 import re
+from collections.abc import Iterator
+from dataclasses import dataclass
+from importlib.util import find_spec
 from urllib.parse import urlparse
 
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+from src.html_stream import ParagraphStream
+from src.page_cache import CachedPage, PageCache
+from src.readability import ContentNode, from_lexbor, from_lxml, from_soup, main_content
+from src.segmenter import split_paragraphs
+
+logger = logging.getLogger(__name__)
+
+# HTML parser backends, fastest first. selectolax and lxml are optional
+# dependencies; html.parser ships with Python and is always available.
+PARSERS = ("selectolax", "lxml", "html.parser")
+
+# Module each parser backend needs
+_PARSER_MODULES = {
+    "selectolax": "selectolax.lexbor",
+    "lxml": "lxml.html",
+    "html.parser": None,
+}
+
+# Elements whose text is never read aloud
+EXCLUDED_TAGS = ("script", "style", "nav", "header", "footer", "aside")
+
+# Main content shorter than this is assumed to be a misdetection, and the
+# whole page is read instead
+MIN_MAIN_CONTENT_CHARS = 250
+
+# Bytes read from a streamed response at a time
+STREAM_CHUNK_BYTES = 16 * 1024
+
+
+def available_parsers() -> list[str]:
+    """List the HTML parser backends that can be used, fastest first.
+
+    Returns:
+        Names from PARSERS whose modules are installed
+    """
+    available = []
+    for name in PARSERS:
+        module = _PARSER_MODULES[name]
+        try:
+            if module is None or find_spec(module) is not None:
+                available.append(name)
+        except ImportError:
+            # Parent package missing or too old to have the module
+            pass
+    return available
+
+
+@dataclass
+class ExtractedText:
+    """Text extracted from a page, with how much of the page it kept."""
+
+    text: str
+    total_chars: int  # Characters in the whole page's text
+
+    @property
+    def discarded_chars(self) -> int:
+        """Characters dropped as boilerplate."""
+        return max(0, self.total_chars - len(self.text))
+
+    @property
+    def discarded_fraction(self) -> float:
+        """Share of the page's text dropped as boilerplate."""
+        return self.discarded_chars / self.total_chars if self.total_chars else 0.0
 
 
 class TextExtractor:
-    """Extract and clean text from URLs or plain text input."""
+    """Extract and clean text from URLs or plain text input.
 
-    def __init__(self, timeout: int = 30):
+    HTML is parsed with the fastest available backend. Every backend drops
+    the same elements and joins the remaining text nodes in document order,
+    so they produce the same text apart from how malformed markup is
+    repaired; ``html.parser`` is the fallback for anything a faster backend
+    cannot handle.
+
+    With a ``PageCache``, pages the server allows to be cached are served
+    from disk while fresh, without downloading or parsing them again, and
+    revalidated with a conditional request once stale.
+
+    With ``main_content``, comment sections, cookie banners, related-link
+    lists and other boilerplate around the article are dropped: blocks are
+    scored readability-style on text length, commas and link density, and
+    only the best-scoring block and its siblings are kept.
+
+    ``iter_paragraphs`` streams instead: paragraphs are released as the
+    page downloads, up to ``max_bytes`` of it, so reading can start before
+    a slow or huge page has arrived.
+    """
+
+    def __init__(
+        self,
+        timeout: int = 30,
+        parser: str = "auto",
+        cache: PageCache | None = None,
+        main_content: bool = True,
+        max_bytes: int = 10 * 1024 * 1024,
+        pool_size: int = 10,
+    ):
         """Initialize TextExtractor.
 
         Args:
             timeout: Timeout in seconds for HTTP requests
+            parser: HTML parser backend, one of PARSERS, or "auto" for the
+                fastest installed one. An uninstalled backend falls back to
+                the next available one.
+            cache: Disk cache for fetched pages and their text (None to
+                always download)
+            main_content: Keep only the page's main content rather than
+                all of its text
+            max_bytes: Most bytes of a page read by iter_paragraphs(); the
+                rest is not downloaded
+            pool_size: Connections kept open per host, which bounds how
+                many requests can share the session concurrently
+
+        Raises:
+            ValueError: If parser is not a known backend
         """
+        if parser != "auto" and parser not in PARSERS:
+            raise ValueError(f"Parser must be 'auto' or one of {PARSERS}")
+
         self.timeout = timeout
+        self.parser = self._resolve_parser(parser)
+        self.cache = cache
+        self.main_content = main_content
+        self.max_bytes = max_bytes
         self.session = requests.Session()
         self.session.headers.update({
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
                          "AppleWebKit/537.36 (KHTML, like Gecko) "
                          "Chrome/91.0.4472.124 Safari/537.36"
         })
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
     def is_url(self, text: str) -> bool:
         """Check if text is a valid URL.
@@ -58,6 +180,79 @@ class TextExtractor:
         else:
             return input_text
 
+    def iter_paragraphs(self, input_text: str) -> Iterator[str]:
+        """Extract paragraphs from a URL while it downloads, or split plain text.
+
+        The response is read in chunks and parsed incrementally, and each
+        paragraph is yielded as soon as it is complete. Reading stops after
+        ``max_bytes``. A fresh page in the cache is served from there, and a
+        completely downloaded page is cached for later ``extract()`` calls.
+
+        Args:
+            input_text: URL or plain text to extract from
+
+        Yields:
+            Cleaned paragraphs in document order
+
+        Raises:
+            requests.HTTPError: If URL returns error status code
+            requests.Timeout: If request times out
+            requests.RequestException: For other request errors
+        """
+        if not self.is_url(input_text):
+            yield from split_paragraphs(input_text)
+            return
+
+        cached = self.cache.get(input_text) if self.cache is not None else None
+        if cached is not None and cached.is_fresh():
+            text = self._cached_text(input_text, cached)
+            if text is not None:
+                logger.debug(f"Serving {input_text} from the page cache")
+                yield from split_paragraphs(text)
+                return
+
+        yield from self._stream_url(input_text)
+
+    def _stream_url(self, url: str) -> Iterator[str]:
+        """Download a page in chunks, yielding paragraphs as they complete.
+
+        Args:
+            url: URL to fetch
+
+        Yields:
+            Cleaned paragraphs in document order
+        """
+        response = self.session.get(url, timeout=self.timeout, stream=True)
+        try:
+            response.raise_for_status()
+            try:
+                decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")("replace")
+            except LookupError:
+                decoder = codecs.getincrementaldecoder("utf-8")("replace")
+            stream = ParagraphStream(EXCLUDED_TAGS)
+            body: list[bytes] = []
+            received = 0
+
+            for chunk in response.iter_content(STREAM_CHUNK_BYTES):
+                chunk = chunk[: self.max_bytes - received]
+                received += len(chunk)
+                body.append(chunk)
+                stream.feed(decoder.decode(chunk))
+                yield from split_paragraphs(self._clean_whitespace(stream.take()))
+                if received >= self.max_bytes:
+                    logger.warning(f"Stopped reading {url} after {received} bytes")
+                    break
+
+            stream.feed(decoder.decode(b"", final=True))
+            stream.close()
+            yield from split_paragraphs(self._clean_whitespace(stream.take(final=True)))
+        finally:
+            response.close()
+
+        if self.cache is not None and received < self.max_bytes:
+            # The text is extracted from the cached body when it is next needed
+            self.cache.put(url, response.headers, b"".join(body), response.encoding)
+
     def _extract_from_url(self, url: str) -> str:
         """Fetch and extract text from URL.
 
@@ -72,22 +267,223 @@ class TextExtractor:
             requests.Timeout: If request times out
             requests.RequestException: For other request errors
         """
-        response = self.session.get(url, timeout=self.timeout)
+        cached = self.cache.get(url) if self.cache is not None else None
+        if cached is None:
+            response = self.session.get(url, timeout=self.timeout)
+            return self._extract_response(url, response)
+
+        if cached.is_fresh():
+            text = self._cached_text(url, cached)
+            if text is not None:
+                logger.debug(f"Serving {url} from the page cache")
+                return text
+
+        response = self.session.get(url, timeout=self.timeout, headers=cached.validators())
+        if response.status_code == 304:
+            page = self.cache.revalidated(url, response.headers) or cached
+            text = self._cached_text(url, page)
+            if text is not None:
+                logger.debug(f"Revalidated {url} in the page cache")
+                return text
+            # The cached body is gone; fetch it again in full
+            response = self.session.get(url, timeout=self.timeout)
+
+        return self._extract_response(url, response)
+
+    def _extract_response(self, url: str, response: requests.Response) -> str:
+        """Extract text from a full response and cache both if allowed.
+
+        Args:
+            url: URL the response was fetched from
+            response: HTTP response
+
+        Returns:
+            Extracted and cleaned text
+
+        Raises:
+            requests.HTTPError: If the response has an error status code
+        """
         response.raise_for_status()
+        text = self.extract_html(response.text)
+
+        if self.cache is not None:
+            self.cache.put(
+                url, response.headers, response.content, response.encoding, text, self._variant
+            )
+        return text
 
-        soup = BeautifulSoup(response.text, "html.parser")
+    def _cached_text(self, url: str, page: CachedPage) -> str | None:
+        """Get a cached page's text, re-extracting the body if other settings made it.
+
+        Args:
+            url: Page URL
+            page: Cache entry
+
+        Returns:
+            Extracted text, or None if the body is no longer cached
+        """
+        if page.text is not None and page.parser == self._variant:
+            return page.text
+
+        body = self.cache.body(url)
+        if body is None:
+            return None
+        text = self.extract_html(body.decode(page.encoding or "utf-8", errors="replace"))
+        self.cache.set_text(url, text, self._variant)
+        return text
+
+    def extract_html(self, html: str) -> str:
+        """Extract readable text from an HTML document.
+
+        Args:
+            html: HTML markup
+
+        Returns:
+            Extracted and cleaned text
+        """
+        return self.extract_document(html).text
+
+    def extract_document(self, html: str) -> ExtractedText:
+        """Extract readable text from an HTML document and report what was dropped.
+
+        Args:
+            html: HTML markup
+
+        Returns:
+            Extracted and cleaned text with the length of the page's full text
+        """
+        try:
+            extracted = self._extract(html, self.parser)
+        except Exception as e:
+            if self.parser == "html.parser":
+                raise
+            logger.warning(f"{self.parser} could not parse document, using html.parser: {e}")
+            extracted = self._extract(html, "html.parser")
+
+        if extracted.discarded_chars:
+            logger.info(
+                f"Kept {len(extracted.text)} of {extracted.total_chars} characters "
+                f"({extracted.discarded_fraction:.0%} discarded as boilerplate)"
+            )
+        return extracted
+
+    @property
+    def _variant(self) -> str:
+        """Name of the extraction settings, stored with cached text."""
+        return f"{self.parser}+main" if self.main_content else self.parser
+
+    def _extract(self, html: str, parser: str) -> ExtractedText:
+        """Extract text with one backend.
+
+        Args:
+            html: HTML markup
+            parser: Backend to parse with
+
+        Returns:
+            Extracted and cleaned text
+        """
+        if not self.main_content:
+            text = self._clean_whitespace(self._html_text(html, parser))
+            return ExtractedText(text, len(text))
+
+        document = self._content_tree(html, parser)
+        full_text = self._clean_whitespace(document.text())
+        blocks = main_content(document)
+        if blocks:
+            text = self._clean_whitespace("\n\n".join(block.text() for block in blocks))
+            if len(text) >= MIN_MAIN_CONTENT_CHARS:
+                return ExtractedText(text, len(full_text))
+        return ExtractedText(full_text, len(full_text))
+
+    @staticmethod
+    def _resolve_parser(parser: str) -> str:
+        """Pick the backend to use for a requested parser.
+
+        Args:
+            parser: Backend name or "auto"
+
+        Returns:
+            The requested backend if installed, otherwise the next available one
+        """
+        available = available_parsers()
+        if parser == "auto":
+            return available[0]
+
+        for name in PARSERS[PARSERS.index(parser) :]:
+            if name in available:
+                if name != parser:
+                    logger.warning(f"HTML parser {parser} is not installed, using {name}")
+                return name
+        return "html.parser"
+
+    @staticmethod
+    def _html_text(html: str, parser: str) -> str:
+        """Get the text of an HTML document without excluded elements.
+
+        Args:
+            html: HTML markup
+            parser: Backend to parse with
+
+        Returns:
+            Text nodes joined in document order, whitespace untouched
+        """
+        if parser == "selectolax":
+            from selectolax.lexbor import LexborHTMLParser
+
+            tree = LexborHTMLParser(html)
+            tree.strip_tags(list(EXCLUDED_TAGS))
+            return tree.root.text(deep=True, separator="") if tree.root is not None else ""
+
+        if parser == "lxml":
+            import lxml.html
+            from lxml import etree
+
+            if not html.strip():
+                return ""
+            root = lxml.html.document_fromstring(html)
+            # Template contents and comments are not part of the page text,
+            # matching BeautifulSoup's get_text()
+            etree.strip_elements(
+                root, *EXCLUDED_TAGS, "template", etree.Comment, etree.PI, with_tail=False
+            )
+            return "".join(root.itertext())
+
+        soup = BeautifulSoup(html, "html.parser")
 
         # Remove script, style, nav, and other non-content elements
-        for element in soup(["script", "style", "nav", "header", "footer", "aside"]):
+        for element in soup(list(EXCLUDED_TAGS)):
             element.decompose()
 
-        # Extract text
-        text = soup.get_text()
+        return soup.get_text()
 
-        # Clean whitespace
-        text = self._clean_whitespace(text)
+    @staticmethod
+    def _content_tree(html: str, parser: str) -> ContentNode:
+        """Parse an HTML document into a tree for content scoring.
 
-        return text
+        Args:
+            html: HTML markup
+            parser: Backend to parse with
+
+        Returns:
+            Document without excluded elements; its text is what
+            _html_text() returns
+        """
+        if parser == "selectolax":
+            from selectolax.lexbor import LexborHTMLParser
+
+            root = LexborHTMLParser(html).root
+            if root is None:
+                return ContentNode("#document")
+            return from_lexbor(root, EXCLUDED_TAGS)
+
+        if parser == "lxml":
+            import lxml.html
+
+            if not html.strip():
+                return ContentNode("#document")
+            return from_lxml(lxml.html.document_fromstring(html), EXCLUDED_TAGS)
+
+        return from_soup(BeautifulSoup(html, "html.parser"), EXCLUDED_TAGS)
 
     def _clean_whitespace(self, text: str) -> str:
         """Clean and normalize whitespace in text.
@@ -101,16 +497,12 @@ class TextExtractor:
         # Replace multiple spaces with single space
         text = re.sub(r" +", " ", text)
 
+        # Remove leading/trailing whitespace from each line, so lines that
+        # only held markup indentation become blank
+        text = "\n".join(line.strip() for line in text.split("\n"))
+
         # Replace multiple newlines with double newline (paragraph break)
         text = re.sub(r"\n\n+", "\n\n", text)
 
-        # Remove leading/trailing whitespace from each line
-        lines = [line.strip() for line in text.split("\n")]
-
         # Remove empty lines at start and end
-        while lines and not lines[0]:
-            lines.pop(0)
-        while lines and not lines[-1]:
-            lines.pop()
-
-        return "\n".join(lines)
+        return text.strip("\n")
@@ -0,0 +1,341 @@
+"""Pitch-preserving streaming time-stretch (WSOLA)"""
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+
+# int16 range as float32 scalars: np.clip with Python int bounds converts
+# them on every call, which allocates inside the audio callback
+INT16_MIN = np.float32(-32768)
+INT16_MAX = np.float32(32767)
+
+
+class TimeStretcher:
+    """Streaming WSOLA time-stretcher for mono int16 audio
+
+    Waveform-similarity overlap-add changes duration without changing pitch:
+    Hann-windowed frames are taken from the input every ``speed * hop``
+    samples and overlap-added every ``hop`` samples, with each frame shifted
+    by up to half a hop so its waveform lines up with the natural
+    continuation of the previous frame.
+
+    Input is pushed with ``write`` and output pulled with ``read_into``, one
+    frame at a time, so speed can change between frames and the cost of a
+    read is proportional to its size. Working memory is a few frames of
+    float32 regardless of how much audio passes through, and reading and
+    writing allocate no sample buffers, so it can run inside an audio
+    callback.
+    """
+
+    def __init__(self, speed: float = 1.0, sample_rate: int = 22050, frame_ms: float = 30.0):
+        """
+        Initialize time-stretcher
+
+        Args:
+            speed: Speed multiplier (2.0 = half the duration)
+            sample_rate: Sample rate in Hz (sets frame size in samples)
+            frame_ms: Analysis frame length in milliseconds
+        """
+        self.sample_rate = sample_rate
+        frame = max(64, int(sample_rate * frame_ms / 1000)) // 2 * 2
+        self._frame = frame
+        self._hop = frame // 2
+        self._tolerance = self._hop // 2
+        # Periodic Hann: overlapping at 50% sums to exactly one
+        self._window = (0.5 - 0.5 * np.cos(2 * np.pi * np.arange(frame) / frame)).astype(
+            np.float32
+        )
+
+        # Input history as float32; room for one incoming block plus context
+        self._block = frame * 8
+        self._input = np.zeros(self._block + frame * 4, dtype=np.float32)
+        self._overlap = np.zeros(frame, dtype=np.float32)
+        self._frame_buf = np.zeros(frame, dtype=np.float32)
+        # Finished output hop waiting to be read
+        self._ready = np.zeros(self._hop, dtype=np.float32)
+        # Candidate alignments and their similarity scores
+        self._candidates = np.zeros((2 * self._tolerance + 1, self._hop), dtype=np.float32)
+        self._scores = np.zeros(2 * self._tolerance + 1, dtype=np.float32)
+
+        self.set_speed(speed)
+        self.reset()
+
+    @property
+    def speed(self) -> float:
+        """Get current speed multiplier"""
+        return self._speed
+
+    @property
+    def free(self) -> int:
+        """Number of input samples ``write`` can accept right now"""
+        self._compact()
+        return len(self._input) - self._input_len
+
+    @property
+    def finished(self) -> bool:
+        """Whether ``finish`` was called and all output has been read"""
+        return self._done and self._ready_pos == self._ready_len
+
+    @property
+    def source_position(self) -> float:
+        """Input position of the next output sample to be read"""
+        if self._ready_len == 0:
+            return self._ready_start
+        step = (self._ready_end - self._ready_start) / self._ready_len
+        return self._ready_start + self._ready_pos * step
+
+    def set_speed(self, speed: float) -> None:
+        """
+        Change speed; takes effect from the next frame
+
+        Args:
+            speed: Speed multiplier
+        """
+        if speed <= 0:
+            raise ValueError("Speed must be positive")
+        self._speed = speed
+        self._analysis_hop = self._hop * speed
+
+    def reset(self) -> None:
+        """Discard all buffered audio and start a new stream"""
+        # Start with one hop of silence so the first real samples are not
+        # faded in by the window; the matching output is skipped below
+        self._input[: self._hop] = 0
+        self._input_len = self._hop
+        self._input_base = -self._hop  # Stream index of self._input[0]
+        self._nominal = float(-self._hop)  # Next frame's nominal input position
+        self._previous: int | None = None
+        self._overlap[:] = 0
+        self._skip = True
+        self._ending: int | None = None  # Input length once finish() is called
+        self._done = False
+        # Input range covered by the ready hop; output maps linearly onto it
+        self._ready_len = 0
+        self._ready_pos = 0
+        self._ready_start = 0.0
+        self._ready_end = 0.0
+
+    def write(self, samples: np.ndarray) -> int:
+        """
+        Append input samples
+
+        Args:
+            samples: int16 input samples
+
+        Returns:
+            Number of samples accepted (at most ``free``)
+        """
+        if self._ending is not None:
+            raise ValueError("Cannot write after finish()")
+        self._compact()
+        count = min(len(samples), len(self._input) - self._input_len)
+        self._input[self._input_len : self._input_len + count] = samples[:count]
+        self._input_len += count
+        return count
+
+    def finish(self) -> None:
+        """Mark the end of input so the tail can be read out"""
+        if self._ending is None:
+            self._ending = self._input_base + self._input_len
+
+    def read_into(self, out: np.ndarray) -> int:
+        """
+        Copy up to ``len(out)`` output samples into ``out``
+
+        Args:
+            out: Destination buffer
+
+        Returns:
+            Number of samples copied; fewer than requested when more input
+            is needed or the stream has finished
+        """
+        filled = 0
+        total = len(out)
+        while filled < total:
+            if self._ready_pos == self._ready_len and not self._next_hop():
+                break
+            count = min(total - filled, self._ready_len - self._ready_pos)
+            out[filled : filled + count] = self._ready[self._ready_pos : self._ready_pos + count]
+            self._ready_pos += count
+            filled += count
+        return filled
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """
+        Stretch the next block of a stream
+
+        Args:
+            samples: int16 input samples
+
+        Returns:
+            int16 output samples available so far (may be empty)
+        """
+        outputs: list[np.ndarray] = []
+        offset = 0
+        while offset < len(samples):
+            offset += self.write(samples[offset : offset + self._block])
+            self._drain(outputs)
+        return self._join(outputs)
+
+    def flush(self) -> np.ndarray:
+        """
+        Emit the remaining output at the end of a stream and reset
+
+        Returns:
+            int16 output samples
+        """
+        outputs: list[np.ndarray] = []
+        self.finish()
+        self._drain(outputs)
+        self.reset()
+        return self._join(outputs)
+
+    def _drain(self, outputs: list[np.ndarray]) -> None:
+        """Read all currently available output"""
+        while True:
+            out = np.empty(self._block, dtype=np.int16)
+            count = self.read_into(out)
+            if count:
+                outputs.append(out[:count])
+            if count < len(out):
+                return
+
+    def _compact(self) -> None:
+        """Drop input that no future frame can reach"""
+        keep_from = int(self._nominal) - self._tolerance
+        if self._previous is not None:
+            keep_from = min(keep_from, self._previous + self._hop)
+        drop = keep_from - self._input_base
+        if drop <= 0:
+            return
+        drop = min(drop, self._input_len)
+        remaining = self._input_len - drop
+        self._input[:remaining] = self._input[drop : self._input_len]
+        self._input_len = remaining
+        self._input_base += drop
+
+    def _next_hop(self) -> bool:
+        """Overlap-add frames until one output hop is ready"""
+        hop = self._hop
+        while not self._done:
+            # Each emitted hop covers the input between successive frame centres
+            start = self._ready_end
+            if self._ending is not None and start >= self._ending:
+                self._done = True
+                break
+
+            frame_nominal = self._nominal
+            if not self._add_frame():
+                return False
+
+            if self._skip:
+                # The first frame is centred on the padding; drop its output
+                self._skip = False
+                self._shift()
+                continue
+
+            end = frame_nominal + hop
+            length = hop
+            if self._ending is not None and end > self._ending:
+                # Last hop: keep only the part that maps onto real input
+                length = min(hop, round((self._ending - start) / self._speed))
+                end = self._ending
+                if length == 0:
+                    self._done = True
+                    break
+
+            np.rint(self._overlap[:hop], out=self._ready)
+            np.minimum(self._ready, INT16_MAX, out=self._ready)
+            np.maximum(self._ready, INT16_MIN, out=self._ready)
+            self._ready_len = length
+            self._ready_pos = 0
+            self._ready_start = start
+            self._ready_end = end
+            self._shift()
+            return True
+
+        self._ready_len = self._ready_pos = 0
+        self._ready_start = self._ready_end
+        return False
+
+    def _add_frame(self) -> bool:
+        """Overlap-add the next frame, or return False if input is short"""
+        frame = self._frame
+        nominal = round(self._nominal)
+        end = nominal + self._tolerance + frame
+        available_end = self._input_base + self._input_len
+
+        if end > available_end:
+            if self._ending is None:
+                return False
+            # Pad with silence so the tail can be emitted
+            self._compact()
+            pad = end - (self._input_base + self._input_len)
+            self._input[self._input_len : self._input_len + pad] = 0
+            self._input_len += pad
+
+        position = self._align(nominal)
+        start = position - self._input_base
+        np.multiply(self._input[start : start + frame], self._window, out=self._frame_buf)
+        self._overlap += self._frame_buf
+        self._previous = position
+        self._nominal += self._analysis_hop
+        return True
+
+    def _shift(self) -> None:
+        """Move the overlap accumulator forward by one hop"""
+        hop = self._hop
+        self._overlap[:hop] = self._overlap[hop:]
+        self._overlap[hop:] = 0
+
+    def _align(self, nominal: int) -> int:
+        """Pick the frame start near ``nominal`` most similar to the natural continuation"""
+        if self._previous is None or self._speed == 1.0:
+            return nominal
+
+        hop = self._hop
+        base = self._input_base
+        lowest = max(nominal - self._tolerance, base)
+        template_start = self._previous + hop - base
+        template = self._input[template_start : template_start + hop]
+        region_start = lowest - base
+        region = self._input[region_start : nominal + self._tolerance + hop - base]
+        count = len(region) - hop + 1
+        if count <= 0:
+            return nominal
+
+        # Cross-correlate via a matrix of shifted windows copied into place,
+        # which unlike np.correlate needs no temporary output array
+        itemsize = region.itemsize
+        windows = as_strided(region, shape=(count, hop), strides=(itemsize, itemsize))
+        candidates = self._candidates[:count]
+        scores = self._scores[:count]
+        np.copyto(candidates, windows)
+        np.dot(candidates, template, out=scores)
+        return lowest + int(scores.argmax())
+
+    @staticmethod
+    def _join(outputs: list[np.ndarray]) -> np.ndarray:
+        """Concatenate output blocks"""
+        if not outputs:
+            return np.array([], dtype=np.int16)
+        return np.concatenate(outputs)
+
+
+def time_stretch(audio: np.ndarray, speed: float, sample_rate: int = 22050) -> np.ndarray:
+    """
+    Change the duration of audio without changing its pitch
+
+    Args:
+        audio: int16 samples
+        speed: Speed multiplier (2.0 = half the duration)
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        int16 samples, about ``len(audio) / speed`` long
+    """
+    if speed == 1.0 or len(audio) == 0:
+        return audio
+
+    stretcher = TimeStretcher(speed, sample_rate)
+    head = stretcher.process(audio)
+    tail = stretcher.flush()
+    return np.concatenate([head, tail])
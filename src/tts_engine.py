@@ -1,9 +1,23 @@
 """Piper TTS Engine wrapper for text-to-speech synthesis"""
 import logging
+import threading
+import time
+import weakref
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
 from pathlib import Path
 
 import numpy as np
 from piper import PiperVoice
+from piper.config import SynthesisConfig
+
+from src.audio_cache import AudioCache
+from src.segmenter import Sentence, split_sentences
+from src.sentence_index import SentenceIndex
+from src.synthesis_pool import SynthesisPool
+from src.voice_catalog import VoiceCatalog
+from src.voice_pool import VoicePool
 
 logger = logging.getLogger(__name__)
 
@@ -13,39 +27,81 @@ class TTSError(Exception):
     pass
 
 
+@dataclass
+class VoiceSnapshot:
+    """The loaded voice's synthesis state, captured together for one read
+
+    A read keeps the voice it started with even if another one is loaded
+    meanwhile, so its audio is cached under the right voice and played at
+    the right sample rate.
+    """
+
+    name: str
+    voice: PiperVoice
+    voice_id: str  # Cache key prefix, tied to the exact model file
+    sample_rate: int
+    length_scale: float
+    pool: SynthesisPool | None = None
+
+    def __post_init__(self):
+        # The pool's workers keep running for as long as the snapshot exists,
+        # even if a voice switch closes the pool meanwhile
+        if self.pool is not None:
+            self.pool.hold()
+            weakref.finalize(self, self.pool.release)
+
+
 class PiperTTSEngine:
     """Wrapper for Piper TTS synthesis with voice management and speed control"""
 
-    def __init__(self, voices_dir: Path | str | None = None):
+    def __init__(
+        self,
+        voices_dir: Path | str | None = None,
+        workers: int = 1,
+        cache: AudioCache | None = None,
+        voice_pool: VoicePool | None = None,
+        catalog: VoiceCatalog | None = None,
+    ):
         """
         Initialize TTS engine
 
         Args:
             voices_dir: Directory containing voice model files (.onnx)
+            workers: Number of synthesis processes (1 synthesizes in-process)
+            cache: Sentence audio cache (None disables caching)
+            voice_pool: Pool of loaded voices (defaults to one over voices_dir)
+            catalog: Index of available voices (defaults to an in-memory one)
         """
         if voices_dir is None:
             self.voices_dir = Path(__file__).parent.parent / "voices"
         else:
             self.voices_dir = Path(voices_dir)
+        self.voice_pool = voice_pool if voice_pool is not None else VoicePool(self.voices_dir)
+        self.catalog = catalog if catalog is not None else VoiceCatalog(self.voices_dir)
         self._voice: PiperVoice | None = None
         self._current_voice_name: str | None = None
         self._sample_rate: int = 22050
+        self._length_scale: float = 1.0
+        self._voice_id: str | None = None
+        self.cache = cache
+        self._workers = 1
+        self._pool: SynthesisPool | None = None
+        self._pool_voice_id: str | None = None
+        # Held while the voice's state changes, so snapshots see all of it or none
+        self._state_lock = threading.Lock()
+        self.set_workers(workers)
 
         logger.info(f"Initialized TTS engine with voices directory: {self.voices_dir}")
 
     def discover_voices(self) -> list[str]:
         """
-        Scan voices directory for available voice models
+        List available voice models, picking up changes to the voices directory
 
         Returns:
             List of voice names (without .onnx extension)
         """
-        if not self.voices_dir.exists():
-            logger.warning(f"Voices directory does not exist: {self.voices_dir}")
-            return []
-
-        voice_files = self.voices_dir.glob("*.onnx")
-        voices = [f.stem for f in voice_files]
+        self.catalog.refresh()
+        voices = self.catalog.names()
 
         logger.info(f"Discovered {len(voices)} voices: {voices}")
         return voices
@@ -60,40 +116,163 @@ class PiperTTSEngine:
         Raises:
             FileNotFoundError: If voice file doesn't exist
         """
-        voice_path = self.voices_dir / f"{voice_name}.onnx"
+        info = self.catalog.get(voice_name)
+        if info is None and self.catalog.refresh():
+            # The voice may have been added since the last scan
+            info = self.catalog.get(voice_name)
 
-        if not voice_path.exists():
+        if info is None:
+            voice_path = self.voices_dir / f"{voice_name}.onnx"
             raise FileNotFoundError(
                 f"Voice file not found: {voice_path}. "
-                f"Available voices: {self.discover_voices()}"
+                f"Available voices: {self.catalog.names()}"
+            )
+
+        # Load voice model (near-instant if it is still in the pool)
+        voice = self.voice_pool.get(voice_name).voice
+
+        with self._state_lock:
+            self._voice = voice
+            self._current_voice_name = voice_name
+            # Cache entries are tied to the exact model file
+            self._voice_id = f"{voice_name}:{info.size}:{info.mtime_ns}"
+            self._sample_rate = info.sample_rate
+            self._length_scale = info.length_scale
+            self._select_pool()
+
+        logger.info(f"Loaded voice: {voice_name} (sample rate: {info.sample_rate})")
+
+    def snapshot(self) -> VoiceSnapshot:
+        """
+        Capture the loaded voice for a read
+
+        Returns:
+            The voice, its cache identity, sample rate and worker pool
+
+        Raises:
+            TTSError: If no voice is loaded
+        """
+        with self._state_lock:
+            if self._voice is None:
+                raise TTSError(
+                    "No voice loaded. Call load_voice() first. "
+                    f"Available voices: {self.catalog.names()}"
+                )
+            return VoiceSnapshot(
+                self._current_voice_name,
+                self._voice,
+                self._voice_id,
+                self._sample_rate,
+                self._length_scale,
+                self._pool,
             )
 
-        # Load voice model
-        self._voice = PiperVoice.load(str(voice_path))
-        self._current_voice_name = voice_name
+    def warm_up(self, text: str = "Hello.") -> float:
+        """
+        Run a throwaway synthesis so the first real request is not slowed
+        by ONNX lazy initialization
+
+        Bypasses the cache so inference really runs. With a worker pool,
+        every worker process is started and warmed too.
+
+        Args:
+            text: Short phrase to synthesize
 
-        # Get sample rate from voice config if available
-        config_path = voice_path.with_suffix(".onnx.json")
-        if config_path.exists():
-            import json
-            with open(config_path) as f:
-                config = json.load(f)
-                self._sample_rate = config.get("sample_rate", 22050)
+        Returns:
+            Seconds spent warming up
 
-        logger.info(f"Loaded voice: {voice_name} (sample rate: {self._sample_rate})")
+        Raises:
+            TTSError: If no voice is loaded or synthesis fails
+        """
+        voice = self.snapshot()
+
+        started = time.perf_counter()
+        try:
+            list(self._synthesize_each(voice.voice, [text], voice.length_scale))
+            if voice.pool is not None:
+                texts = [text] * voice.pool.workers
+                list(voice.pool.synthesize(texts, length_scale=voice.length_scale))
+        except Exception as e:
+            raise TTSError(f"Warm-up failed: {e}") from e
+
+        elapsed = time.perf_counter() - started
+        logger.info(f"Warmed up voice {voice.name} in {elapsed:.3f}s")
+        return elapsed
+
+    def set_workers(self, workers: int) -> None:
+        """
+        Set the number of synthesis worker processes
+
+        With more than one worker, sentences are synthesized in parallel by
+        separate processes that each hold their own copy of the voice.
+
+        Args:
+            workers: Number of workers (1 disables the process pool)
+
+        Raises:
+            ValueError: If workers is less than 1
+        """
+        if workers < 1:
+            raise ValueError("Worker count must be at least 1")
+
+        if workers == self._workers:
+            return
+
+        with self._state_lock:
+            self._workers = workers
+            self.close()
+            self._select_pool()
+
+    @property
+    def workers(self) -> int:
+        """Get the number of synthesis workers"""
+        return self._workers
+
+    def close(self) -> None:
+        """Release synthesis worker processes once reads in progress finish"""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+            self._pool_voice_id = None
+
+    def _select_pool(self) -> None:
+        """
+        Run a worker pool for the current voice, closing the previous voice's
+
+        Only the current voice has workers, since each worker process holds
+        its own copy of the model. Reads still using the previous pool
+        finish on it before its workers stop.
+        """
+        voice_id = self._voice_id if self._workers > 1 else None
+        if self._pool is not None and self._pool_voice_id == voice_id:
+            return
+
+        self.close()
+        if voice_id is not None:
+            voice_path = self.voices_dir / f"{self._current_voice_name}.onnx"
+            self._pool = SynthesisPool(voice_path, self._workers)
+            self._pool_voice_id = voice_id
 
     @property
     def current_voice(self) -> str | None:
         """Get the currently loaded voice name"""
         return self._current_voice_name
 
-    def synthesize(self, text: str, speed: float = 1.0) -> tuple[np.ndarray, int]:
+    @property
+    def sample_rate(self) -> int:
+        """Get the sample rate of the loaded voice in Hz"""
+        return self._sample_rate
+
+    def synthesize(
+        self, text: str, speed: float = 1.0, index: SentenceIndex | None = None
+    ) -> tuple[np.ndarray, int]:
         """
         Synthesize text to audio
 
         Args:
             text: Text to synthesize
             speed: Playback speed multiplier (0.5 = half speed, 2.0 = double speed)
+            index: Filled with each sentence's sample offset and character range
 
         Returns:
             Tuple of (audio_data, sample_rate):
@@ -104,66 +283,228 @@ class PiperTTSEngine:
             ValueError: If text is empty
             TTSError: If no voice is loaded or synthesis fails
         """
-        # Validate input
         if not text or not text.strip():
             raise ValueError("Text cannot be empty")
 
-        if self._voice is None:
-            raise TTSError(
-                "No voice loaded. Call load_voice() first. "
-                f"Available voices: {self.discover_voices()}"
-            )
+        # The returned rate must be the one of the voice that synthesized
+        voice = self.snapshot()
+        audio_arrays = list(self.synthesize_stream(text, speed, index, voice))
 
-        try:
-            # Synthesize audio chunks from text
-            logger.debug("calling_piper_synthesize", text_length=len(text))
-            audio_chunks = list(self._voice.synthesize(text))
-            logger.debug("piper_synthesis_complete", chunk_count=len(audio_chunks))
-
-            # Concatenate all audio chunks into a single array
-            logger.debug("concatenating_audio_chunks")
-            audio_arrays = [chunk.audio_int16_array for chunk in audio_chunks]
-            if audio_arrays:
-                audio_data = np.concatenate(audio_arrays)
-            else:
-                audio_data = np.array([], dtype=np.int16)
-            logger.debug("concatenation_complete", total_samples=len(audio_data))
-
-            # Apply speed adjustment if needed
-            if speed != 1.0:
-                logger.debug("adjusting_speed", speed=speed, original_samples=len(audio_data))
-                audio_data = self._adjust_speed(audio_data, speed)
-                logger.debug("speed_adjustment_complete", adjusted_samples=len(audio_data))
-
-            logger.info(
-                f"Synthesized {len(text)} characters to {len(audio_data)} samples "
-                f"at {speed}x speed"
-            )
+        # Concatenate all audio chunks into a single array
+        logger.debug("concatenating_audio_chunks")
+        if audio_arrays:
+            audio_data = np.concatenate(audio_arrays)
+        else:
+            audio_data = np.array([], dtype=np.int16)
+        logger.debug("concatenation_complete")
+
+        logger.info(
+            f"Synthesized {len(text)} characters to {len(audio_data)} samples "
+            f"at {speed}x speed"
+        )
+
+        return audio_data, voice.sample_rate
+
+    def synthesize_stream(
+        self,
+        text: str,
+        speed: float = 1.0,
+        index: SentenceIndex | None = None,
+        voice: VoiceSnapshot | None = None,
+    ) -> Iterator[np.ndarray]:
+        """
+        Synthesize text to audio, yielding one chunk per sentence
 
-            return audio_data, self._sample_rate
+        Chunks are yielded as soon as Piper produces them, so the first one is
+        available after roughly one sentence of synthesis regardless of how
+        long the text is.
 
-        except Exception as e:
-            logger.error("synthesis_failed", error=str(e))
-            raise TTSError(f"Synthesis failed: {e}") from e
+        Args:
+            text: Text to synthesize
+            speed: Playback speed multiplier (0.5 = half speed, 2.0 = double speed)
+            index: Filled with each sentence's sample offset and character range
+                as its chunk is yielded (pass it to ``AudioPlayer.play_stream``)
+            voice: Voice to synthesize with (defaults to the one loaded now)
+
+        Returns:
+            Iterator of int16 numpy arrays at the voice's sample rate
+
+        Raises:
+            ValueError: If text is empty or speed is not positive
+            TTSError: If no voice is loaded, or (while iterating) if synthesis fails
+        """
+        # Validate eagerly so callers get errors before consuming the stream
+        if not text or not text.strip():
+            raise ValueError("Text cannot be empty")
+
+        if speed <= 0:
+            raise ValueError("Speed must be positive")
+
+        if voice is None:
+            voice = self.snapshot()
+
+        sentences = split_sentences(text)
+        chunks = self._iter_chunks(
+            self._synthesize_cached((sentence.text for sentence in sentences), speed, voice)
+        )
+        if index is not None:
+            chunks = self._index_chunks(chunks, sentences, index)
+        return chunks
 
-    def _adjust_speed(self, audio_data: np.ndarray, speed: float) -> np.ndarray:
+    def synthesize_sentences(
+        self, sentences: Iterable[str], speed: float = 1.0, voice: VoiceSnapshot | None = None
+    ) -> Iterator[np.ndarray]:
         """
-        Adjust audio playback speed
+        Synthesize pre-segmented sentences, yielding one array per sentence
+
+        Sentences may arrive lazily (e.g. from a pipeline queue). With more
+        than one worker they are synthesized in parallel and yielded in order.
 
         Args:
-            audio_data: Original audio samples
-            speed: Speed multiplier
+            sentences: Sentence texts
+            speed: Playback speed multiplier
+            voice: Voice to synthesize with (defaults to the one loaded now)
 
         Returns:
-            Speed-adjusted audio samples
+            Iterator of int16 numpy arrays at the voice's sample rate, one per sentence
+
+        Raises:
+            ValueError: If speed is not positive
+            TTSError: If no voice is loaded, or (while iterating) if synthesis fails
+        """
+        if speed <= 0:
+            raise ValueError("Speed must be positive")
+
+        if voice is None:
+            voice = self.snapshot()
+
+        return self._iter_chunks(self._synthesize_cached(sentences, speed, voice))
+
+    @staticmethod
+    def _cache_key(voice_id: str, sentence: str, length_scale: float) -> str:
+        """Cache key for a sentence with a voice and parameters"""
+        return AudioCache.key(voice_id, sentence, {"length_scale": round(length_scale, 4)})
+
+    def _synthesize_cached(
+        self, sentences: Iterable[str], speed: float, voice: VoiceSnapshot
+    ) -> Iterator[np.ndarray]:
+        """
+        Synthesize sentences at a speed, serving repeats from the cache
+
+        Speed is applied by Piper itself through ``length_scale``, so the
+        model generates audio of the right duration directly.
+
+        Args:
+            sentences: Sentence texts
+            speed: Playback speed multiplier
+            voice: Voice captured when the read started
+
+        Yields:
+            int16 audio samples for each sentence, in order
         """
-        # Simple resampling approach
-        # For better quality, could use scipy.signal.resample or librosa
-        original_length = len(audio_data)
-        new_length = int(original_length / speed)
+        pool = voice.pool
+        cache = self.cache
+        length_scale = voice.length_scale / speed
 
-        # Linear interpolation for speed adjustment
-        indices = np.linspace(0, original_length - 1, new_length)
-        adjusted_audio = np.interp(indices, np.arange(original_length), audio_data)
+        if cache is None:
+            if pool is not None:
+                yield from pool.synthesize(sentences, length_scale=length_scale)
+            else:
+                yield from self._synthesize_each(voice.voice, sentences, length_scale)
+            return
+
+        # Remember each sentence's key so results can be stored in order
+        keys: deque[str] = deque()
+
+        def keyed() -> Iterator[str]:
+            for sentence in sentences:
+                keys.append(self._cache_key(voice.voice_id, sentence, length_scale))
+                yield sentence
+
+        def lookup(sentence: str) -> np.ndarray | None:
+            return cache.get(self._cache_key(voice.voice_id, sentence, length_scale))
+
+        if pool is not None:
+            results = pool.synthesize(keyed(), lookup=lookup, length_scale=length_scale)
+        else:
+            results = self._synthesize_each(voice.voice, keyed(), length_scale, lookup=lookup)
+
+        for audio in results:
+            key = keys.popleft()
+            if key not in cache:
+                cache.put(key, audio)
+            yield audio
+
+    def _synthesize_each(
+        self,
+        voice: PiperVoice,
+        sentences: Iterable[str],
+        length_scale: float,
+        lookup: Callable[[str], np.ndarray | None] | None = None,
+    ) -> Iterator[np.ndarray]:
+        """
+        Synthesize sentences one at a time in-process
+
+        Args:
+            voice: Loaded Piper voice
+            sentences: Sentence texts
+            length_scale: Piper phoneme duration scale (lower is faster)
+            lookup: Returns already-known audio for a sentence
+
+        Yields:
+            int16 audio samples for each sentence
+        """
+        syn_config = SynthesisConfig(length_scale=length_scale)
+        for sentence in sentences:
+            audio = lookup(sentence) if lookup is not None else None
+            if audio is not None:
+                yield audio
+                continue
+
+            chunks = voice.synthesize(sentence, syn_config=syn_config)
+            arrays = [chunk.audio_int16_array for chunk in chunks]
+            if arrays:
+                yield np.concatenate(arrays)
+            else:
+                yield np.array([], dtype=np.int16)
+
+    @staticmethod
+    def _index_chunks(
+        chunks: Iterator[np.ndarray], sentences: list[Sentence], index: SentenceIndex
+    ) -> Iterator[np.ndarray]:
+        """
+        Record each sentence's chunk in an index as it is yielded
+
+        Args:
+            chunks: int16 audio, one chunk per sentence
+            sentences: Sentences the chunks were synthesized from
+            index: Index to append to
+
+        Yields:
+            int16 audio samples
+        """
+        for audio, sentence in zip(chunks, sentences, strict=False):
+            index.add(len(audio), sentence.start, sentence.end)
+            yield audio
+
+    def _iter_chunks(self, chunks: Iterator[np.ndarray]) -> Iterator[np.ndarray]:
+        """
+        Pass synthesized chunks through, wrapping failures
+
+        Args:
+            chunks: int16 audio produced by Piper or the worker pool
+
+        Yields:
+            int16 audio samples
+        """
+        chunk_count = 0
+        try:
+            logger.debug("calling_piper_synthesize")
+            for audio_data in chunks:
+                chunk_count += 1
+                yield audio_data
+        except Exception as e:
+            logger.error(f"Synthesis failed after {chunk_count} chunks: {e}")
+            raise TTSError(f"Synthesis failed: {e}") from e
 
-        return adjusted_audio.astype(np.int16)
+        logger.debug("piper_synthesis_complete")
@@ -1,6 +1,7 @@
 """Settings window for configuration."""
 
 import tkinter as tk
+from collections.abc import Callable
 from pathlib import Path
 from tkinter import filedialog, ttk
 
@@ -13,16 +14,23 @@ logger = get_logger(__name__)
 class SettingsWindow:
     """Dialog for application settings."""
 
-    def __init__(self, settings: Settings, available_voices: list[str]):
+    def __init__(
+        self,
+        settings: Settings,
+        available_voices: list[str],
+        save_callback: Callable[[], None] | None = None,
+    ):
         """Initialize SettingsWindow.
 
         Args:
             settings: Settings instance
             available_voices: List of available voice names
+            save_callback: Function to call after the settings are saved
         """
         logger.info("creating_settings_window", voice_count=len(available_voices))
         self._settings = settings
         self._available_voices = available_voices
+        self._save_callback = save_callback
 
         # Create window
         self._window = tk.Toplevel()
@@ -135,9 +143,9 @@ class SettingsWindow:
         speed_scale = tk.Scale(
             speed_frame,
             variable=self._speed_var,
-            from_=0.5,
-            to=2.0,
-            resolution=0.25,
+            from_=Settings.MIN_SPEED,
+            to=Settings.MAX_SPEED,
+            resolution=Settings.SPEED_STEP,
             orient=tk.HORIZONTAL,
             font=("SF Pro Text", 11),
             bg="white",
@@ -269,6 +277,10 @@ class SettingsWindow:
         # Close window
         self._window.destroy()
 
+        # Let the app apply the new settings
+        if self._save_callback:
+            self._save_callback()
+
     def _on_cancel(self):
         """Cancel and close without saving."""
         self._window.destroy()
@@ -0,0 +1,232 @@
+"""Persistent index of available Piper voices"""
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+QUALITIES = ("x_low", "low", "medium", "high")
+
+
+@dataclass(frozen=True)
+class VoiceInfo:
+    """Metadata for one voice, read from its model file and config"""
+
+    name: str
+    sample_rate: int
+    language: str | None
+    quality: str | None
+    size: int
+    mtime_ns: int
+    config_mtime_ns: int | None = None
+    length_scale: float = 1.0
+
+
+class VoiceCatalog:
+    """Index of voices in a directory, kept up to date by mtime
+
+    Scanning a directory of voices means listing it and parsing every
+    ``.onnx.json`` config, which is slow on network mounts with hundreds of
+    voices. The catalog does this once, saves the result to ``index_path``
+    and afterwards answers queries from memory. ``refresh`` is cheap when
+    nothing changed: an unchanged directory mtime skips the scan, and within
+    a scan only voices whose model or config mtime changed are re-read.
+    """
+
+    def __init__(self, voices_dir: Path | str, index_path: Path | str | None = None):
+        """
+        Initialize voice catalog
+
+        Args:
+            voices_dir: Directory containing voice model files (.onnx)
+            index_path: File the index is saved to (None keeps it in memory only)
+        """
+        self.voices_dir = Path(voices_dir)
+        self.index_path = Path(index_path) if index_path is not None else None
+        self._voices: dict[str, VoiceInfo] = {}
+        self._dir_mtime_ns: int | None = None
+        self._lock = threading.Lock()
+
+        self._load_index()
+        self.refresh()
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Bring the index up to date with the voices directory
+
+        Args:
+            force: Re-check every voice even if the directory mtime is unchanged
+                (catches models replaced in place)
+
+        Returns:
+            True if any voice was added, removed or updated
+        """
+        with self._lock:
+            try:
+                dir_mtime_ns = self.voices_dir.stat().st_mtime_ns
+            except OSError:
+                if self._dir_mtime_ns is None and not self._voices:
+                    return False
+                logger.warning(f"Voices directory does not exist: {self.voices_dir}")
+                self._voices = {}
+                self._dir_mtime_ns = None
+                self._save_index()
+                return True
+
+            if not force and dir_mtime_ns == self._dir_mtime_ns:
+                return False
+
+            changed = self._scan()
+            if changed or dir_mtime_ns != self._dir_mtime_ns:
+                self._dir_mtime_ns = dir_mtime_ns
+                self._save_index()
+            return changed
+
+    def names(self) -> list[str]:
+        """
+        Get indexed voice names
+
+        Returns:
+            Sorted voice names (without .onnx extension)
+        """
+        with self._lock:
+            return sorted(self._voices)
+
+    def voices(self) -> list[VoiceInfo]:
+        """
+        Get indexed voices
+
+        Returns:
+            Voice metadata sorted by name
+        """
+        with self._lock:
+            return [self._voices[name] for name in sorted(self._voices)]
+
+    def get(self, name: str) -> VoiceInfo | None:
+        """
+        Look up a voice without touching its files
+
+        Args:
+            name: Voice name (without .onnx extension)
+
+        Returns:
+            Voice metadata, or None if the voice is not indexed
+        """
+        with self._lock:
+            return self._voices.get(name)
+
+    def __contains__(self, name: str) -> bool:
+        with self._lock:
+            return name in self._voices
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._voices)
+
+    def _scan(self) -> bool:
+        """List the directory and re-read voices whose files changed"""
+        models: dict[str, os.stat_result] = {}
+        configs: dict[str, int] = {}
+        with os.scandir(self.voices_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".onnx.json"):
+                    configs[entry.name[: -len(".onnx.json")]] = entry.stat().st_mtime_ns
+                elif entry.name.endswith(".onnx") and entry.is_file():
+                    models[entry.name[: -len(".onnx")]] = entry.stat()
+
+        changed = False
+        for name in set(self._voices) - set(models):
+            del self._voices[name]
+            changed = True
+
+        for name, stat in models.items():
+            cached = self._voices.get(name)
+            config_mtime_ns = configs.get(name)
+            if (
+                cached is not None
+                and cached.size == stat.st_size
+                and cached.mtime_ns == stat.st_mtime_ns
+                and cached.config_mtime_ns == config_mtime_ns
+            ):
+                continue
+            self._voices[name] = self._read_voice(name, stat, config_mtime_ns)
+            changed = True
+
+        if changed:
+            logger.info(f"Voice catalog updated: {len(self._voices)} voices in {self.voices_dir}")
+        return changed
+
+    def _read_voice(
+        self, name: str, stat: os.stat_result, config_mtime_ns: int | None
+    ) -> VoiceInfo:
+        """Build a voice's metadata from its config file"""
+        config = {}
+        if config_mtime_ns is not None:
+            config_path = self.voices_dir / f"{name}.onnx.json"
+            try:
+                with open(config_path, encoding="utf-8") as f:
+                    config = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not read voice config {config_path}: {e}")
+
+        audio = config.get("audio", {})
+        language = config.get("language", {}).get("code") or config.get("espeak", {}).get("voice")
+        quality = audio.get("quality")
+        if quality is None:
+            # Piper voice names follow <language>-<name>-<quality>
+            suffix = name.rsplit("-", 1)[-1]
+            quality = suffix if suffix in QUALITIES else None
+
+        return VoiceInfo(
+            name=name,
+            sample_rate=audio.get("sample_rate", 22050),
+            language=language,
+            quality=quality,
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            config_mtime_ns=config_mtime_ns,
+            length_scale=config.get("inference", {}).get("length_scale", 1.0),
+        )
+
+    def _load_index(self) -> None:
+        """Load a previously saved index for this directory"""
+        if self.index_path is None or not self.index_path.exists():
+            return
+
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != INDEX_VERSION or data.get("voices_dir") != str(
+                self.voices_dir
+            ):
+                return
+            self._voices = {v["name"]: VoiceInfo(**v) for v in data["voices"]}
+            self._dir_mtime_ns = data.get("dir_mtime_ns")
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable voice index {self.index_path}: {e}")
+            self._voices = {}
+            self._dir_mtime_ns = None
+
+    def _save_index(self) -> None:
+        """Write the index atomically"""
+        if self.index_path is None:
+            return
+
+        data = {
+            "version": INDEX_VERSION,
+            "voices_dir": str(self.voices_dir),
+            "dir_mtime_ns": self._dir_mtime_ns,
+            "voices": [asdict(info) for info in self._voices.values()],
+        }
+        tmp_path = self.index_path.with_suffix(".tmp")
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            logger.warning(f"Could not save voice index {self.index_path}: {e}")
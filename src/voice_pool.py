@@ -0,0 +1,172 @@
+"""Pool of loaded Piper voices for instant voice switching"""
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from pathlib import Path
+
+from piper import PiperVoice
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PooledVoice:
+    """A loaded voice and its approximate memory footprint"""
+
+    name: str
+    voice: PiperVoice
+    resident_bytes: int
+    load_seconds: float
+
+
+class VoicePool:
+    """Keep up to ``max_voices`` voices loaded, evicting least recently used
+
+    Loading an ONNX model takes seconds for medium and high quality voices;
+    keeping recently used ones resident makes switching back near-instant.
+    A voice's resident size is estimated from its model file, since the
+    ONNX session holds the weights in memory.
+    """
+
+    def __init__(
+        self,
+        voices_dir: Path | str,
+        max_voices: int = 3,
+        memory_budget: int = 1024 * 1024 * 1024,
+    ):
+        """
+        Initialize voice pool
+
+        Args:
+            voices_dir: Directory containing voice model files (.onnx)
+            max_voices: Maximum number of voices kept loaded
+            memory_budget: Maximum total resident bytes across loaded voices
+        """
+        if max_voices < 1:
+            raise ValueError("Pool must hold at least one voice")
+
+        self.voices_dir = Path(voices_dir)
+        self.max_voices = max_voices
+        self.memory_budget = memory_budget
+        self._voices: OrderedDict[str, PooledVoice] = OrderedDict()
+        self._loading: dict[str, Future[PooledVoice]] = {}  # Loads in progress
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> PooledVoice:
+        """
+        Get a loaded voice, loading it if needed
+
+        Args:
+            name: Voice name (without .onnx extension)
+
+        Returns:
+            The pooled voice
+
+        Raises:
+            FileNotFoundError: If the voice file doesn't exist
+        """
+        with self._lock:
+            pooled = self._voices.get(name)
+            if pooled is not None:
+                self._voices.move_to_end(name)
+                logger.debug(f"Voice pool hit: {name}")
+                return pooled
+
+            # Another thread may already be loading it; wait for that load
+            future = self._loading.get(name)
+            waiting = future is not None
+            if not waiting:
+                voice_path = self.voices_dir / f"{name}.onnx"
+                if not voice_path.exists():
+                    raise FileNotFoundError(f"Voice file not found: {voice_path}")
+                future = self._loading[name] = Future()
+
+        if waiting:
+            return future.result()
+
+        # Loading takes seconds, so the lock is not held meanwhile
+        try:
+            started = time.perf_counter()
+            voice = PiperVoice.load(str(voice_path))
+            pooled = PooledVoice(
+                name=name,
+                voice=voice,
+                resident_bytes=voice_path.stat().st_size,
+                load_seconds=time.perf_counter() - started,
+            )
+        except BaseException as e:
+            with self._lock:
+                del self._loading[name]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            del self._loading[name]
+            self._voices[name] = pooled
+            self._evict(keep=name)
+            loaded = len(self._voices)
+        future.set_result(pooled)
+
+        logger.info(
+            f"Loaded voice {name} into pool in {pooled.load_seconds:.2f}s "
+            f"({pooled.resident_bytes} bytes, {loaded} loaded)"
+        )
+        return pooled
+
+    def evict(self, name: str) -> bool:
+        """
+        Unload a voice
+
+        Args:
+            name: Voice name
+
+        Returns:
+            True if the voice was loaded
+        """
+        with self._lock:
+            return self._voices.pop(name, None) is not None
+
+    def __contains__(self, name: str) -> bool:
+        with self._lock:
+            return name in self._voices
+
+    def loaded(self) -> list[str]:
+        """
+        Get loaded voice names
+
+        Returns:
+            Names from least to most recently used
+        """
+        with self._lock:
+            return list(self._voices)
+
+    def resident_sizes(self) -> dict[str, int]:
+        """
+        Get each loaded voice's resident size
+
+        Returns:
+            Mapping of voice name to bytes
+        """
+        with self._lock:
+            return {name: pooled.resident_bytes for name, pooled in self._voices.items()}
+
+    @property
+    def resident_bytes(self) -> int:
+        """Total resident bytes across loaded voices"""
+        with self._lock:
+            return sum(pooled.resident_bytes for pooled in self._voices.values())
+
+    def _evict(self, keep: str) -> None:
+        """Evict least recently used voices until within count and memory limits"""
+        total = sum(pooled.resident_bytes for pooled in self._voices.values())
+        for name in list(self._voices):
+            if len(self._voices) <= self.max_voices and total <= self.memory_budget:
+                break
+            if name == keep:
+                continue
+            evicted = self._voices.pop(name)
+            total -= evicted.resident_bytes
+            logger.info(f"Evicted voice {name} from pool ({evicted.resident_bytes} bytes)")
@@ -0,0 +1,88 @@
+"""Tests for AudioCache"""
+
+import numpy as np
+import pytest
+
+from src.audio_cache import AudioCache
+
+
+class TestAudioCache:
+    @pytest.fixture
+    def audio(self):
+        """Two seconds of int16 samples at 1 kHz"""
+        return np.arange(2000, dtype=np.int16)
+
+    def test_key_normalizes_whitespace(self):
+        """Should map whitespace variants of a sentence to the same key"""
+        assert AudioCache.key("voice", "Hello   world. ") == AudioCache.key("voice", "Hello world.")
+
+    def test_key_depends_on_voice_and_params(self):
+        """Should separate entries by voice and synthesis parameters"""
+        base = AudioCache.key("voice-a", "Hello")
+
+        assert AudioCache.key("voice-b", "Hello") != base
+        assert AudioCache.key("voice-a", "Hello", {"length_scale": 0.8}) != base
+
+    def test_memory_hit_and_miss_counters(self, audio):
+        """Should count hits and misses"""
+        cache = AudioCache(memory_bytes=1024 * 1024)
+
+        assert cache.get("k") is None
+        cache.put("k", audio)
+        cached = cache.get("k")
+
+        assert np.array_equal(cached, audio)
+        stats = cache.stats()
+        assert stats.memory_hits == 1
+        assert stats.misses == 1
+        assert stats.hit_rate == 0.5
+
+    def test_cached_audio_is_read_only(self, audio):
+        """Should protect cached audio from mutation by callers"""
+        cache = AudioCache()
+        cache.put("k", audio)
+
+        with pytest.raises(ValueError):
+            cache.get("k")[0] = 1
+
+    def test_memory_tier_evicts_least_recently_used(self, audio):
+        """Should keep the memory tier under its byte cap"""
+        cache = AudioCache(memory_bytes=audio.nbytes * 2)
+        cache.put("a", audio)
+        cache.put("b", audio)
+        cache.get("a")
+        cache.put("c", audio)
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.stats().memory_bytes <= audio.nbytes * 2
+
+    def test_disk_tier_survives_restart(self, tmp_path, audio):
+        """Should serve entries from disk in a new cache instance"""
+        AudioCache(tmp_path).put("k", audio)
+
+        cache = AudioCache(tmp_path)
+        cached = cache.get("k")
+
+        assert np.array_equal(cached, audio)
+        assert cache.stats().disk_hits == 1
+
+    def test_disk_tier_is_size_capped(self, tmp_path, audio):
+        """Should evict the oldest files once over the disk cap"""
+        cache = AudioCache(tmp_path, memory_bytes=0, disk_bytes=audio.nbytes * 2)
+        for key in ("a", "b", "c"):
+            cache.put(key, audio)
+
+        assert cache.stats().disk_bytes <= audio.nbytes * 2
+        assert len(list(tmp_path.glob("*.pcm"))) == 2
+        assert "a" not in cache
+        assert "c" in cache
+
+    def test_clear_removes_everything(self, tmp_path, audio):
+        """Should empty both tiers"""
+        cache = AudioCache(tmp_path)
+        cache.put("k", audio)
+        cache.clear()
+
+        assert "k" not in cache
+        assert list(tmp_path.glob("*.pcm")) == []
@@ -0,0 +1,82 @@
+"""Tests for audio output backends"""
+
+import threading
+import time
+import wave
+
+import numpy as np
+
+from src.audio_output import NullBackend, SimulatedStream, WavFileBackend
+from src.audio_player import AudioPlayer, PlaybackState
+
+
+class TestAudioOutput:
+    def test_null_backend_plays_to_completion(self):
+        """Should drive the player's callback without an audio device"""
+        done = threading.Event()
+        player = AudioPlayer(sample_rate=22050, backend=NullBackend(pace=0))
+        player.set_completion_callback(done.set)
+
+        player.play(np.ones(22050 * 5, dtype=np.int16))
+
+        assert done.wait(timeout=5)
+        assert player.state == PlaybackState.STOPPED
+        assert player.stats().callbacks >= 22050 * 5 // 512
+        player.close()
+
+    def test_wav_backend_records_output(self, tmp_path):
+        """Should write exactly what the callback rendered to the file"""
+        path = tmp_path / "out.wav"
+        done = threading.Event()
+        player = AudioPlayer(sample_rate=16000, blocksize=256, backend=WavFileBackend(path))
+        player.set_completion_callback(done.set)
+        audio = np.arange(1000, dtype=np.int16)
+
+        player.play(audio)
+        assert done.wait(timeout=5)
+        player.close()
+
+        with wave.open(str(path), "rb") as wav:
+            assert wav.getframerate() == 16000
+            frames = np.frombuffer(wav.readframes(wav.getnframes()), dtype="<i2")
+        # The last block is padded with silence up to the block size
+        assert len(frames) == 1024
+        assert list(frames[:1000]) == list(audio)
+        assert not frames[1000:].any()
+
+    def test_wav_backend_finalizes_after_pause_and_resume(self, tmp_path):
+        """Should reuse the paused stream so closing the player finalizes the file"""
+        path = tmp_path / "out.wav"
+        backend = WavFileBackend(path, pace=1.0)
+        player = AudioPlayer(sample_rate=16000, blocksize=256, backend=backend)
+
+        player.play(np.ones(16000 * 5, dtype=np.int16))
+        time.sleep(0.05)
+        player.pause()
+        player.resume()
+        time.sleep(0.05)
+        player.stop()
+        player.close()
+
+        assert backend._open_streams == 0
+        with wave.open(str(path), "rb") as wav:
+            assert wav.getnframes() > 0
+
+    def test_simulated_stream_reports_late_callbacks_as_underflows(self):
+        """Should flag an underflow after a callback overruns its block at real-time pace"""
+        statuses = []
+
+        def slow_callback(outdata, frames, time_info, status):
+            statuses.append(status)
+            if len(statuses) == 1:
+                time.sleep(0.05)  # Far longer than one 64-frame block
+
+        stream = SimulatedStream(16000, 64, slow_callback, pace=1.0)
+        stream.start()
+        while len(statuses) < 3:
+            time.sleep(0.005)
+        stream.close()
+
+        assert statuses[0] is None
+        assert statuses[1].output_underflow
+        assert not statuses[2]
@@ -1,5 +1,7 @@
 """Tests for Audio Player"""
 
+import threading
+import time
 
 import numpy as np
 import pytest
@@ -64,6 +66,27 @@ class TestAudioPlayer:
         # Stream should be started again
         assert mock_stream.start.call_count >= 1
 
+    def test_resume_does_not_reprocess_remaining_audio(self, player, mocker):
+        """Should resume a long stretched document without touching the audio ahead"""
+        mocker.patch("sounddevice.OutputStream")
+        # An hour of audio as a zero-copy view: any O(n) pass would show
+        hour = np.broadcast_to(np.int16(100), (22050 * 3600,))
+        outdata = np.zeros((512, 1), dtype=np.int16)
+
+        player.set_speed(1.5)
+        player.play(hour)
+        player._audio_callback(outdata, 512, None, None)
+        player.pause()
+        position = player.position
+
+        render = mocker.spy(player, "_render")
+        player.resume()
+
+        assert render.call_count == 0
+        assert player.position == position
+        player._audio_callback(outdata, 512, None, None)
+        assert player.position > position
+
     def test_stop_resets_position(self, player, audio_data, mocker):
         """Should stop and reset to beginning"""
         mock_stream = mocker.MagicMock()
@@ -173,3 +196,417 @@ class TestAudioPlayer:
         # Duration should match audio length
         expected_duration = len(audio_data) / player.sample_rate
         assert abs(duration - expected_duration) < 0.01
+
+    def test_play_stream_drains_producer(self, player, mocker):
+        """Should play chunks pushed by a producer through the ring buffer"""
+        mocker.patch("sounddevice.OutputStream")
+        chunks = [np.full(100, i, dtype=np.int16) for i in range(1, 4)]
+
+        player.play_stream(iter(chunks))
+        player._producer.join(timeout=1)
+
+        assert player.state == PlaybackState.PLAYING
+        assert player.streaming
+        assert player.duration == pytest.approx(300 / player.sample_rate)
+
+        outdata = np.zeros((256, 1), dtype=np.int16)
+        player._audio_callback(outdata, 256, None, None)
+
+        assert list(outdata[:100, 0]) == [1] * 100
+        assert list(outdata[200:256, 0]) == [3] * 56
+        assert player.position == 256
+
+    def test_play_stream_stops_callback_when_drained(self, player, mocker):
+        """Should end the stream once the producer is exhausted and drained"""
+        import sounddevice as sd
+
+        mocker.patch("sounddevice.OutputStream")
+
+        player.play_stream(iter([np.ones(10, dtype=np.int16)]))
+        player._producer.join(timeout=1)
+
+        outdata = np.full((32, 1), 5, dtype=np.int16)
+        with pytest.raises(sd.CallbackStop):
+            player._audio_callback(outdata, 32, None, None)
+
+        # Remainder is padded with silence
+        assert list(outdata[10:, 0]) == [0] * 22
+
+    def test_play_stream_memory_is_bounded(self, mocker):
+        """Should block the producer instead of buffering the whole stream"""
+        mocker.patch("sounddevice.OutputStream")
+        player = AudioPlayer(sample_rate=1000, buffer_seconds=0.1)
+        chunks = (np.ones(50, dtype=np.int16) for _ in range(100))
+
+        player.play_stream(chunks)
+        player._producer.join(timeout=0.2)
+
+        assert player._producer.is_alive()
+        assert player.buffered == 100
+
+        player.stop()
+        assert player.state == PlaybackState.STOPPED
+
+    def test_speed_change_applies_within_a_block(self, player, mocker):
+        """Should consume source faster from the next block after set_speed"""
+        mocker.patch("sounddevice.OutputStream")
+        audio = (np.sin(np.arange(22050) * 0.05) * 8000).astype(np.int16)
+        outdata = np.zeros((512, 1), dtype=np.int16)
+
+        player.play(audio)
+        player._audio_callback(outdata, 512, None, None)
+        assert player.position == 512
+
+        player.set_speed(2.0)
+        for _ in range(8):
+            player._audio_callback(outdata, 512, None, None)
+
+        # Eight blocks at 2x cover about twice as much source audio
+        assert player.position == pytest.approx(512 + 2 * 8 * 512, abs=400)
+
+    def test_stretched_playback_finishes(self, player, mocker):
+        """Should play the stretched tail and then stop the stream"""
+        import sounddevice as sd
+
+        mocker.patch("sounddevice.OutputStream")
+        audio = np.full(4000, 1000, dtype=np.int16)
+        player.set_speed(2.0)
+        player.play(audio)
+
+        outdata = np.zeros((512, 1), dtype=np.int16)
+        played = 0
+        with pytest.raises(sd.CallbackStop):
+            for _ in range(20):
+                player._audio_callback(outdata, 512, None, None)
+                played += 512
+
+        assert played == pytest.approx(2000, abs=512)
+        assert player.position == 4000
+
+    def test_persistent_stream_opens_device_once(self, audio_data, mocker):
+        """Should reuse one running stream across play, pause, resume and stop"""
+        mock_stream = mocker.MagicMock()
+        mock_output_stream = mocker.patch("sounddevice.OutputStream", return_value=mock_stream)
+        player = AudioPlayer(sample_rate=22050, persistent_stream=True)
+
+        player.play(audio_data)
+        player.pause()
+        player.resume()
+        player.stop()
+        player.play(audio_data)
+
+        assert player.state == PlaybackState.PLAYING
+        mock_output_stream.assert_called_once()
+        mock_stream.stop.assert_not_called()
+
+        player.close()
+        mock_stream.close.assert_called_once()
+
+    def test_persistent_stream_outputs_silence_when_paused(self, audio_data, mocker):
+        """Should write silence from the callback while paused"""
+        mocker.patch("sounddevice.OutputStream")
+        player = AudioPlayer(sample_rate=22050, persistent_stream=True)
+        outdata = np.full((256, 1), 7, dtype=np.int16)
+
+        player.play(audio_data)
+        player.pause()
+        player._audio_callback(outdata, 256, None, None)
+
+        assert not outdata.any()
+        assert player.position == 0
+
+        player.resume()
+        player._audio_callback(outdata, 256, None, None)
+
+        assert list(outdata[:, 0]) == list(audio_data[:256])
+        assert player.start_latency is not None
+        player.close()
+
+    def test_persistent_stream_reports_completion(self, mocker):
+        """Should call the completion callback without stopping the stream"""
+        import threading
+
+        mock_stream = mocker.MagicMock()
+        mocker.patch("sounddevice.OutputStream", return_value=mock_stream)
+        player = AudioPlayer(sample_rate=22050, persistent_stream=True)
+        completed = threading.Event()
+        player.set_completion_callback(completed.set)
+
+        player.play(np.ones(100, dtype=np.int16))
+        outdata = np.zeros((256, 1), dtype=np.int16)
+        player._audio_callback(outdata, 256, None, None)
+
+        assert completed.wait(timeout=1)
+        assert player.state == PlaybackState.STOPPED
+        mock_stream.stop.assert_not_called()
+        player.close()
+
+    def test_callback_allocates_no_sample_buffers(self, mocker):
+        """Should render stretched blocks without allocating arrays per callback"""
+        import tracemalloc
+
+        mocker.patch("sounddevice.OutputStream")
+        player = AudioPlayer(sample_rate=22050)
+        player.set_speed(1.5)
+        player.play((np.sin(np.arange(22050 * 5) * 0.05) * 8000).astype(np.int16))
+        outdata = np.zeros((4096, 1), dtype=np.int16)
+        player._audio_callback(outdata, 4096, None, None)
+
+        tracemalloc.start()
+        before, _ = tracemalloc.get_traced_memory()
+        for _ in range(5):
+            player._audio_callback(outdata, 4096, None, None)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        # Only small array views are created; one block of int16 samples is 8 KiB
+        assert peak - before < 4096 * 2
+
+    def test_callback_counts_status_instead_of_logging(self, audio_data, mocker, caplog):
+        """Should defer stream status reports to the control thread"""
+        import logging
+
+        mocker.patch("sounddevice.OutputStream")
+        player = AudioPlayer(sample_rate=22050)
+        player.play(audio_data)
+        outdata = np.zeros((256, 1), dtype=np.int16)
+
+        with caplog.at_level(logging.WARNING, logger="src.audio_player"):
+            player._audio_callback(outdata, 256, None, "output underflow")
+            assert caplog.records == []
+
+            player.stop()
+            assert "1 status events" in caplog.text
+
+    def test_seek_moves_read_position(self, player, mocker):
+        """Should continue from the seek target without reprocessing"""
+        mocker.patch("sounddevice.OutputStream")
+        audio = np.arange(1000, dtype=np.int16)
+        outdata = np.zeros((10, 1), dtype=np.int16)
+
+        player.play(audio)
+        assert player.seek(500) == 500
+        player._audio_callback(outdata, 10, None, None)
+
+        assert list(outdata[:, 0]) == list(range(500, 510))
+        assert player.position == 510
+        assert player.seek(5000) == 1000
+
+    def test_skip_sentence_uses_index(self, player, mocker):
+        """Should jump between sentence starts from the index"""
+        from src.sentence_index import SentenceIndex
+
+        mocker.patch("sounddevice.OutputStream")
+        index = SentenceIndex()
+        for length in (300, 300, 400):
+            index.add(length)
+
+        player.play(np.zeros(1000, dtype=np.int16), index=index)
+        player.seek(350)
+
+        assert player.skip_sentence(1) == 2
+        assert player.position == 600
+        assert player.skip_sentence(-2) == 0
+        assert player.position == 0
+        # Clamped to the last sentence
+        assert player.skip_sentence(10) == 2
+
+    def test_skip_sentence_while_streaming(self, player, mocker):
+        """Should index stream chunks as sentences and seek back into history"""
+        mocker.patch("sounddevice.OutputStream")
+        chunks = [np.full(100, i, dtype=np.int16) for i in range(1, 4)]
+
+        player.play_stream(iter(chunks))
+        player._producer.join(timeout=1)
+        outdata = np.zeros((250, 1), dtype=np.int16)
+        player._audio_callback(outdata, 250, None, None)
+        assert player.sentence == 2
+
+        assert player.skip_sentence(-1) == 1
+        outdata = np.zeros((10, 1), dtype=np.int16)
+        player._audio_callback(outdata, 10, None, None)
+        assert list(outdata[:, 0]) == [2] * 10
+
+    def test_enqueue_plays_back_to_back_within_a_block(self, mocker):
+        """Should switch to the queued audio at the exact sample the first ends"""
+        import threading
+
+        mocker.patch("sounddevice.OutputStream")
+        player = AudioPlayer(sample_rate=22050, persistent_stream=True)
+        first_done = threading.Event()
+        second_done = threading.Event()
+
+        player.enqueue(np.full(100, 1, dtype=np.int16), on_complete=first_done.set)
+        player.enqueue(np.full(100, 2, dtype=np.int16), on_complete=second_done.set)
+        assert player.state == PlaybackState.PLAYING
+
+        outdata = np.full((256, 1), 9, dtype=np.int16)
+        player._audio_callback(outdata, 256, None, None)
+
+        assert list(outdata[:200, 0]) == [1] * 100 + [2] * 100
+        assert not outdata[200:].any()
+        assert first_done.wait(timeout=1)
+        assert second_done.wait(timeout=1)
+        player.close()
+
+    def test_callback_reports_completion_without_taking_locks(self, mocker):
+        """Should hand finished sources to the notifier without setting an Event"""
+        mocker.patch("sounddevice.OutputStream")
+        player = AudioPlayer(sample_rate=22050, persistent_stream=True)
+        completed = []
+        player.enqueue(np.ones(100, dtype=np.int16), on_complete=lambda: completed.append(1))
+        player.enqueue(np.ones(100, dtype=np.int16), on_complete=lambda: completed.append(2))
+
+        event_set = mocker.spy(threading.Event, "set")
+        outdata = np.zeros((256, 1), dtype=np.int16)
+        player._audio_callback(outdata, 256, None, None)
+        assert event_set.call_count == 0
+
+        deadline = time.monotonic() + 1
+        while len(completed) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert completed == [1, 2]
+        player.close()
+
+    def test_enqueue_stream_after_array(self, player, mocker):
+        """Should prefetch a queued stream and play it after the current audio"""
+        mocker.patch("sounddevice.OutputStream")
+        chunks = [np.full(50, 3, dtype=np.int16), np.full(50, 4, dtype=np.int16)]
+
+        player.play(np.full(100, 1, dtype=np.int16))
+        player.enqueue(iter(chunks))
+        player._queue[0].producer.join(timeout=1)
+
+        outdata = np.zeros((150, 1), dtype=np.int16)
+        player._audio_callback(outdata, 150, None, None)
+
+        assert list(outdata[:, 0]) == [1] * 100 + [3] * 50
+        assert player.streaming
+        assert len(player.sentence_index) == 2
+
+    def test_stop_clears_queue(self, player, mocker):
+        """Should drop queued audio and stop its producers on stop"""
+        mocker.patch("sounddevice.OutputStream")
+        endless = (np.ones(1000, dtype=np.int16) for _ in iter(int, 1))
+
+        player.play(np.ones(100, dtype=np.int16))
+        player.enqueue(endless)
+        producer = player._queue[0].producer
+        player.stop()
+
+        assert not player._queue
+        assert not producer.is_alive()
+
+    def test_stop_does_not_wait_for_a_blocked_producer(self, player, mocker):
+        """Should cancel the source and return while its producer is still blocked"""
+        mocker.patch("sounddevice.OutputStream")
+        release = threading.Event()
+        cancelled = threading.Event()
+
+        def slow_source():
+            # Like a pipeline still waiting for its first sentence
+            release.wait(timeout=5)
+            yield np.ones(1000, dtype=np.int16)
+
+        player.play_stream(slow_source(), on_cancel=cancelled.set)
+        old_ring = player._ring
+        started = time.perf_counter()
+        player.stop()
+
+        assert time.perf_counter() - started < 0.5
+        assert cancelled.is_set()
+        # The stuck producer keeps the old ring; new streams get a fresh one
+        assert player._ring is not old_ring
+        release.set()
+
+    def test_latency_and_blocksize_are_passed_to_stream(self, audio_data, mocker):
+        """Should open the stream with the configured latency profile"""
+        mock_output_stream = mocker.patch("sounddevice.OutputStream")
+        player = AudioPlayer(sample_rate=22050, latency="low", blocksize=256)
+
+        player.play(audio_data)
+
+        kwargs = mock_output_stream.call_args.kwargs
+        assert kwargs["latency"] == "low"
+        assert kwargs["blocksize"] == 256
+
+    def test_sources_are_resampled_to_the_output_rate(self, mocker):
+        """Should open the stream at the output rate and convert each source to it"""
+        import sounddevice as sd
+
+        mock_output_stream = mocker.patch("sounddevice.OutputStream")
+        player = AudioPlayer(sample_rate=22050, output_rate=48000)
+        audio = (np.sin(np.arange(1600) * 0.1) * 8000).astype(np.int16)
+
+        player.play(audio, sample_rate=16000)
+        assert mock_output_stream.call_args.kwargs["samplerate"] == 48000
+        assert player.duration == pytest.approx(0.1)
+
+        outdata = np.zeros((2400, 1), dtype=np.int16)
+        player._audio_callback(outdata, 2400, None, None)
+        assert player.position == 800
+
+        # The rest of the 0.1 s at 48 kHz, then silence
+        outdata = np.zeros((3000, 1), dtype=np.int16)
+        with pytest.raises(sd.CallbackStop):
+            player._audio_callback(outdata, 3000, None, None)
+        assert outdata[2300:2400].any()
+        assert not outdata[2400:].any()
+
+    def test_device_output_rate_comes_from_backend(self, mocker):
+        """Should ask the backend for its native rate when output_rate is "device\""""
+        backend = mocker.Mock()
+        backend.default_samplerate.return_value = 44100
+
+        player = AudioPlayer(sample_rate=22050, output_rate="device", backend=backend)
+
+        assert player.output_rate == 44100
+
+    def test_invalid_latency_raises(self):
+        """Should reject unknown latency presets"""
+        with pytest.raises(ValueError, match="Latency"):
+            AudioPlayer(latency="medium")
+
+    def test_stats_count_underruns_and_callback_times(self, player, mocker):
+        """Should count starved blocks after playback started and time every callback"""
+        import threading
+        import time
+
+        mocker.patch("sounddevice.OutputStream")
+        release = threading.Event()
+
+        def slow_chunks():
+            yield np.ones(100, dtype=np.int16)
+            release.wait(timeout=1)  # Producer falls behind
+
+        player.play_stream(slow_chunks())
+        for _ in range(100):
+            if player.buffered == 100:
+                break
+            time.sleep(0.01)
+
+        outdata = np.zeros((64, 1), dtype=np.int16)
+        player._audio_callback(outdata, 64, None, None)
+        player._audio_callback(outdata, 64, None, None)
+        release.set()
+
+        stats = player.stats()
+        assert stats.callbacks == 2
+        assert stats.underruns == 1
+        assert sum(stats.callback_time_histogram) == 2
+        assert stats.min_buffered == 0
+        assert stats.max_callback_time > 0
+
+        player.reset_stats()
+        assert player.stats().callbacks == 0
+
+    def test_stats_count_device_status_flags(self, player):
+        """Should count underflow and overflow flags reported by the device"""
+        from types import SimpleNamespace
+
+        outdata = np.zeros((64, 1), dtype=np.int16)
+        status = SimpleNamespace(output_underflow=True, output_overflow=False)
+        player._audio_callback(outdata, 64, None, status)
+
+        assert player.stats().output_underflows == 1
+        assert player.stats().output_overflows == 0
@@ -0,0 +1,209 @@
+"""Tests for BatchFetcher"""
+
+import threading
+import time
+
+import pytest
+import requests
+
+from src.batch_fetcher import BatchFetcher, is_feed_url, parse_feed
+
+RSS = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>News</title>
+<item><title>One</title><link>https://example.com/one</link></item>
+<item><title>Two</title><link> https://example.com/two </link></item>
+<item><title>No link</title></item>
+</channel></rss>"""
+
+ATOM = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom"><title>Blog</title>
+<entry><link rel="replies" href="/one#comments"/><link href="/one"/></entry>
+<entry><link rel="alternate" href="https://other.org/two"/></entry>
+</feed>"""
+
+
+def http_error(status: int, mocker, **headers) -> requests.HTTPError:
+    """An HTTPError carrying a response with a status code and headers"""
+    response = mocker.Mock()
+    response.status_code = status
+    response.headers = headers
+    return requests.HTTPError(f"{status} error", response=response)
+
+
+@pytest.fixture
+def extractor(mocker):
+    """Extractor stand-in whose extract() returns text derived from the URL"""
+    extractor = mocker.Mock()
+    extractor.extract.side_effect = lambda url: f"Text of {url}"
+    return extractor
+
+
+class TestBatchFetcher:
+    def test_parse_feed(self):
+        """Should list article links of RSS and Atom feeds, resolving relative ones"""
+        assert parse_feed(RSS) == ["https://example.com/one", "https://example.com/two"]
+        assert parse_feed(ATOM, "https://blog.example.com/feed") == [
+            "https://blog.example.com/one",
+            "https://other.org/two",
+        ]
+        with pytest.raises(ValueError):
+            parse_feed(b"<html><body>Not a feed</body></html>")
+        with pytest.raises(ValueError):
+            parse_feed(b"not xml")
+
+    def test_is_feed_url(self):
+        """Should recognise common feed paths"""
+        assert is_feed_url("https://example.com/feed/")
+        assert is_feed_url("https://example.com/news/index.rss")
+        assert not is_feed_url("https://example.com/feeding-birds")
+
+    def test_yields_results_as_they_complete(self, extractor):
+        """Should return a fast page before a slow one submitted earlier"""
+        slow = threading.Event()
+
+        def extract(url):
+            if "slow" in url:
+                slow.wait(timeout=2)
+            return f"Text of {url}"
+
+        extractor.extract.side_effect = extract
+        fetcher = BatchFetcher(extractor, workers=2)
+        results = fetcher.fetch(["https://a.org/slow", "https://b.org/fast"])
+
+        first = next(results)
+        slow.set()
+        second = next(results)
+
+        assert (first.url, first.text) == ("https://b.org/fast", "Text of https://b.org/fast")
+        assert second.url == "https://a.org/slow"
+        assert first.ok and second.ok
+        fetcher.close()
+
+    def test_limits_concurrency_per_host(self, extractor):
+        """Should not run more than per_host fetches against one host at once"""
+        active: dict[str, int] = {}
+        peak: dict[str, int] = {}
+        lock = threading.Lock()
+
+        def extract(url):
+            host = url.split("/")[2]
+            with lock:
+                active[host] = active.get(host, 0) + 1
+                peak[host] = max(peak.get(host, 0), active[host])
+            time.sleep(0.02)
+            with lock:
+                active[host] -= 1
+            return url
+
+        extractor.extract.side_effect = extract
+        fetcher = BatchFetcher(extractor, workers=8, per_host=2)
+        urls = [f"https://{host}/{i}" for host in ("a.org", "b.org") for i in range(6)]
+
+        results = list(fetcher.fetch(urls))
+
+        assert len(results) == 12
+        assert peak == {"a.org": 2, "b.org": 2}
+        fetcher.close()
+
+    def test_busy_host_does_not_hold_up_other_hosts(self, extractor):
+        """Should start another host's URL while one host's URLs wait for a slot"""
+
+        def extract(url):
+            if "a.org" in url:
+                time.sleep(0.05)
+            return url
+
+        extractor.extract.side_effect = extract
+        fetcher = BatchFetcher(extractor, workers=3, per_host=2)
+        urls = [f"https://a.org/{i}" for i in range(20)] + ["https://b.org/other"]
+
+        results = list(fetcher.fetch(urls))
+
+        order = [result.url for result in results]
+        other = results[order.index("https://b.org/other")]
+        assert order.index("https://b.org/other") < 3
+        assert other.elapsed < 0.1
+        assert len(results) == 21 and all(result.ok for result in results)
+        fetcher.close()
+
+    def test_close_reports_urls_not_started(self, extractor):
+        """Should fail URLs still waiting for a host slot when closed"""
+        started = threading.Event()
+        release = threading.Event()
+
+        def extract(url):
+            started.set()
+            release.wait(timeout=2)
+            return url
+
+        extractor.extract.side_effect = extract
+        fetcher = BatchFetcher(extractor, workers=2, per_host=1)
+        results = []
+        consumer = threading.Thread(
+            target=lambda: results.extend(fetcher.fetch([f"https://a.org/{i}" for i in range(3)]))
+        )
+        consumer.start()
+
+        started.wait(timeout=1)
+        fetcher.close()
+        release.set()
+        consumer.join(timeout=1)
+
+        assert not consumer.is_alive()
+        assert [result.ok for result in results] == [False, False, True]
+        assert all(isinstance(result.error, RuntimeError) for result in results[:2])
+
+    def test_retries_transient_failures(self, extractor, mocker):
+        """Should retry 5xx and connection errors with backoff, but not 404"""
+        failures = {
+            "https://a.org/flaky": [http_error(503, mocker), requests.ConnectionError("reset")],
+            "https://a.org/missing": [http_error(404, mocker)],
+        }
+
+        def extract(url):
+            if failures.get(url):
+                raise failures[url].pop(0)
+            return "ok"
+
+        extractor.extract.side_effect = extract
+        fetcher = BatchFetcher(extractor, retries=2, backoff=0.001)
+
+        results = {result.url: result for result in fetcher.fetch(failures)}
+
+        assert results["https://a.org/flaky"].text == "ok"
+        assert results["https://a.org/flaky"].attempts == 3
+        assert isinstance(results["https://a.org/missing"].error, requests.HTTPError)
+        assert results["https://a.org/missing"].attempts == 1
+        fetcher.close()
+
+    def test_honours_retry_after(self, extractor, mocker):
+        """Should wait as long as a 429 response's Retry-After asks"""
+        fetcher = BatchFetcher(extractor, backoff=0.001)
+
+        assert fetcher._retry_delay(http_error(429, mocker, **{"Retry-After": "7"}), 1) == 7.0
+        assert fetcher._retry_delay(requests.Timeout(), 3) <= 0.004
+        fetcher.close()
+
+    def test_batch_timeout_reports_unfinished_urls(self, extractor):
+        """Should give up on URLs still running when the batch times out"""
+        release = threading.Event()
+        extractor.extract.side_effect = lambda url: release.wait(timeout=2) and url
+        fetcher = BatchFetcher(extractor)
+
+        results = list(fetcher.fetch(["https://a.org/stuck"], timeout=0.05))
+        release.set()
+
+        assert len(results) == 1
+        assert isinstance(results[0].error, TimeoutError)
+        fetcher.close()
+
+    def test_fetch_feed(self, extractor, mocker):
+        """Should fetch the articles a feed links to, up to a limit"""
+        response = mocker.Mock(content=RSS, url="https://example.com/rss")
+        extractor.session.get.return_value = response
+        fetcher = BatchFetcher(extractor)
+
+        results = list(fetcher.fetch_feed("https://example.com/rss", limit=1))
+
+        assert [result.url for result in results] == ["https://example.com/one"]
+        fetcher.close()
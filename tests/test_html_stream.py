@@ -0,0 +1,55 @@
+"""Tests for ParagraphStream"""
+
+from src.html_stream import ParagraphStream
+
+PAGE = (
+    "<html><body><nav>Menu</nav><h1>Title</h1>"
+    "<p>First &amp; <b>bold</b> paragraph.</p>"
+    '<div class="cookie-banner"><p>We use cookies.</p></div>'
+    "<p>Second paragraph.<script>var p = '</p>';</script></p>"
+    "<div>Last</div></body></html>"
+)
+
+
+def stream_text(html: str, chunk_size: int) -> list[str]:
+    """Feed a page in chunks and collect what is taken after each one"""
+    stream = ParagraphStream(("script", "nav"))
+    taken = []
+    for start in range(0, len(html), chunk_size):
+        stream.feed(html[start : start + chunk_size])
+        taken.append(stream.take())
+    stream.close()
+    taken.append(stream.take(final=True))
+    return taken
+
+
+class TestParagraphStream:
+    def test_releases_completed_paragraphs(self):
+        """Should release each block once the next one starts, whatever the chunking"""
+        expected = ["Title", "First & bold paragraph.", "Second paragraph.", "Last"]
+
+        for chunk_size in (1, 5, len(PAGE)):
+            taken = stream_text(PAGE, chunk_size)
+            assert [p for p in "".join(taken).split("\n\n") if p] == expected
+
+        # Paragraphs arrive before the end of the document
+        early = stream_text(PAGE, 5)[:-1]
+        assert "First & bold paragraph." in "".join(early)
+
+    def test_unclosed_element_ends_with_its_parent(self):
+        """Should stop skipping a dropped element when an enclosing element closes"""
+        stream = ParagraphStream(("aside",))
+        stream.feed("<div><aside>Skipped<p>Also skipped</div><p>Read</p>")
+        stream.close()
+
+        assert stream.take(final=True).split() == ["Read"]
+
+    def test_waits_for_a_complete_break(self):
+        """Should keep text back until the blank line after it has arrived"""
+        stream = ParagraphStream(())
+        stream.feed("One\n")
+
+        assert stream.take() == ""
+        stream.feed("  \nTwo")
+        assert stream.take() == "One\n  \n"
+        assert stream.take(final=True) == "Two"
@@ -0,0 +1,133 @@
+"""Tests for JobExecutor."""
+
+import queue
+import threading
+
+import pytest
+
+from src.jobs import JobExecutor, JobQueueFullError, JobState
+
+
+class TestJobExecutor:
+    """Test suite for JobExecutor."""
+
+    @pytest.fixture
+    def events(self):
+        """Queue collecting posted job events."""
+        return queue.Queue()
+
+    @pytest.fixture
+    def executor(self, events):
+        """Create a single-worker executor posting to the events queue."""
+        executor = JobExecutor(event_sink=events.put, workers=1, max_pending=2)
+        yield executor
+        executor.shutdown()
+
+    def _next_terminal(self, events):
+        """Return the next non-RUNNING event."""
+        while True:
+            event = events.get(timeout=2)
+            if event.state != JobState.RUNNING:
+                return event
+
+    def test_submit_runs_job_and_posts_completion(self, executor, events):
+        """Should run the job off the caller thread and post the result."""
+        caller = threading.current_thread()
+        job_id = executor.submit(lambda cancel: threading.current_thread() is not caller)
+
+        running = events.get(timeout=2)
+        assert running.job_id == job_id
+        assert running.state == JobState.RUNNING
+
+        done = events.get(timeout=2)
+        assert done.state == JobState.COMPLETED
+        assert done.result is True
+
+    def test_job_ids_are_unique(self, executor):
+        """Should assign increasing job IDs."""
+        first = executor.submit(lambda cancel: None)
+        second = executor.submit(lambda cancel: None)
+
+        assert second > first
+
+    def test_failed_job_posts_error(self, executor, events):
+        """Should report exceptions as FAILED events."""
+
+        def boom(cancel):
+            raise RuntimeError("boom")
+
+        executor.submit(boom)
+        event = self._next_terminal(events)
+
+        assert event.state == JobState.FAILED
+        assert str(event.error) == "boom"
+
+    def test_cancel_running_job(self, executor, events):
+        """Should set the cancel event of a running job."""
+        started = threading.Event()
+
+        def long_job(cancel):
+            started.set()
+            cancel.wait(timeout=2)
+
+        job_id = executor.submit(long_job)
+        started.wait(timeout=2)
+        assert executor.state(job_id) == JobState.RUNNING
+
+        assert executor.cancel(job_id) is True
+        event = self._next_terminal(events)
+
+        assert event.job_id == job_id
+        assert event.state == JobState.CANCELLED
+
+    def test_preempt_cancels_in_flight_and_queued(self, executor, events):
+        """Should cancel earlier jobs when a preempting job is submitted."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def blocking(cancel):
+            started.set()
+            release.wait(timeout=2)
+
+        running_id = executor.submit(blocking)
+        started.wait(timeout=2)
+        queued_id = executor.submit(lambda cancel: "stale")
+        new_id = executor.submit(lambda cancel: "fresh", preempt=True)
+        release.set()
+
+        outcomes = {}
+        while len(outcomes) < 3:
+            event = self._next_terminal(events)
+            outcomes[event.job_id] = event
+
+        assert outcomes[running_id].state == JobState.CANCELLED
+        assert outcomes[queued_id].state == JobState.CANCELLED
+        assert outcomes[new_id].state == JobState.COMPLETED
+        assert outcomes[new_id].result == "fresh"
+
+    def test_queue_is_bounded(self, executor):
+        """Should reject submissions when the pending queue is full."""
+        release = threading.Event()
+        started = threading.Event()
+
+        def blocking(cancel):
+            started.set()
+            release.wait(timeout=2)
+
+        executor.submit(blocking)
+        started.wait(timeout=2)
+        executor.submit(lambda cancel: None)
+        executor.submit(lambda cancel: None)
+
+        with pytest.raises(JobQueueFullError):
+            executor.submit(lambda cancel: None)
+
+        release.set()
+
+    def test_submit_after_shutdown_raises(self, events):
+        """Should refuse new work once shut down."""
+        executor = JobExecutor(event_sink=events.put, workers=1)
+        executor.shutdown()
+
+        with pytest.raises(RuntimeError, match="shut down"):
+            executor.submit(lambda cancel: None)
@@ -0,0 +1,124 @@
+"""Tests for PiperTTSApp event handlers."""
+
+import queue
+import threading
+import time
+
+import pytest
+
+from src.audio_output import NullBackend
+from src.audio_player import AudioPlayer
+from src.jobs import JobExecutor, JobState
+from src.main import PiperTTSApp
+from src.settings import Settings
+
+
+@pytest.fixture
+def app(mocker):
+    """App with a real audio player and the rest of its parts mocked."""
+    app = PiperTTSApp.__new__(PiperTTSApp)
+    app._audio_player = AudioPlayer(sample_rate=16000, backend=NullBackend())
+    app._settings = mocker.Mock()
+    app._settings.get.side_effect = lambda key: Settings.DEFAULT_SETTINGS.get(key)
+    app._hotkey_manager = mocker.Mock()
+    app._tray_app = mocker.Mock()
+    app._job_executor = mocker.Mock()
+    return app
+
+
+class TestPiperTTSApp:
+    """Test suite for PiperTTSApp."""
+
+    def test_speed_shortcuts_change_player_speed(self, app):
+        """Should step the player's speed when the speed shortcuts are pressed."""
+        app._setup_event_handlers()
+        callbacks = {
+            call.args[0]: call.args[1] for call in app._hotkey_manager.register.call_args_list
+        }
+        shortcuts = Settings.DEFAULT_SETTINGS["shortcuts"]
+
+        callbacks[shortcuts["speed_up"]]()
+        assert app._audio_player.speed == 1.0 + Settings.SPEED_STEP
+
+        callbacks[shortcuts["speed_down"]]()
+        callbacks[shortcuts["speed_down"]]()
+        assert app._audio_player.speed == 1.0 - Settings.SPEED_STEP
+
+    def test_speed_stays_within_settings_range(self, app):
+        """Should not step the speed past the settings window's range."""
+        for _ in range(20):
+            app._on_change_speed(1)
+        assert app._audio_player.speed == Settings.MAX_SPEED
+
+        for _ in range(20):
+            app._on_change_speed(-1)
+        assert app._audio_player.speed == Settings.MIN_SPEED
+
+    def test_speed_range_includes_settings_speed(self, app):
+        """Should limit the settings speed and player speed combined."""
+        app._settings.get.side_effect = lambda key: 1.5 if key == "speed" else None
+
+        for _ in range(20):
+            app._on_change_speed(1)
+        assert 1.5 * app._audio_player.speed == pytest.approx(Settings.MAX_SPEED)
+
+        for _ in range(20):
+            app._on_change_speed(-1)
+        assert 1.5 * app._audio_player.speed == pytest.approx(Settings.MIN_SPEED)
+
+    def test_opening_settings_does_not_reload_voice(self, app, mocker):
+        """Should wait for the settings to be saved before switching voice."""
+        window_class = mocker.patch("src.main.SettingsWindow")
+        app._tts_engine = mocker.Mock(current_voice="en_US-lessac-medium")
+
+        app._on_open_settings()
+
+        app._job_executor.submit.assert_not_called()
+        assert window_class.call_args.kwargs["save_callback"] == app._on_settings_saved
+
+    def test_saved_voice_switch_does_not_block_ui(self, app, mocker):
+        """Should load a newly saved voice on a job worker, preempting the current read."""
+        app._settings.get.side_effect = lambda key: "en_GB-alan-medium"
+        app._tts_engine = mocker.Mock(current_voice="en_US-lessac-medium")
+        app._voice_ready = threading.Event()  # Startup load still running
+
+        started = time.perf_counter()
+        app._on_settings_saved()
+        assert time.perf_counter() - started < 0.1
+        app._tts_engine.load_voice.assert_not_called()
+        assert app._job_executor.submit.call_args.kwargs["preempt"] is True
+
+        job = app._job_executor.submit.call_args.args[0]
+        app._voice_ready.set()
+        job(threading.Event())
+        app._tts_engine.load_voice.assert_called_once_with("en_GB-alan-medium")
+
+    def test_saved_voice_unchanged_does_not_interrupt_read(self, app, mocker):
+        """Should not preempt the current read when the voice did not change."""
+        app._settings.get.side_effect = lambda key: "en_US-lessac-medium"
+        app._tts_engine = mocker.Mock(current_voice="en_US-lessac-medium")
+        app._audio_player.set_speed(1.5)
+
+        app._on_settings_saved()
+
+        app._job_executor.submit.assert_not_called()
+        assert app._audio_player.speed == 1.0
+
+    def test_voice_switch_failure_is_reported(self, app, mocker):
+        """Should report a failed voice load as a FAILED job event."""
+        app._settings.get.side_effect = lambda key: "missing-voice"
+        app._tts_engine = mocker.Mock(current_voice="en_US-lessac-medium")
+        app._tts_engine.load_voice.side_effect = FileNotFoundError("missing-voice")
+        app._voice_ready = threading.Event()
+        app._voice_ready.set()
+        events = queue.Queue()
+        app._job_executor = JobExecutor(event_sink=events.put)
+
+        app._on_settings_saved()
+
+        event = events.get(timeout=1)
+        while event.state == JobState.RUNNING:
+            event = events.get(timeout=1)
+        assert event.state == JobState.FAILED
+        assert isinstance(event.error, FileNotFoundError)
+        app._job_executor.shutdown()
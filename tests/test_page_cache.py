@@ -0,0 +1,108 @@
+"""Tests for PageCache"""
+
+import os
+
+from requests.structures import CaseInsensitiveDict
+
+from src.page_cache import PageCache, freshness, parse_cache_control
+
+NOW = 1_700_000_000.0
+URL = "https://example.com/article"
+
+
+def headers(**values: str) -> CaseInsensitiveDict:
+    """Response headers from keyword arguments (underscores become dashes)"""
+    return CaseInsensitiveDict({name.replace("_", "-"): value for name, value in values.items()})
+
+
+class TestPageCache:
+    def test_parse_cache_control(self):
+        """Should split directives and unquote arguments"""
+        directives = parse_cache_control('max-age=60, no-cache, private="Set-Cookie"')
+
+        assert directives == {"max-age": "60", "no-cache": None, "private": "Set-Cookie"}
+
+    def test_freshness_follows_cache_control(self):
+        """Should honour no-store, no-cache, max-age and Age"""
+        assert freshness(headers(Cache_Control="no-store"), NOW) is None
+        assert freshness(headers(Cache_Control="no-cache, max-age=60"), NOW) == NOW
+        assert freshness(headers(Cache_Control="max-age=60"), NOW) == NOW + 60
+        assert freshness(headers(Cache_Control="max-age=60", Age="50"), NOW) == NOW + 10
+
+    def test_freshness_falls_back_to_expires_and_last_modified(self):
+        """Should use Expires, then a fraction of the time since Last-Modified"""
+        date = "Tue, 14 Nov 2023 22:13:20 GMT"  # NOW
+        expires = headers(Date=date, Expires="Tue, 14 Nov 2023 22:23:20 GMT")
+        modified = headers(Date=date, Last_Modified="Tue, 14 Nov 2023 19:26:40 GMT")
+
+        assert freshness(expires, NOW) == NOW + 600
+        assert freshness(modified, NOW) == NOW + 1000
+        assert freshness(headers(Expires="0"), NOW) == NOW
+
+    def test_stores_body_and_text(self, tmp_path):
+        """Should keep the body and extracted text across instances"""
+        PageCache(tmp_path).put(
+            URL, headers(Cache_Control="max-age=60"), b"<p>Hi</p>", "utf-8", "Hi", "lxml", NOW
+        )
+
+        cache = PageCache(tmp_path)
+        page = cache.get(URL)
+
+        assert page.text == "Hi"
+        assert page.parser == "lxml"
+        assert page.is_fresh(NOW + 30)
+        assert not page.is_fresh(NOW + 60)
+        assert cache.body(URL) == b"<p>Hi</p>"
+
+    def test_does_not_store_what_cannot_be_reused(self, tmp_path):
+        """Should skip no-store responses and stale ones without validators"""
+        cache = PageCache(tmp_path)
+
+        assert cache.put(URL, headers(Cache_Control="no-store, max-age=60"), b"x", now=NOW) is None
+        assert cache.put(URL, headers(), b"x", now=NOW) is None
+        assert URL not in cache
+        assert cache.put(URL, headers(ETag='"v1"'), b"x", now=NOW) is not None
+
+    def test_validators_and_revalidation(self, tmp_path):
+        """Should send stored validators and refresh expiry on a 304"""
+        cache = PageCache(tmp_path)
+        response_headers = headers(
+            ETag='"v1"', Last_Modified="Mon, 13 Nov 2023 00:00:00 GMT", Cache_Control="no-cache"
+        )
+        cache.put(URL, response_headers, b"x", now=NOW)
+
+        page = cache.get(URL)
+        assert not page.is_fresh(NOW)
+        assert page.validators() == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Mon, 13 Nov 2023 00:00:00 GMT",
+        }
+
+        page = cache.revalidated(URL, headers(ETag='"v2"', Cache_Control="max-age=60"), NOW)
+        assert page.is_fresh(NOW)
+        assert cache.get(URL).etag == '"v2"'
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Should stay under the size cap by dropping the oldest entries"""
+        body = b"x" * 1000
+        cache = PageCache(tmp_path, max_bytes=2500)
+        for name in ("a", "b"):
+            cache.put(f"https://example.com/{name}", headers(ETag='"1"'), body, now=NOW)
+        cache.get("https://example.com/a")
+        cache.put("https://example.com/c", headers(ETag='"1"'), body, now=NOW)
+
+        assert cache.size <= 2500
+        assert "https://example.com/a" in cache
+        assert "https://example.com/b" not in cache
+        assert "https://example.com/c" in cache
+
+    def test_body_and_metadata_use_separate_temp_files(self, tmp_path, mocker):
+        """Should never write an entry's body and metadata through the same temp file"""
+        replace = mocker.spy(os, "replace")
+        cache = PageCache(tmp_path)
+        cache.put("https://example.com/a", headers(ETag='"1"'), b"body", now=NOW)
+
+        sources = [call.args[0] for call in replace.call_args_list]
+        assert len(sources) == 2
+        assert len(set(sources)) == 2
+        assert not list(tmp_path.glob("*.tmp"))
@@ -0,0 +1,206 @@
+"""Tests for ReadingPipeline."""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from src.audio_output import NullBackend
+from src.audio_player import AudioPlayer
+from src.pipeline import ReadingPipeline
+
+
+class FakePlayer:
+    """Player stand-in that consumes play_stream on a thread."""
+
+    def __init__(self, delay: float = 0.0):
+        self.received = []
+        self.delay = delay
+        self.thread = None
+        self.enqueued = False
+        self.sample_rate = None
+        self.on_cancel = None
+
+    def play_stream(self, chunks, sample_rate=None, on_cancel=None):
+        self.sample_rate = sample_rate
+        self.on_cancel = on_cancel
+
+        def consume():
+            for chunk in chunks:
+                self.received.append(chunk)
+                time.sleep(self.delay)
+
+        self.thread = threading.Thread(target=consume, daemon=True)
+        self.thread.start()
+
+    def enqueue(self, chunks, sample_rate=None, on_cancel=None):
+        self.enqueued = True
+        self.play_stream(chunks, sample_rate, on_cancel)
+
+
+class TestReadingPipeline:
+    """Test suite for ReadingPipeline."""
+
+    @pytest.fixture
+    def extractor(self, mocker):
+        """Extractor returning its input unchanged."""
+        extractor = mocker.Mock()
+        extractor.extract.side_effect = lambda text: text
+        return extractor
+
+    @pytest.fixture
+    def engine(self, mocker):
+        """Engine producing one chunk per sentence, tagged by length."""
+        engine = mocker.Mock()
+        engine.snapshot.return_value.sample_rate = 16000
+        engine.synthesized = []
+
+        def synthesize_sentences(sentences, speed, voice=None):
+            for text in sentences:
+                engine.synthesized.append((text, speed))
+                yield np.full(len(text), 1, dtype=np.int16)
+
+        engine.synthesize_sentences.side_effect = synthesize_sentences
+        return engine
+
+    def test_run_plays_sentences_in_order(self, extractor, engine):
+        """Should feed every sentence to the player in order."""
+        player = FakePlayer()
+        pipeline = ReadingPipeline(extractor, engine, player)
+
+        pipeline.run("One. Three.\n\nFive five.", speed=1.5)
+        player.thread.join(timeout=1)
+
+        assert engine.synthesized == [("One.", 1.5), ("Three.", 1.5), ("Five five.", 1.5)]
+        assert player.sample_rate == 16000
+        assert [len(chunk) for chunk in player.received] == [4, 6, 10]
+
+    def test_run_uses_one_voice_snapshot(self, extractor, engine):
+        """Should synthesize and play with the voice captured when the read started."""
+        player = FakePlayer()
+        pipeline = ReadingPipeline(extractor, engine, player)
+        voice = engine.snapshot.return_value
+
+        pipeline.run("One. Two.")
+        player.thread.join(timeout=1)
+
+        engine.snapshot.assert_called_once()
+        assert engine.synthesize_sentences.call_args.args[2] is voice
+        assert player.sample_rate == voice.sample_rate
+
+    def test_run_can_enqueue_behind_current_playback(self, extractor, engine):
+        """Should hand audio to the player's queue when asked to enqueue."""
+        player = FakePlayer()
+        pipeline = ReadingPipeline(extractor, engine, player)
+
+        pipeline.run("One. Three.", enqueue=True)
+        player.thread.join(timeout=1)
+
+        assert player.enqueued
+        assert [len(chunk) for chunk in player.received] == [4, 6]
+
+    def test_stats_report_each_stage(self, extractor, engine):
+        """Should record items and latency for every stage."""
+        player = FakePlayer()
+        pipeline = ReadingPipeline(extractor, engine, player)
+
+        pipeline.run("Ab cd. Ef gh. Ij kl.")
+
+        stats = {s.name: s for s in pipeline.stats()}
+        assert list(stats) == ["extract", "segment", "synthesize", "play"]
+        assert stats["extract"].items == 1
+        assert stats["segment"].items == 3
+        assert stats["synthesize"].items == 3
+        assert stats["play"].items == 3
+        assert all(s.queue_depth == 0 for s in stats.values())
+        assert all(s.avg_latency >= 0 for s in stats.values())
+        assert pipeline.first_audio_latency is not None
+
+    def test_bounded_queues_apply_backpressure(self, extractor, engine):
+        """Should not synthesize far ahead of a slow player."""
+        player = FakePlayer(delay=0.05)
+        pipeline = ReadingPipeline(extractor, engine, player, queue_size=1)
+        text = " ".join(f"Sentence {i}." for i in range(20))
+
+        worker = threading.Thread(target=pipeline.run, args=(text,), daemon=True)
+        worker.start()
+        time.sleep(0.15)
+
+        # Synthesis is held back by at most the queue capacity plus in-flight items
+        assert len(engine.synthesized) < 10
+        worker.join(timeout=5)
+        assert len(player.received) == 20
+
+    def test_cancel_stops_all_stages(self, extractor, engine):
+        """Should stop promptly when the cancel event is set."""
+        player = FakePlayer(delay=0.05)
+        pipeline = ReadingPipeline(extractor, engine, player, queue_size=1)
+        cancel = threading.Event()
+        text = " ".join(f"Sentence {i}." for i in range(50))
+
+        worker = threading.Thread(target=pipeline.run, args=(text, 1.0, cancel), daemon=True)
+        worker.start()
+        time.sleep(0.1)
+        cancel.set()
+        worker.join(timeout=2)
+
+        assert not worker.is_alive()
+        assert len(engine.synthesized) < 50
+
+    def test_streaming_synthesizes_before_extraction_finishes(self, extractor, engine):
+        """Should play the first paragraph while later ones are still being extracted."""
+        player = FakePlayer()
+        first_played = threading.Event()
+
+        def iter_paragraphs(text):
+            yield "First part."
+            # The page is still "downloading" until the first audio is out
+            first_played.wait(timeout=2)
+            yield "Second part."
+
+        def synthesize_sentences(sentences, speed, voice=None):
+            for text in sentences:
+                engine.synthesized.append((text, speed))
+                yield np.full(len(text), 1, dtype=np.int16)
+                first_played.set()
+
+        extractor.iter_paragraphs.side_effect = iter_paragraphs
+        engine.synthesize_sentences.side_effect = synthesize_sentences
+        pipeline = ReadingPipeline(extractor, engine, player, streaming=True)
+
+        started = time.perf_counter()
+        pipeline.run("https://example.com")
+        player.thread.join(timeout=1)
+
+        assert time.perf_counter() - started < 1
+        assert [text for text, _ in engine.synthesized] == ["First part.", "Second part."]
+        assert pipeline.stats()[0].items == 2
+        extractor.extract.assert_not_called()
+
+    def test_player_stop_stops_the_pipeline_promptly(self, extractor, engine):
+        """Should not block stop() while extraction is still running."""
+        player = AudioPlayer(sample_rate=16000, persistent_stream=True, backend=NullBackend())
+        extractor.extract.side_effect = lambda text: time.sleep(3) or text
+        pipeline = ReadingPipeline(extractor, engine, player)
+
+        worker = threading.Thread(target=pipeline.run, args=("Slow page.",), daemon=True)
+        worker.start()
+        time.sleep(0.1)
+        started = time.perf_counter()
+        player.stop()
+        stop_time = time.perf_counter() - started
+        worker.join(timeout=1)
+        player.close()
+
+        assert stop_time < 0.5
+        assert not worker.is_alive()
+        assert engine.synthesized == []
+
+    def test_stage_error_is_raised(self, extractor, engine):
+        """Should re-raise the first stage failure from run()."""
+        extractor.extract.side_effect = RuntimeError("fetch failed")
+        pipeline = ReadingPipeline(extractor, engine, FakePlayer())
+
+        with pytest.raises(RuntimeError, match="fetch failed"):
+            pipeline.run("https://example.com")
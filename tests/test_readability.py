@@ -0,0 +1,57 @@
+"""Tests for main content detection"""
+
+from bs4 import BeautifulSoup
+
+from src.readability import from_soup, main_content
+
+
+def blocks(html: str) -> list[str]:
+    """Text of the main content blocks of a page, whitespace collapsed"""
+    found = main_content(from_soup(BeautifulSoup(html, "html.parser"), ()))
+    return [" ".join(block.text().split()) for block in found or []]
+
+
+PARAGRAPH = "<p>{}: a sentence long enough to count, with commas, clauses, and detail.</p>"
+
+
+class TestReadability:
+    def test_picks_container_with_most_prose(self):
+        """Should choose the block of paragraphs over a link list of similar length"""
+        article = "".join(PARAGRAPH.format(i) for i in range(4))
+        links = "".join(f'<a href="/{i}">{PARAGRAPH.format(f"Link {i}")}</a>' for i in range(4))
+        html = f"<body><div>{links}</div><div>{article}</div></body>"
+
+        found = blocks(html)
+
+        assert len(found) == 1
+        assert found[0].startswith("0: a sentence")
+        assert "Link" not in found[0]
+
+    def test_prunes_unlikely_blocks(self):
+        """Should drop blocks whose class, id or role mark them as boilerplate"""
+        article = "".join(PARAGRAPH.format(i) for i in range(4))
+        html = (
+            f'<body><div class="story">{article}'
+            f'<div class="comment-list">{PARAGRAPH.format("comment")}</div>'
+            f'<div role="dialog">{PARAGRAPH.format("dialog")}</div></div></body>'
+        )
+
+        text = " ".join(blocks(html))
+
+        assert "3: a sentence" in text
+        assert "comment:" not in text
+        assert "dialog:" not in text
+
+    def test_keeps_prose_siblings(self):
+        """Should add sibling paragraphs of the top block that read like prose"""
+        article = "".join(PARAGRAPH.format(i) for i in range(4))
+        html = f"<body><div>{article}</div><p>A short closing sentence.</p><p>Menu</p></body>"
+
+        found = blocks(html)
+
+        assert found[-1] == "A short closing sentence."
+        assert "Menu" not in found
+
+    def test_nothing_to_score(self):
+        """Should return None when no paragraph is long enough"""
+        assert main_content(from_soup(BeautifulSoup("<p>Hi</p>", "html.parser"), ())) is None
@@ -0,0 +1,74 @@
+"""Tests for streaming sample-rate conversion"""
+
+import numpy as np
+import pytest
+
+from src.resampler import Resampler, resample
+
+
+def tone(frequency: float, sample_rate: int, seconds: float = 1.0) -> np.ndarray:
+    """Generate an int16 sine tone"""
+    t = np.arange(int(sample_rate * seconds)) / sample_rate
+    return (8000 * np.sin(2 * np.pi * frequency * t)).astype(np.int16)
+
+
+class TestResampler:
+    @pytest.mark.parametrize(
+        "input_rate,output_rate", [(22050, 48000), (16000, 48000), (22050, 44100), (48000, 22050)]
+    )
+    def test_preserves_frequency_and_timing(self, input_rate, output_rate):
+        """Should output the same tone, aligned in time, at the new rate"""
+        converted = resample(tone(440, input_rate), input_rate, output_rate)
+
+        assert converted.dtype == np.int16
+        assert len(converted) == output_rate
+        expected = tone(440, output_rate).astype(np.float32)
+        middle = slice(output_rate // 4, 3 * output_rate // 4)
+        assert np.abs(converted[middle] - expected[middle]).max() < 50
+
+    def test_removes_content_above_new_nyquist(self):
+        """Should filter out frequencies the lower rate cannot represent"""
+        converted = resample(tone(10000, 22050), 22050, 16000)
+
+        assert np.abs(converted[1000:-1000]).max() < 200
+
+    def test_streaming_matches_one_shot(self):
+        """Should give the same output however input and output are split"""
+        rng = np.random.default_rng(0)
+        audio = (rng.standard_normal(20000) * 3000).astype(np.int16)
+        resampler = Resampler(22050, 48000)
+
+        outputs = []
+        offset = 0
+        while not resampler.finished:
+            if offset < len(audio):
+                offset += resampler.write(audio[offset : offset + int(rng.integers(1, 700))])
+            else:
+                resampler.finish()
+            out = np.empty(int(rng.integers(1, 900)), dtype=np.int16)
+            outputs.append(out[: resampler.read_into(out)])
+
+        np.testing.assert_array_equal(np.concatenate(outputs), resample(audio, 22050, 48000))
+
+    def test_reset_starts_a_new_stream(self):
+        """Should discard buffered input and restart the output count"""
+        resampler = Resampler(16000, 48000)
+        resampler.write(tone(440, 16000, 0.1))
+        resampler.read_into(np.empty(1000, dtype=np.int16))
+
+        resampler.reset()
+
+        assert resampler.written == 0
+        assert resampler.input_position == 0
+        assert resampler.read_into(np.empty(1000, dtype=np.int16)) == 0
+
+    def test_same_rate_returns_input(self):
+        """Should not process audio already at the requested rate"""
+        audio = tone(440, 22050)
+
+        assert resample(audio, 22050, 22050) is audio
+
+    def test_invalid_rate_raises(self):
+        """Should reject non-positive sample rates"""
+        with pytest.raises(ValueError):
+            Resampler(0, 48000)
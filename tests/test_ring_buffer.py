@@ -0,0 +1,119 @@
+"""Tests for AudioRingBuffer"""
+
+import threading
+
+import numpy as np
+import pytest
+
+from src.ring_buffer import AudioRingBuffer
+
+
+class TestAudioRingBuffer:
+    def test_write_then_read_round_trip(self):
+        """Should return samples in the order they were written"""
+        ring = AudioRingBuffer(capacity=8)
+        ring.write(np.arange(5, dtype=np.int16))
+
+        out = np.zeros(5, dtype=np.int16)
+        assert ring.read_into(out) == 5
+        assert list(out) == [0, 1, 2, 3, 4]
+        assert ring.available == 0
+
+    def test_wraps_around_capacity(self):
+        """Should handle reads and writes that cross the end of the buffer"""
+        ring = AudioRingBuffer(capacity=4)
+        out = np.zeros(3, dtype=np.int16)
+
+        ring.write(np.array([1, 2, 3], dtype=np.int16))
+        ring.read_into(out)
+        ring.write(np.array([4, 5, 6], dtype=np.int16))
+
+        assert ring.read_into(out) == 3
+        assert list(out) == [4, 5, 6]
+
+    def test_read_is_partial_when_underrun(self):
+        """Should copy only what is available without blocking"""
+        ring = AudioRingBuffer(capacity=8)
+        ring.write(np.array([7, 8], dtype=np.int16))
+
+        out = np.full(4, -1, dtype=np.int16)
+        assert ring.read_into(out) == 2
+        assert list(out[:2]) == [7, 8]
+
+    def test_write_blocks_until_space_is_freed(self):
+        """Should apply backpressure to the producer when full"""
+        ring = AudioRingBuffer(capacity=4, poll_interval=0.001)
+        data = np.arange(10, dtype=np.int16)
+
+        writer = threading.Thread(target=ring.write, args=(data,))
+        writer.start()
+
+        received = []
+        out = np.zeros(3, dtype=np.int16)
+        while len(received) < len(data):
+            assert ring.available <= ring.capacity
+            count = ring.read_into(out)
+            received.extend(out[:count].tolist())
+
+        writer.join(timeout=1)
+        assert received == list(range(10))
+
+    def test_abort_unblocks_writer(self):
+        """Should make a blocked write return early"""
+        ring = AudioRingBuffer(capacity=2, poll_interval=0.001)
+        result = []
+
+        writer = threading.Thread(
+            target=lambda: result.append(ring.write(np.zeros(10, dtype=np.int16)))
+        )
+        writer.start()
+        ring.abort()
+        writer.join(timeout=1)
+
+        assert not writer.is_alive()
+        assert result == [2]
+
+    def test_drained_after_close(self):
+        """Should report drained only once closed and empty"""
+        ring = AudioRingBuffer(capacity=4)
+        ring.write(np.array([1], dtype=np.int16))
+        ring.close()
+        assert not ring.drained
+
+        ring.read_into(np.zeros(4, dtype=np.int16))
+        assert ring.drained
+
+    def test_invalid_capacity_raises(self):
+        """Should reject non-positive capacities"""
+        with pytest.raises(ValueError, match="Capacity must be positive"):
+            AudioRingBuffer(capacity=0)
+
+    def test_seek_back_into_history(self):
+        """Should re-read kept samples after seeking back"""
+        ring = AudioRingBuffer(capacity=8, history=4)
+        ring.write(np.arange(4, dtype=np.int16))
+        out = np.zeros(3, dtype=np.int16)
+        ring.read_into(out)
+
+        assert ring.seek(1) == 1
+        assert ring.read_into(out) == 3
+        assert list(out) == [1, 2, 3]
+
+    def test_seek_is_clamped_to_held_samples(self):
+        """Should not seek past unwritten samples or before the kept history"""
+        ring = AudioRingBuffer(capacity=6, history=2)
+        ring.write(np.arange(4, dtype=np.int16))
+        out = np.zeros(4, dtype=np.int16)
+        ring.read_into(out)
+
+        assert ring.earliest == 2
+        assert ring.seek(0) == 2
+        assert ring.seek(10) == 4
+
+    def test_history_is_not_overwritten(self):
+        """Should reserve history so the writer only fills the rest"""
+        ring = AudioRingBuffer(capacity=6, history=2)
+
+        assert ring.free == 4
+        ring.write(np.arange(4, dtype=np.int16))
+        assert ring.free == 0
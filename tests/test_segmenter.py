@@ -0,0 +1,52 @@
+"""Tests for sentence segmentation."""
+
+from src.segmenter import split_paragraphs, split_sentences
+
+
+class TestSegmenter:
+    """Test suite for segmenter functions."""
+
+    def test_split_sentences_on_terminal_punctuation(self):
+        """Should split at periods, question and exclamation marks."""
+        sentences = split_sentences("Hello there. How are you? Great!")
+
+        assert [s.text for s in sentences] == ["Hello there.", "How are you?", "Great!"]
+
+    def test_split_sentences_offsets_index_source(self):
+        """Should report character ranges into the original text."""
+        text = "First one.  Second\n one."
+        sentences = split_sentences(text)
+
+        assert [text[s.start : s.end] for s in sentences] == ["First one.", "Second\n one."]
+        assert sentences[1].text == "Second one."
+
+    def test_split_sentences_keeps_abbreviations(self):
+        """Should not split after common abbreviations or initials."""
+        sentences = split_sentences("Dr. Smith met J. Doe today. It went well.")
+
+        assert [s.text for s in sentences] == ["Dr. Smith met J. Doe today.", "It went well."]
+
+    def test_split_sentences_ignores_lowercase_continuation(self):
+        """Should not split when the next word is lowercase."""
+        sentences = split_sentences("Version 2. is out. Next up.")
+
+        assert len(sentences) == 2
+
+    def test_split_sentences_breaks_long_runs(self):
+        """Should cap sentence length at whitespace."""
+        text = " ".join(["word"] * 50)
+        sentences = split_sentences(text, max_chars=40)
+
+        assert len(sentences) > 1
+        assert all(len(s.text) <= 40 for s in sentences)
+        assert " ".join(s.text for s in sentences) == text
+
+    def test_split_sentences_empty(self):
+        """Should return nothing for blank text."""
+        assert split_sentences("   \n ") == []
+
+    def test_split_paragraphs_on_blank_lines(self):
+        """Should split on blank lines and drop empty paragraphs."""
+        text = "First para\nstill first.\n\n\nSecond para.\n \n"
+
+        assert split_paragraphs(text) == ["First para\nstill first.", "Second para."]
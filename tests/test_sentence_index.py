@@ -0,0 +1,42 @@
+"""Tests for SentenceIndex"""
+
+from src.sentence_index import SentenceIndex
+
+
+class TestSentenceIndex:
+    def test_offsets_are_cumulative(self):
+        """Should start each sentence where the previous one ended"""
+        index = SentenceIndex()
+        index.add(100, 0, 10)
+        index.add(50, 11, 20)
+        index.add(25)
+
+        assert len(index) == 3
+        assert [index.offset(i) for i in range(3)] == [0, 100, 150]
+        assert index.total == 175
+
+    def test_records_text_ranges(self):
+        """Should keep each sentence's character range when given"""
+        index = SentenceIndex()
+        index.add(100, 0, 10)
+        index.add(50)
+
+        assert index.text_range(0) == (0, 10)
+        assert index.text_range(1) is None
+
+    def test_locate_finds_sentence_at_position(self):
+        """Should map sample positions to the sentence being played"""
+        index = SentenceIndex()
+        for length in (100, 50, 25):
+            index.add(length)
+
+        assert index.locate(0) == 0
+        assert index.locate(99) == 0
+        assert index.locate(100) == 1
+        assert index.locate(174) == 2
+        # Past the end stays on the last sentence
+        assert index.locate(1000) == 2
+
+    def test_locate_on_empty_index(self):
+        """Should return -1 when there are no sentences"""
+        assert SentenceIndex().locate(0) == -1
@@ -100,3 +100,15 @@ class TestSettings:
 
         with pytest.raises(KeyError):
             settings.set("nonexistent_key", "value")
+
+    def test_load_fills_missing_defaults(self, tmp_path):
+        """Should add defaults for keys missing from an older config file."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({"voice": "old-voice", "shortcuts": {"stop": "f9"}}))
+
+        settings = Settings(config_path=config_file)
+
+        assert settings.get("voice") == "old-voice"
+        assert settings.get("synthesis_workers") == 1
+        assert settings.get("shortcuts.stop") == "f9"
+        assert settings.get("shortcuts.play_pause") == "ctrl+shift+p"
@@ -64,6 +64,22 @@ class TestSettingsWindow:
         assert mock_settings.set.call_count == 3
         mock_settings.save.assert_called_once()
 
+    def test_save_calls_save_callback(self, mocker):
+        """Should notify the app after saving, but not on cancel."""
+        mock_settings = mocker.Mock()
+        mock_settings.get.return_value = "en_US-lessac-medium"
+        mocker.patch("src.ui.settings_window.tk")
+        mocker.patch("src.ui.settings_window.ttk")
+        callback = mocker.Mock()
+
+        window = SettingsWindow(mock_settings, ["en_US-lessac-medium"], save_callback=callback)
+        window._on_cancel()
+        callback.assert_not_called()
+
+        window._on_save()
+        mock_settings.save.assert_called_once()
+        callback.assert_called_once_with()
+
     def test_cancel_closes_without_saving(self, mocker):
         """Should close without saving."""
         mock_settings = mocker.Mock()
@@ -0,0 +1,71 @@
+"""Tests for SynthesisPool"""
+
+import numpy as np
+import pytest
+
+from src.synthesis_pool import SynthesisPool
+
+
+def _fake_voice(mocker):
+    """Voice whose audio encodes the sentence length"""
+    voice = mocker.MagicMock()
+
+    def synthesize(text, syn_config=None):
+        chunk = mocker.MagicMock()
+        chunk.audio_int16_array = np.full(len(text), len(text), dtype=np.int16)
+        return [chunk]
+
+    voice.synthesize.side_effect = synthesize
+    return voice
+
+
+class TestSynthesisPool:
+    @pytest.fixture
+    def pool(self, mocker):
+        """Pool of forked workers that inherit a patched PiperVoice"""
+        mocker.patch("src.synthesis_pool.PiperVoice.load", return_value=_fake_voice(mocker))
+        pool = SynthesisPool("voice.onnx", workers=2, mp_context="fork")
+        yield pool
+        pool.close()
+
+    def test_results_are_in_input_order(self, pool):
+        """Should reassemble sentences in the order they were given"""
+        sentences = ["a" * n for n in range(1, 12)]
+
+        results = list(pool.synthesize(sentences))
+
+        assert [len(audio) for audio in results] == list(range(1, 12))
+        assert all(audio.dtype == np.int16 for audio in results)
+
+    def test_accepts_lazy_input(self, pool):
+        """Should consume sentences from a generator"""
+        sentences = (f"Sentence {i}." for i in range(5))
+
+        assert len(list(pool.synthesize(sentences))) == 5
+
+    def test_close_waits_for_read_in_progress(self, pool):
+        """Should let a started read finish and refuse new ones after close"""
+        reading = pool.synthesize(f"Sentence {i}." for i in range(6))
+        first = next(reading)
+
+        pool.close()
+
+        assert len([first, *reading]) == 6
+        with pytest.raises(RuntimeError, match="closed"):
+            list(pool.synthesize(["Too late."]))
+
+    def test_hold_keeps_closed_pool_running(self, pool):
+        """Should let a read start on a closed pool while a hold is taken"""
+        pool.hold()
+        pool.close()
+
+        assert len(list(pool.synthesize(["Still running."]))) == 1
+
+        pool.release()
+        with pytest.raises(RuntimeError, match="closed"):
+            list(pool.synthesize(["Too late."]))
+
+    def test_invalid_worker_count_raises(self):
+        """Should reject fewer than one worker"""
+        with pytest.raises(ValueError, match="at least 1"):
+            SynthesisPool("voice.onnx", workers=0)
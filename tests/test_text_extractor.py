@@ -2,8 +2,60 @@
 
 import pytest
 import requests
+from requests.structures import CaseInsensitiveDict
 
-from src.text_extractor import TextExtractor
+from src.page_cache import PageCache
+from src.text_extractor import TextExtractor, available_parsers
+
+SAMPLE_PAGE = """<!DOCTYPE html>
+<html>
+    <head><title>Page &amp; title</title><style>p { margin: 0; }</style></head>
+    <body>
+        <!-- comment -->
+        <header>Site header</header>
+        <nav><a href="/">Home</a></nav>
+        <h1>Headline</h1>
+        <p>First   paragraph with <b>bold</b> and <a href="#">a link</a>.</p>
+        <script>var x = "<p>not text</p>";</script>
+        <aside>Related</aside>
+        <p>Second&nbsp;paragraph<br>continues.</p>
+        <footer>Footer</footer>
+    </body>
+</html>
+"""
+
+ARTICLE_PAGE = """<!DOCTYPE html>
+<html><body>
+<div id="cookie-banner">We use cookies to improve your experience. Accept all cookies, or
+    manage your preferences in settings.</div>
+<main>
+    <article class="post">
+        <h1>How rivers shape valleys</h1>
+        <p>Rivers carve valleys over thousands of years, slowly wearing away rock, soil and
+            sediment as water flows downhill towards the sea.</p>
+        <p>In the upper course, the gradient is steep, so the river cuts downwards, forming
+            narrow V-shaped valleys, waterfalls and gorges.</p>
+        <p>Further downstream, the river widens, meanders form, and floodplains build up as
+            sediment is deposited during floods.</p>
+        <p>Near the mouth, the river slows, dropping its remaining load to build deltas and
+            estuaries, which are rich habitats for wildlife.</p>
+    </article>
+    <section class="comments">
+        <h2>Comments (2)</h2>
+        <div class="comment"><p>Great article, thanks! I always wondered how the valleys near
+            my home formed, and this explains it well.</p></div>
+        <div class="comment"><p>I disagree about deltas, some of them form very differently,
+            depending on tides and waves.</p></div>
+    </section>
+    <div class="related-links"><h3>Related</h3><ul>
+        <li><a href="/a">Mountains and how they form over time</a></li>
+        <li><a href="/b">Glaciers, ice ages and the carving of fjords</a></li>
+    </ul></div>
+</main>
+<div class="newsletter"><p>Subscribe to our newsletter for weekly updates, news, offers and
+    much more, delivered to you.</p></div>
+</body></html>
+"""
 
 
 class TestTextExtractor:
@@ -129,3 +181,180 @@ class TestTextExtractor:
         # Should not have multiple consecutive spaces or excessive newlines
         assert "   " not in text
         assert "\n\n\n" not in text
+
+    @pytest.mark.parametrize("parser", available_parsers())
+    def test_parsers_extract_the_same_text(self, parser):
+        """Should give the html.parser output with every installed backend."""
+        expected = TextExtractor(parser="html.parser").extract_html(SAMPLE_PAGE)
+
+        text = TextExtractor(parser=parser).extract_html(SAMPLE_PAGE)
+
+        assert text == expected
+        assert "Headline" in text
+        assert "Site header" not in text
+        assert "not text" not in text
+
+    def test_missing_parser_falls_back(self, mocker):
+        """Should use the next available backend when one is not installed."""
+        mocker.patch("src.text_extractor.find_spec", return_value=None)
+
+        assert TextExtractor(parser="auto").parser == "html.parser"
+        assert TextExtractor(parser="selectolax").parser == "html.parser"
+
+    def test_parse_failure_falls_back_to_html_parser(self, mocker):
+        """Should retry a document a fast backend rejects with html.parser."""
+        extractor = TextExtractor()
+        extractor.parser = "lxml"
+        extract = extractor._extract
+
+        def fail_fast_backends(html, parser):
+            if parser != "html.parser":
+                raise ValueError("cannot parse")
+            return extract(html, parser)
+
+        mocker.patch.object(extractor, "_extract", side_effect=fail_fast_backends)
+
+        assert extractor.extract_html("<p>Still read</p>") == "Still read"
+
+    @pytest.mark.parametrize("parser", available_parsers())
+    def test_main_content_drops_boilerplate(self, parser):
+        """Should keep the article and report the comments, banner and links it dropped."""
+        extracted = TextExtractor(parser=parser).extract_document(ARTICLE_PAGE)
+
+        assert extracted.text.startswith("How rivers shape valleys\n")
+        assert extracted.text.endswith("rich habitats for wildlife.")
+        for boilerplate in ("cookies", "Comments", "Great article", "Glaciers", "newsletter"):
+            assert boilerplate not in extracted.text
+        full_text = TextExtractor(parser=parser, main_content=False).extract_html(ARTICLE_PAGE)
+        assert extracted.total_chars == len(full_text)
+        assert extracted.discarded_chars == len(full_text) - len(extracted.text)
+        assert 0.4 < extracted.discarded_fraction < 0.6
+
+    def test_short_main_content_reads_whole_page(self):
+        """Should keep all text when the detected content is too short to trust."""
+        extractor = TextExtractor()
+
+        extracted = extractor.extract_document(SAMPLE_PAGE)
+
+        assert extracted.text == TextExtractor(main_content=False).extract_html(SAMPLE_PAGE)
+        assert extracted.discarded_chars == 0
+
+    def test_unknown_parser_raises(self):
+        """Should reject parser names that are not backends."""
+        with pytest.raises(ValueError):
+            TextExtractor(parser="html5lib")
+
+    def _response(self, mocker, status_code=200, html="<p>Cached page</p>", **headers):
+        """Build a mock response with headers and a body."""
+        response = mocker.Mock()
+        response.status_code = status_code
+        response.text = html
+        response.content = html.encode("utf-8")
+        response.encoding = "utf-8"
+        response.headers = CaseInsensitiveDict(headers)
+        return response
+
+    def _streamed_response(self, mocker, chunks, received, **headers):
+        """Build a mock streamed response that records each chunk as it is read."""
+        response = self._response(mocker, **headers)
+
+        def iter_content(chunk_size):
+            for chunk in chunks:
+                received.append(chunk)
+                yield chunk
+
+        response.iter_content.side_effect = iter_content
+        return response
+
+    def test_iter_paragraphs_yields_while_downloading(self, mocker):
+        """Should yield a paragraph before the rest of the page has been read."""
+        chunks = [b"<p>First paragraph.</p><p>Sec", b"ond paragraph.</p>", b"<p>Third.</p>"]
+        received = []
+        extractor = TextExtractor()
+        get = mocker.patch.object(
+            extractor.session,
+            "get",
+            return_value=self._streamed_response(mocker, chunks, received),
+        )
+
+        paragraphs = extractor.iter_paragraphs("https://example.com")
+
+        assert next(paragraphs) == "First paragraph."
+        assert len(received) == 1
+        assert list(paragraphs) == ["Second paragraph.", "Third."]
+        assert get.call_args.kwargs["stream"] is True
+
+    def test_iter_paragraphs_stops_at_byte_budget(self, mocker, tmp_path):
+        """Should stop reading at max_bytes and not cache the truncated page."""
+        chunks = [b"<p>Kept paragraph.</p><p>Cut ", b"off here.</p>", b"<p>Never read.</p>"]
+        received = []
+        extractor = TextExtractor(cache=PageCache(tmp_path), max_bytes=len(chunks[0]) + 4)
+        mocker.patch.object(
+            extractor.session,
+            "get",
+            return_value=self._streamed_response(
+                mocker, chunks, received, **{"Cache-Control": "max-age=300"}
+            ),
+        )
+
+        paragraphs = list(extractor.iter_paragraphs("https://example.com"))
+
+        assert paragraphs == ["Kept paragraph.", "Cut off"]
+        assert len(received) == 2
+        assert "https://example.com" not in extractor.cache
+
+    def test_iter_paragraphs_splits_plain_text(self):
+        """Should split plain text on blank lines."""
+        extractor = TextExtractor()
+
+        assert list(extractor.iter_paragraphs("One.\n\nTwo.")) == ["One.", "Two."]
+
+    def test_fresh_cached_page_skips_download_and_parse(self, mocker, tmp_path):
+        """Should serve a fresh page from the cache without fetching or parsing."""
+        extractor = TextExtractor(cache=PageCache(tmp_path))
+        get = mocker.patch.object(
+            extractor.session,
+            "get",
+            return_value=self._response(mocker, **{"Cache-Control": "max-age=300"}),
+        )
+
+        assert extractor.extract("https://example.com") == "Cached page"
+        parse = mocker.spy(extractor, "extract_html")
+        assert extractor.extract("https://example.com") == "Cached page"
+
+        assert get.call_count == 1
+        assert parse.call_count == 0
+
+    def test_stale_page_is_revalidated(self, mocker, tmp_path):
+        """Should send validators and reuse the cached text on 304."""
+        extractor = TextExtractor(cache=PageCache(tmp_path))
+        get = mocker.patch.object(
+            extractor.session,
+            "get",
+            side_effect=[
+                self._response(mocker, ETag='"v1"', **{"Cache-Control": "no-cache"}),
+                self._response(mocker, status_code=304, html=""),
+            ],
+        )
+
+        extractor.extract("https://example.com")
+        parse = mocker.spy(extractor, "extract_html")
+        text = extractor.extract("https://example.com")
+
+        assert text == "Cached page"
+        assert get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+        assert parse.call_count == 0
+
+    def test_no_store_page_is_not_cached(self, mocker, tmp_path):
+        """Should download no-store pages every time."""
+        extractor = TextExtractor(cache=PageCache(tmp_path))
+        get = mocker.patch.object(
+            extractor.session,
+            "get",
+            return_value=self._response(mocker, **{"Cache-Control": "no-store"}),
+        )
+
+        extractor.extract("https://example.com")
+        extractor.extract("https://example.com")
+
+        assert get.call_count == 2
@@ -0,0 +1,58 @@
+"""Tests for pitch-preserving time-stretch"""
+
+import numpy as np
+import pytest
+
+from src.time_stretch import TimeStretcher, time_stretch
+
+SAMPLE_RATE = 22050
+
+
+def tone(frequency: float, seconds: float = 1.0) -> np.ndarray:
+    """Generate an int16 sine tone"""
+    t = np.arange(int(SAMPLE_RATE * seconds)) / SAMPLE_RATE
+    return (8000 * np.sin(2 * np.pi * frequency * t)).astype(np.int16)
+
+
+def dominant_frequency(audio: np.ndarray) -> float:
+    """Find the strongest frequency in a signal"""
+    spectrum = np.abs(np.fft.rfft(audio.astype(np.float32)))
+    return float(np.fft.rfftfreq(len(audio), 1 / SAMPLE_RATE)[np.argmax(spectrum)])
+
+
+class TestTimeStretch:
+    @pytest.mark.parametrize("speed", [0.5, 0.75, 1.5, 2.0])
+    def test_duration_scales_with_speed(self, speed):
+        """Should produce len(audio) / speed samples"""
+        audio = tone(220)
+        stretched = time_stretch(audio, speed, SAMPLE_RATE)
+
+        assert stretched.dtype == np.int16
+        assert len(stretched) == round(len(audio) / speed)
+
+    @pytest.mark.parametrize("speed", [0.75, 2.0])
+    def test_preserves_pitch(self, speed):
+        """Should keep the tone's frequency while changing duration"""
+        stretched = time_stretch(tone(220), speed, SAMPLE_RATE)
+
+        assert abs(dominant_frequency(stretched) - 220) < 5
+
+    def test_unit_speed_returns_input(self):
+        """Should pass audio through untouched at normal speed"""
+        audio = tone(220)
+        assert time_stretch(audio, 1.0, SAMPLE_RATE) is audio
+
+    def test_streaming_matches_one_shot(self):
+        """Should give identical output whether fed in blocks or all at once"""
+        audio = tone(330, seconds=2.0)
+        stretcher = TimeStretcher(1.5, SAMPLE_RATE)
+
+        parts = [stretcher.process(audio[i : i + 1000]) for i in range(0, len(audio), 1000)]
+        parts.append(stretcher.flush())
+
+        assert np.array_equal(np.concatenate(parts), time_stretch(audio, 1.5, SAMPLE_RATE))
+
+    def test_rejects_non_positive_speed(self):
+        """Should raise ValueError for zero or negative speed"""
+        with pytest.raises(ValueError):
+            TimeStretcher(0.0, SAMPLE_RATE)
@@ -32,7 +32,7 @@ class TestPiperTTSEngine:
         mock_chunk.audio_int16_array = np.array([1, 2, 3, 4, 5], dtype=np.int16)
 
         # Mock piper-tts synthesis to return audio chunks
-        def mock_synthesize(text):
+        def mock_synthesize(text, syn_config=None):
             return [mock_chunk]
 
         mocker.patch("piper.PiperVoice.load")
@@ -50,30 +50,52 @@ class TestPiperTTSEngine:
         assert sample_rate == 22050
 
     def test_synthesize_with_speed_adjustment(self, temp_voices_dir, mock_voice_file, mocker):
-        """Should adjust audio speed correctly"""
+        """Should pass speed to Piper as a shorter phoneme length scale"""
         import numpy as np
 
-        # Mock AudioChunk with enough samples to test speed adjustment
-        mock_chunk = mocker.MagicMock()
-        mock_chunk.audio_int16_array = np.zeros(44100, dtype=np.int16)  # 2 seconds at 22050 Hz
-
-        # Mock piper-tts synthesis to return audio chunks
-        def mock_synthesize(text):
-            return [mock_chunk]
+        # Mock piper-tts synthesis so duration follows the requested length scale
+        def mock_synthesize(text, syn_config=None):
+            chunk = mocker.MagicMock()
+            chunk.audio_int16_array = np.zeros(int(22050 * syn_config.length_scale), dtype=np.int16)
+            return [chunk]
 
         mocker.patch("piper.PiperVoice.load")
         engine = PiperTTSEngine(voices_dir=temp_voices_dir)
         engine.load_voice("en_US-test-medium")
 
         # Mock the synthesize method
-        mocker.patch.object(engine._voice, "synthesize", side_effect=mock_synthesize)
+        synth = mocker.patch.object(engine._voice, "synthesize", side_effect=mock_synthesize)
 
         # Test different speeds
         audio_normal, _ = engine.synthesize("Hello", speed=1.0)
         audio_fast, _ = engine.synthesize("Hello", speed=2.0)
 
-        # Faster speed should produce shorter audio
-        assert len(audio_fast) < len(audio_normal)
+        # Faster speed should produce shorter audio, generated by the model itself
+        assert len(audio_fast) == len(audio_normal) // 2
+        scales = [call.kwargs["syn_config"].length_scale for call in synth.call_args_list]
+        assert scales == [1.0, 0.5]
+
+    def test_speed_is_part_of_cache_key(self, temp_voices_dir, mock_voice_file, mocker):
+        """Should not serve audio cached at a different speed"""
+        import numpy as np
+
+        from src.audio_cache import AudioCache
+
+        def mock_synthesize(text, syn_config=None):
+            chunk = mocker.MagicMock()
+            chunk.audio_int16_array = np.zeros(int(100 * syn_config.length_scale), dtype=np.int16)
+            return [chunk]
+
+        mocker.patch("piper.PiperVoice.load")
+        engine = PiperTTSEngine(voices_dir=temp_voices_dir, cache=AudioCache())
+        engine.load_voice("en_US-test-medium")
+        mocker.patch.object(engine._voice, "synthesize", side_effect=mock_synthesize)
+
+        normal, _ = engine.synthesize("Hello", speed=1.0)
+        fast, _ = engine.synthesize("Hello", speed=2.0)
+
+        assert len(normal) == 100
+        assert len(fast) == 50
 
     def test_synthesize_empty_text_raises(self, temp_voices_dir, mock_voice_file, mocker):
         """Should raise ValueError for empty text"""
@@ -110,3 +132,289 @@ class TestPiperTTSEngine:
 
         engine.load_voice("en_US-test-medium")
         assert engine.current_voice == "en_US-test-medium"
+
+    def test_synthesize_stream_yields_chunk_per_sentence(
+        self, temp_voices_dir, mock_voice_file, mocker
+    ):
+        """Should yield each Piper chunk as it is produced"""
+        import numpy as np
+
+        produced = []
+
+        def mock_synthesize(text, syn_config=None):
+            value = len(produced) + 1
+            chunk = mocker.MagicMock()
+            chunk.audio_int16_array = np.full(10, value, dtype=np.int16)
+            produced.append(value)
+            yield chunk
+
+        mocker.patch("piper.PiperVoice.load")
+        engine = PiperTTSEngine(voices_dir=temp_voices_dir)
+        engine.load_voice("en_US-test-medium")
+        mocker.patch.object(engine._voice, "synthesize", side_effect=mock_synthesize)
+
+        stream = engine.synthesize_stream("One. Two. Three.")
+        first = next(stream)
+
+        # Only the first sentence has been synthesized so far
+        assert produced == [1]
+        assert first.dtype == np.int16
+        assert list(first) == [1] * 10
+
+        rest = list(stream)
+        assert len(rest) == 2
+        assert produced == [1, 2, 3]
+
+    def test_synthesize_stream_fills_sentence_index(
+        self, temp_voices_dir, mock_voice_file, mocker
+    ):
+        """Should record each sentence's sample offset and character range"""
+        import numpy as np
+
+        from src.sentence_index import SentenceIndex
+
+        def mock_synthesize(text, syn_config=None):
+            chunk = mocker.MagicMock()
+            chunk.audio_int16_array = np.zeros(len(text) * 10, dtype=np.int16)
+            yield chunk
+
+        mocker.patch("piper.PiperVoice.load")
+        engine = PiperTTSEngine(voices_dir=temp_voices_dir)
+        engine.load_voice("en_US-test-medium")
+        mocker.patch.object(engine._voice, "synthesize", side_effect=mock_synthesize)
+
+        text = "One. Three."
+        index = SentenceIndex()
+        list(engine.synthesize_stream(text, index=index))
+
+        assert len(index) == 2
+        assert index.offset(1) == len("One.") * 10
+        start, end = index.text_range(1)
+        assert text[start:end].strip() == "Three."
+
+    def test_synthesize_stream_validates_eagerly(self, temp_voices_dir):
+        """Should raise before iteration starts for invalid input"""
+        engine = PiperTTSEngine(voices_dir=temp_voices_dir)
+
+        with pytest.raises(ValueError, match="Text cannot be empty"):
+            engine.synthesize_stream("  ")
+
+        with pytest.raises(TTSError, match="No voice loaded"):
+            engine.synthesize_stream("Hello world")
+
+    def test_synthesize_stream_wraps_errors(self, temp_voices_dir, mock_voice_file, mocker):
+        """Should raise TTSError when Piper fails mid-stream"""
+        mocker.patch("piper.PiperVoice.load")
+        engine = PiperTTSEngine(voices_dir=temp_voices_dir)
+        engine.load_voice("en_US-test-medium")
+        mocker.patch.object(
+            engine._voice, "synthesize", side_effect=RuntimeError("onnx exploded")
+        )
+
+        with pytest.raises(TTSError, match="Synthesis failed"):
+            list(engine.synthesize_stream("Hello world"))
+
+    def test_workers_use_synthesis_pool(self, temp_voices_dir, mock_voice_file, mocker):
+        """Should fan sentences out to the process pool when workers > 1"""
+        import numpy as np
+
+        mocker.patch("piper.PiperVoice.load")
+        mock_pool_class = mocker.patch("src.tts_engine.SynthesisPool")
+        mock_pool = mock_pool_class.return_value
+        mock_pool.synthesize.side_effect = lambda sentences, **kwargs: (
+            np.ones(len(s), dtype=np.int16) for s in sentences
+        )
+
+        engine = PiperTTSEngine(voices_dir=temp_voices_dir, workers=3)
+        engine.load_voice("en_US-test-medium")
+
+        mock_pool_class.assert_called_once_with(mock_voice_file, 3)
+        chunks = list(engine.synthesize_stream("First one. Second one."))
+
+        assert [len(c) for c in chunks] == [len("First one."), len("Second one.")]
+
+        engine.set_workers(1)
+        mock_pool.close.assert_called_once()
+        assert engine.workers == 1
+
+    def test_synthesize_sentences_in_process(self, temp_voices_dir, mock_voice_file, mocker):
+        """Should yield one array per sentence without a pool"""
+        import numpy as np
+
+        def mock_synthesize(text, syn_config=None):
+            chunk = mocker.MagicMock()
+            chunk.audio_int16_array = np.zeros(len(text), dtype=np.int16)
+            return [chunk, chunk]
+
+        mocker.patch("piper.PiperVoice.load")
+        engine = PiperTTSEngine(voices_dir=temp_voices_dir)
+        engine.load_voice("en_US-test-medium")
+        mocker.patch.object(engine._voice, "synthesize", side_effect=mock_synthesize)
+
+        results = list(engine.synthesize_sentences(iter(["ab", "cdef"])))
+
+        assert [len(r) for r in results] == [4, 8]
+
+    def test_cache_serves_repeated_sentences(self, temp_voices_dir, mock_voice_file, mocker):
+        """Should only synthesize sentences that are not already cached"""
+        import numpy as np
+
+        from src.audio_cache import AudioCache
+
+        def mock_synthesize(text, syn_config=None):
+            chunk = mocker.MagicMock()
+            chunk.audio_int16_array = np.full(len(text), 7, dtype=np.int16)
+            return [chunk]
+
+        mocker.patch("piper.PiperVoice.load")
+        cache = AudioCache()
+        engine = PiperTTSEngine(voices_dir=temp_voices_dir, cache=cache)
+        engine.load_voice("en_US-test-medium")
+        synth = mocker.patch.object(engine._voice, "synthesize", side_effect=mock_synthesize)
+
+        first = list(engine.synthesize_stream("Hello there. Boilerplate footer."))
+        second = list(engine.synthesize_stream("Something new. Boilerplate footer."))
+
+        texts = [call.args[0] for call in synth.call_args_list]
+        assert texts == ["Hello there.", "Boilerplate footer.", "Something new."]
+        assert np.array_equal(first[1], second[1])
+        assert cache.stats().memory_hits == 1
+
+    def test_switching_back_reuses_pooled_voice(self, temp_voices_dir, mock_voice_file, mocker):
+        """Should not reload a recently used voice"""
+        import shutil
+
+        shutil.copy(mock_voice_file, temp_voices_dir / "en_US-other-low.onnx")
+        mock_load = mocker.patch("piper.PiperVoice.load", side_effect=lambda path: object())
+        engine = PiperTTSEngine(voices_dir=temp_voices_dir)
+
+        engine.load_voice("en_US-test-medium")
+        first = engine._voice
+        engine.load_voice("en_US-other-low")
+        engine.load_voice("en_US-test-medium")
+
+        assert engine._voice is first
+        assert mock_load.call_count == 2
+        assert set(engine.voice_pool.resident_sizes()) == {"en_US-test-medium", "en_US-other-low"}
+
+    def test_voice_switch_mid_read_keeps_cache_keys_apart(
+        self, temp_voices_dir, mock_voice_file, mocker
+    ):
+        """Should cache a read's audio under the voice it started with"""
+        import shutil
+
+        import numpy as np
+
+        from src.audio_cache import AudioCache
+
+        def load(path):
+            # Audio samples identify the voice that synthesized them
+            marker = 2 if "other" in str(path) else 1
+            voice = mocker.MagicMock()
+            chunk = mocker.MagicMock()
+            chunk.audio_int16_array = np.full(4, marker, dtype=np.int16)
+            voice.synthesize.return_value = [chunk]
+            return voice
+
+        shutil.copy(mock_voice_file, temp_voices_dir / "en_US-other-low.onnx")
+        mocker.patch("piper.PiperVoice.load", side_effect=load)
+        engine = PiperTTSEngine(voices_dir=temp_voices_dir, cache=AudioCache())
+        engine.load_voice("en_US-test-medium")
+
+        reading = engine.synthesize_sentences(["One.", "Two."])
+        assert next(reading)[0] == 1
+        engine.load_voice("en_US-other-low")
+        assert next(reading)[0] == 1
+
+        audio, _ = engine.synthesize("Two.")
+        assert audio[0] == 2
+
+    def test_switching_voice_during_multi_worker_read(
+        self, temp_voices_dir, mock_voice_file, mocker
+    ):
+        """Should finish reads on the old voice's workers, then stop them"""
+        import functools
+        import shutil
+
+        import numpy as np
+
+        from src.synthesis_pool import SynthesisPool
+
+        def load(path):
+            # Audio samples identify the voice that synthesized them
+            marker = 2 if "other" in str(path) else 1
+            voice = mocker.MagicMock()
+            chunk = mocker.MagicMock()
+            chunk.audio_int16_array = np.full(4, marker, dtype=np.int16)
+            voice.synthesize.return_value = [chunk]
+            return voice
+
+        shutil.copy(mock_voice_file, temp_voices_dir / "en_US-other-low.onnx")
+        mocker.patch("piper.PiperVoice.load", side_effect=load)
+        pool_class = mocker.patch(
+            "src.tts_engine.SynthesisPool",
+            side_effect=functools.partial(SynthesisPool, mp_context="fork"),
+        )
+        engine = PiperTTSEngine(voices_dir=temp_voices_dir, workers=2)
+        engine.load_voice("en_US-test-medium")
+
+        try:
+            old_pool = engine._pool
+            started = engine.synthesize_sentences(f"Sentence {i}." for i in range(10))
+            waiting = engine.synthesize_sentences(["Not started yet."])
+            first = next(started)
+            engine.load_voice("en_US-other-low")
+            rest = list(started)
+
+            assert [audio[0] for audio in [first, *rest]] == [1] * 10
+            assert list(waiting)[0][0] == 1
+            assert list(engine.synthesize_sentences(["After the switch."]))[0][0] == 2
+
+            # Only the current voice keeps workers once the old reads are done
+            del started, waiting
+            assert old_pool._stopped
+            assert pool_class.call_count == 2
+        finally:
+            engine.close()
+
+    def test_warm_up_bypasses_cache(self, temp_voices_dir, mock_voice_file, mocker):
+        """Should run a real synthesis without storing it in the cache"""
+        import numpy as np
+
+        from src.audio_cache import AudioCache
+
+        mock_chunk = mocker.MagicMock()
+        mock_chunk.audio_int16_array = np.zeros(10, dtype=np.int16)
+
+        mocker.patch("piper.PiperVoice.load")
+        cache = AudioCache()
+        engine = PiperTTSEngine(voices_dir=temp_voices_dir, cache=cache)
+        engine.load_voice("en_US-test-medium")
+        synth = mocker.patch.object(engine._voice, "synthesize", return_value=[mock_chunk])
+
+        elapsed = engine.warm_up()
+
+        assert elapsed >= 0
+        assert synth.call_count == 1
+        assert synth.call_args.args == ("Hello.",)
+        assert cache.stats().memory_bytes == 0
+
+    def test_load_voice_uses_config_sample_rate(self, temp_voices_dir, mock_voice_file, mocker):
+        """Should report the sample rate from the voice's audio config"""
+        import json
+
+        config_path = temp_voices_dir / "en_US-test-medium.onnx.json"
+        config_path.write_text(json.dumps({"audio": {"sample_rate": 16000}}))
+        mocker.patch("piper.PiperVoice.load")
+
+        engine = PiperTTSEngine(voices_dir=temp_voices_dir)
+        engine.load_voice("en_US-test-medium")
+
+        assert engine.sample_rate == 16000
+
+    def test_warm_up_without_voice_raises(self, temp_voices_dir):
+        """Should raise TTSError when no voice is loaded"""
+        engine = PiperTTSEngine(voices_dir=temp_voices_dir)
+
+        with pytest.raises(TTSError, match="No voice loaded"):
+            engine.warm_up()
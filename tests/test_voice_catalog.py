@@ -0,0 +1,92 @@
+"""Tests for VoiceCatalog"""
+
+import json
+import os
+
+import pytest
+
+from src.voice_catalog import VoiceCatalog
+
+
+def write_voice(voices_dir, name, sample_rate=22050, **config):
+    """Create a voice model and its config"""
+    (voices_dir / f"{name}.onnx").write_bytes(b"model")
+    config = {"audio": {"sample_rate": sample_rate}, **config}
+    (voices_dir / f"{name}.onnx.json").write_text(json.dumps(config))
+
+
+class TestVoiceCatalog:
+    def test_indexes_voice_metadata(self, temp_voices_dir):
+        """Should read sample rate, language, quality and size from each voice"""
+        write_voice(
+            temp_voices_dir,
+            "en_GB-alba-low",
+            sample_rate=16000,
+            language={"code": "en_GB"},
+            inference={"length_scale": 1.2},
+        )
+
+        info = VoiceCatalog(temp_voices_dir).get("en_GB-alba-low")
+
+        assert info.sample_rate == 16000
+        assert info.language == "en_GB"
+        assert info.quality == "low"
+        assert info.size == len(b"model")
+        assert info.length_scale == 1.2
+
+    def test_reuses_saved_index_without_reading_configs(self, temp_voices_dir, tmp_path, mocker):
+        """Should answer from the saved index when nothing changed"""
+        write_voice(temp_voices_dir, "en_US-test-medium")
+        index_path = tmp_path / "voices.json"
+        VoiceCatalog(temp_voices_dir, index_path=index_path)
+
+        scan = mocker.patch.object(VoiceCatalog, "_scan")
+        catalog = VoiceCatalog(temp_voices_dir, index_path=index_path)
+
+        scan.assert_not_called()
+        assert catalog.names() == ["en_US-test-medium"]
+
+    def test_refresh_picks_up_added_and_removed_voices(self, temp_voices_dir):
+        """Should track voices added to and removed from the directory"""
+        write_voice(temp_voices_dir, "en_US-a-low")
+        catalog = VoiceCatalog(temp_voices_dir)
+
+        write_voice(temp_voices_dir, "en_US-b-low")
+        (temp_voices_dir / "en_US-a-low.onnx").unlink()
+        os.utime(temp_voices_dir, ns=(0, 1))
+
+        assert catalog.refresh() is True
+        assert catalog.names() == ["en_US-b-low"]
+
+    def test_refresh_rereads_only_changed_voices(self, temp_voices_dir, mocker):
+        """Should re-read a voice only when its files' mtimes change"""
+        write_voice(temp_voices_dir, "en_US-a-low")
+        write_voice(temp_voices_dir, "en_US-b-low")
+        catalog = VoiceCatalog(temp_voices_dir)
+        read = mocker.spy(catalog, "_read_voice")
+
+        write_voice(temp_voices_dir, "en_US-a-low", sample_rate=16000)
+        os.utime(temp_voices_dir / "en_US-a-low.onnx.json", ns=(0, 1))
+
+        assert catalog.refresh(force=True) is True
+        assert [call.args[0] for call in read.call_args_list] == ["en_US-a-low"]
+        assert catalog.get("en_US-a-low").sample_rate == 16000
+
+    def test_missing_directory_is_empty(self, tmp_path):
+        """Should return no voices when the directory doesn't exist"""
+        catalog = VoiceCatalog(tmp_path / "missing")
+
+        assert catalog.names() == []
+        assert catalog.refresh() is False
+
+    @pytest.mark.parametrize("contents", ["not json", '{"version": 0}'])
+    def test_ignores_unusable_index(self, temp_voices_dir, tmp_path, contents):
+        """Should rescan when the saved index is corrupt or outdated"""
+        write_voice(temp_voices_dir, "en_US-test-medium")
+        index_path = tmp_path / "voices.json"
+        index_path.write_text(contents)
+
+        catalog = VoiceCatalog(temp_voices_dir, index_path=index_path)
+
+        assert catalog.names() == ["en_US-test-medium"]
+        assert json.loads(index_path.read_text())["voices"][0]["name"] == "en_US-test-medium"
@@ -0,0 +1,89 @@
+"""Tests for VoicePool"""
+
+import threading
+
+import pytest
+
+from src.voice_pool import VoicePool
+
+
+class TestVoicePool:
+    @pytest.fixture
+    def voices_dir(self, temp_voices_dir):
+        """Voices directory with three models of different sizes"""
+        for name, size in (("a", 100), ("b", 200), ("c", 300)):
+            (temp_voices_dir / f"{name}.onnx").write_bytes(b"x" * size)
+        return temp_voices_dir
+
+    @pytest.fixture
+    def mock_load(self, mocker):
+        """Patch model loading to return a distinct object per call"""
+        return mocker.patch("piper.PiperVoice.load", side_effect=lambda path: object())
+
+    def test_get_loads_once(self, voices_dir, mock_load):
+        """Should reuse a loaded voice instead of loading it again"""
+        pool = VoicePool(voices_dir)
+
+        first = pool.get("a")
+        second = pool.get("a")
+
+        assert first.voice is second.voice
+        mock_load.assert_called_once()
+
+    def test_queries_do_not_wait_for_a_load(self, voices_dir, mocker):
+        """Should answer other calls while a voice loads, and load it only once"""
+        release = threading.Event()
+        mock_load = mocker.patch(
+            "piper.PiperVoice.load", side_effect=lambda path: release.wait(2) and object()
+        )
+        pool = VoicePool(voices_dir)
+        results = []
+        loaders = [threading.Thread(target=lambda: results.append(pool.get("a"))) for _ in range(2)]
+        for loader in loaders:
+            loader.start()
+
+        assert pool.loaded() == []
+        assert "a" not in pool
+        release.set()
+        for loader in loaders:
+            loader.join(timeout=2)
+
+        assert results[0] is results[1]
+        mock_load.assert_called_once()
+        assert pool.loaded() == ["a"]
+
+    def test_evicts_least_recently_used_over_count(self, voices_dir, mock_load):
+        """Should keep at most max_voices loaded"""
+        pool = VoicePool(voices_dir, max_voices=2)
+        pool.get("a")
+        pool.get("b")
+        pool.get("a")
+        pool.get("c")
+
+        assert pool.loaded() == ["a", "c"]
+
+    def test_evicts_to_memory_budget(self, voices_dir, mock_load):
+        """Should evict voices until within the memory budget"""
+        pool = VoicePool(voices_dir, max_voices=3, memory_budget=450)
+        pool.get("a")
+        pool.get("b")
+        pool.get("c")
+
+        assert pool.loaded() == ["c"]
+        assert pool.resident_bytes == 300
+
+    def test_reports_resident_sizes(self, voices_dir, mock_load):
+        """Should report each loaded model's resident size"""
+        pool = VoicePool(voices_dir)
+        pool.get("a")
+        pool.get("c")
+
+        assert pool.resident_sizes() == {"a": 100, "c": 300}
+        assert pool.resident_bytes == 400
+
+    def test_missing_voice_raises(self, voices_dir, mock_load):
+        """Should raise FileNotFoundError for unknown voices"""
+        pool = VoicePool(voices_dir)
+
+        with pytest.raises(FileNotFoundError):
+            pool.get("missing")